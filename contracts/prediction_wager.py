@@ -25,6 +25,12 @@ except Exception:
     class u32(int):
         pass
 
+    class u64(int):
+        pass
+
+    class u8(int):
+        pass
+
     class Address(str):
         pass
 
@@ -96,10 +102,19 @@ except Exception:
         return fn()
 
 
+# A classification of the same (prediction, criteria, url, appeal reason) is
+# reused by other wagers for this many seconds of block time; at most
+# CLASSIFICATION_CACHE_MAX entries are kept.
+CLASSIFICATION_TTL_SECONDS = 600
+CLASSIFICATION_CACHE_MAX = 256
 MIN_QUORUM = u32(3)
 APPEAL_QUORUM = u32(50)
 ZERO_ADDRESS = Address("0x0000000000000000000000000000000000000000")
 ALLOW_DEV_DEADLINES = True
+MAX_BATCH = 100
+# Wager status and stance are stored as their index in these tuples.
+WAGER_STATUSES = ("waiting", "active", "verified", "resolved")
+STANCES = ("", "agree", "disagree")
 
 
 @allow_storage
@@ -115,22 +130,47 @@ class VerificationResult:
 @allow_storage
 @dataclass
 class Wager:
-    id: str
+    # Compact record: the id is the storage key, created_at/resolved_at are
+    # epoch seconds (resolved_at 0 = open), status/stances index
+    # WAGER_STATUSES / STANCES, and the verification lives in
+    # ``verifications`` once it exists. The deadline keeps the submitted text.
     prediction: str
     player_a: Address
     player_b: Address
-    player_a_stance: str
-    player_b_stance: str
     stake_amount: u256
+    pot: u256
     deadline: str
+    created_at: u64
+    resolved_at: u64
+    status: u8
+    player_a_stance: u8
+    player_b_stance: u8
     category: str
     verification_criteria: str
+
+
+@allow_storage
+@dataclass
+class ChangeEntry:
+    wager_id: str
     status: str
-    pot: u256
-    has_verification: bool
-    verification: VerificationResult
-    created_at: str
-    resolved_at: str
+    at: str
+
+
+@allow_storage
+@dataclass
+class PoolTotals:
+    agree: u256
+    disagree: u256
+    members: u256
+
+
+@allow_storage
+@dataclass
+class ClassificationEntry:
+    result: str
+    at: str
+    seq: u256
 
 
 @allow_storage
@@ -149,10 +189,39 @@ class PlayerStats:
 class PredictionWager(gl.Contract):
     """Prediction Wager contract with escrow + equivalence-principle verification."""
 
-    wagers: TreeMap[str, Wager]
-    wager_index: TreeMap[u256, str]
+    # Wagers by number: public id "wager_<n>" is stored under n.
+    wagers: TreeMap[u256, Wager]
+    verifications: TreeMap[u256, VerificationResult]
     player_stats: TreeMap[Address, PlayerStats]
     player_index: TreeMap[u256, Address]
+    # Players in leaderboard order (rank -> address) and the inverse map.
+    leaderboard: TreeMap[u256, Address]
+    leaderboard_rank: TreeMap[Address, u256]
+    # Secondary indexes: "<bucket>#<slot>" -> wager id, with a count per bucket.
+    player_wager_count: TreeMap[str, u256]
+    player_wager_index: TreeMap[str, str]
+    status_wager_count: TreeMap[str, u256]
+    status_wager_index: TreeMap[str, str]
+    wager_status_slot: TreeMap[str, u256]
+    category_wager_count: TreeMap[str, u256]
+    category_wager_index: TreeMap[str, str]
+    # Pooled wagers: per-side totals by wager id, positions by
+    # "<wager>#<address>" and members by "<wager>#<slot>".
+    pools: TreeMap[str, PoolTotals]
+    pool_stakes: TreeMap[str, u256]
+    pool_sides: TreeMap[str, str]
+    pool_members: TreeMap[str, str]
+    # Append-only log of wager transitions (seq -> entry).
+    change_log: TreeMap[u256, ChangeEntry]
+    change_count: u256
+    # Payout mechanism found on first use ("" = not detected yet).
+    payout_transport: str
+    # Recent "<outcome>|<digest>" classifications by question hash.
+    classification_cache: TreeMap[str, ClassificationEntry]
+    # Cache keys in write order (seq -> key), for age/size eviction.
+    classification_order: TreeMap[u256, str]
+    classification_head: u256
+    classification_tail: u256
     wager_counter: u256
     player_count: u256
     last_wager_id: str
@@ -163,9 +232,29 @@ class PredictionWager(gl.Contract):
     def __init__(self):
         if IS_DEV_FALLBACK:
             self.wagers = TreeMap()
-            self.wager_index = TreeMap()
+            self.verifications = TreeMap()
             self.player_stats = TreeMap()
             self.player_index = TreeMap()
+            self.leaderboard = TreeMap()
+            self.leaderboard_rank = TreeMap()
+            self.player_wager_count = TreeMap()
+            self.player_wager_index = TreeMap()
+            self.status_wager_count = TreeMap()
+            self.status_wager_index = TreeMap()
+            self.wager_status_slot = TreeMap()
+            self.category_wager_count = TreeMap()
+            self.category_wager_index = TreeMap()
+            self.change_log = TreeMap()
+            self.pools = TreeMap()
+            self.pool_stakes = TreeMap()
+            self.pool_sides = TreeMap()
+            self.pool_members = TreeMap()
+            self.classification_cache = TreeMap()
+            self.classification_order = TreeMap()
+        self.change_count = u256(0)
+        self.classification_head = u256(0)
+        self.classification_tail = u256(0)
+        self.payout_transport = ""
         self.wager_counter = u256(0)
         self.player_count = u256(0)
         self.last_wager_id = ""
@@ -185,10 +274,51 @@ class PredictionWager(gl.Contract):
         dt = datetime.datetime.fromisoformat(deadline)
         return dt.replace(tzinfo=None)
 
-    def _new_verification(self) -> VerificationResult:
-        return gl.storage.inmem_allocate(
-            VerificationResult, "", 0.0, "", u32(0), False
-        )
+    def _epoch(self, dt: datetime.datetime) -> int:
+        return int(dt.replace(tzinfo=datetime.timezone.utc).timestamp())
+
+    def _iso(self, epoch: u64) -> str:
+        dt = datetime.datetime.fromtimestamp(int(epoch), datetime.timezone.utc)
+        return dt.replace(tzinfo=None).isoformat()
+
+    def _now_epoch(self) -> int:
+        return self._epoch(self._now_dt())
+
+    def _wager_id(self, key: u256) -> str:
+        return f"wager_{int(key)}"
+
+    def _wager_key(self, wager_id: str) -> Optional[u256]:
+        """Storage key for ``wager_id``, or None if unknown. Accepts the
+        canonical "wager_<n>" and ids minted before the compact layout,
+        "wager_<iso datetime>_<n>"."""
+        parts = str(wager_id).split("_")
+        if parts[0] != "wager" or len(parts) not in (2, 3):
+            return None
+        if len(parts) == 3:
+            if "T" not in parts[1]:
+                return None
+            try:
+                datetime.datetime.fromisoformat(parts[1])
+            except ValueError:
+                return None
+        num = parts[-1]
+        if not (num.isascii() and num.isdigit()) or num.startswith("0"):
+            return None
+        key = u256(int(num))
+        return key if key in self.wagers else None
+
+    def _lookup(self, wager_id: str):
+        """``(canonical id, storage key)`` of an existing wager."""
+        key = self._wager_key(wager_id)
+        if key is None:
+            raise Exception("Wager not found")
+        return self._wager_id(key), key
+
+    def _status(self, w: Wager) -> str:
+        return WAGER_STATUSES[int(w.status)]
+
+    def _verification(self, key: u256) -> Optional[VerificationResult]:
+        return self.verifications[key] if key in self.verifications else None
 
     def _new_player_stats(self) -> PlayerStats:
         return gl.storage.inmem_allocate(
@@ -199,11 +329,90 @@ class PredictionWager(gl.Contract):
         if addr not in self.player_stats:
             self.player_stats[addr] = self._new_player_stats()
             self.player_index[self.player_count] = addr
+            self.leaderboard[self.player_count] = addr
+            self.leaderboard_rank[addr] = self.player_count
             self.player_count = u256(self.player_count + u256(1))
+            self._rerank(addr)
+
+    def _rank_key(self, addr: Address):
+        s = self.player_stats[addr]
+        return (-int(s.wins), -int(s.volume_won), -int(s.volume_contributed), str(addr))
+
+    def _rerank(self, addr: Address):
+        """Restore leaderboard order after ``addr``'s stats improved.
+
+        Wins and volumes only ever grow, so a player can only move up; this is
+        one insertion-sort pass costing as many reads as places gained.
+        """
+        pos = int(self.leaderboard_rank[addr])
+        key = self._rank_key(addr)
+        while pos > 0:
+            prev = self.leaderboard[u256(pos - 1)]
+            if self._rank_key(prev) <= key:
+                break
+            self.leaderboard[u256(pos)] = prev
+            self.leaderboard_rank[prev] = u256(pos)
+            pos -= 1
+        self.leaderboard[u256(pos)] = addr
+        self.leaderboard_rank[addr] = u256(pos)
+
+    def _index_key(self, bucket: str, slot: int) -> str:
+        return f"{bucket}#{int(slot)}"
+
+    def _index_push(self, counts: TreeMap[str, u256], entries: TreeMap[str, str], bucket: str, wager_id: str) -> u256:
+        slot = counts[bucket] if bucket in counts else u256(0)
+        entries[self._index_key(bucket, slot)] = wager_id
+        counts[bucket] = u256(slot + u256(1))
+        return slot
+
+    def _index_page(self, counts: TreeMap[str, u256], entries: TreeMap[str, str], bucket: str, offset: int, limit: int):
+        if offset < 0 or limit < 0:
+            raise Exception("Invalid pagination")
+        # Every caller returns full wager views, so pages are capped like batches.
+        self._check_batch(limit)
+        total = int(counts[bucket]) if bucket in counts else 0
+        result = []
+        i = offset
+        while i < total and i < offset + limit:
+            key = self._index_key(bucket, i)
+            if key in entries:
+                result.append(entries[key])
+            i += 1
+        return result
+
+    def _index_player(self, addr: Address, wager_id: str):
+        self._index_push(self.player_wager_count, self.player_wager_index, str(addr), wager_id)
+
+    def _set_status(self, wager_id: str, w: Wager, status: str):
+        """Move ``w`` to ``status``, keep the status index in step (swap-remove, O(1))
+        and append the transition to the change log."""
+        old = self._status(w)
+        if wager_id in self.wager_status_slot and old == status:
+            self._log_change(wager_id, status)
+            return
+        if wager_id in self.wager_status_slot:
+            slot = self.wager_status_slot[wager_id]
+            last = u256(self.status_wager_count[old] - u256(1))
+            if slot != last:
+                moved = self.status_wager_index[self._index_key(old, last)]
+                self.status_wager_index[self._index_key(old, slot)] = moved
+                self.wager_status_slot[moved] = slot
+            del self.status_wager_index[self._index_key(old, last)]
+            self.status_wager_count[old] = last
+        self.wager_status_slot[wager_id] = self._index_push(
+            self.status_wager_count, self.status_wager_index, status, wager_id
+        )
+        w.status = u8(WAGER_STATUSES.index(status))
+        self._log_change(wager_id, status)
+
+    def _log_change(self, wager_id: str, status: str):
+        self.change_log[self.change_count] = gl.storage.inmem_allocate(
+            ChangeEntry, wager_id, status, self._now_iso()
+        )
+        self.change_count = u256(self.change_count + u256(1))
 
     def _new_wager(
         self,
-        wager_id: str,
         prediction: str,
         player_a: Address,
         stake_amount: int,
@@ -214,29 +423,21 @@ class PredictionWager(gl.Contract):
         stake_u = u256(stake_amount)
         return gl.storage.inmem_allocate(
             Wager,
-            wager_id,
             prediction,
             player_a,
             ZERO_ADDRESS,
-            "agree",
-            "",
+            stake_u,
             stake_u,
             deadline,
+            u64(self._now_epoch()),
+            u64(0),
+            u8(0),
+            u8(STANCES.index("agree")),
+            u8(0),
             category,
             verification_criteria,
-            "waiting",
-            stake_u,
-            False,
-            self._new_verification(),
-            self._now_iso(),
-            "",
         )
 
-    def _get_wager(self, wager_id: str) -> Wager:
-        if wager_id not in self.wagers:
-            raise Exception("Wager not found")
-        return self.wagers[wager_id]
-
     def _strict_eq(self, fn):
         # Compatibility across GenLayer SDK versions
         if hasattr(gl, "eq_principle"):
@@ -280,16 +481,70 @@ class PredictionWager(gl.Contract):
 
         return self._strict_eq(_classify)
 
+    def _classification_key(
+        self, prediction: str, verification_criteria: str, url: str, appeal: bool, appeal_reason: str
+    ) -> str:
+        # An appeal with new reasoning is a new question.
+        texts = (prediction, verification_criteria, appeal_reason if appeal else "")
+        parts = [" ".join(t.lower().split()) for t in texts]
+        raw = "\x1f".join([*parts, url.strip(), "appeal" if appeal else "verify"])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _evict_classifications(self, now: datetime.datetime):
+        """Drop entries past the TTL or beyond CLASSIFICATION_CACHE_MAX,
+        oldest first; keys rewritten since are skipped by their seq."""
+        while self.classification_head < self.classification_tail:
+            head = self.classification_head
+            key = self.classification_order[head]
+            if key in self.classification_cache and self.classification_cache[key].seq == head:
+                at = datetime.datetime.fromisoformat(self.classification_cache[key].at).replace(tzinfo=None)
+                full = int(self.classification_tail - head) > CLASSIFICATION_CACHE_MAX
+                if not full and (now - at).total_seconds() <= CLASSIFICATION_TTL_SECONDS:
+                    return
+                del self.classification_cache[key]
+            del self.classification_order[head]
+            self.classification_head = u256(head + u256(1))
+
+    def _classify_cached(
+        self,
+        prediction: str,
+        verification_criteria: str,
+        evidence_url: str,
+        appeal_reason: str,
+        appeal: bool,
+    ) -> str:
+        # Reuse a fresh result for the same question instead of another
+        # web fetch + LLM round; the lookup is deterministic storage access.
+        key = self._classification_key(prediction, verification_criteria, evidence_url, appeal, appeal_reason)
+        now = self._now_dt()
+        if key in self.classification_cache:
+            entry = self.classification_cache[key]
+            age = (now - datetime.datetime.fromisoformat(entry.at).replace(tzinfo=None)).total_seconds()
+            if 0 <= age <= CLASSIFICATION_TTL_SECONDS:
+                return entry.result
+        result = self._classify_outcome(
+            prediction=prediction,
+            verification_criteria=verification_criteria,
+            evidence_url=evidence_url,
+            appeal_reason=appeal_reason,
+        )
+        seq = self.classification_tail
+        self.classification_cache[key] = gl.storage.inmem_allocate(ClassificationEntry, result, self._now_iso(), seq)
+        self.classification_order[seq] = key
+        self.classification_tail = u256(seq + u256(1))
+        self._evict_classifications(now)
+        return result
+
     # ---- public API ----
-    @gl.public.write.payable
-    def create_wager(
+    def _open_wager(
         self,
         prediction: str,
         stake_amount: int,
         deadline: str,
         category: Optional[str],
         verification_criteria: str,
-    ):
+        status: str,
+    ) -> tuple[str, Wager]:
         # Studio/Dev fallback: allow zero-value calls and treat stake_amount as escrowed value.
         # In production, require a real payment.
         if gl.message.value == u256(0) and stake_amount <= 0:
@@ -303,9 +558,8 @@ class PredictionWager(gl.Contract):
             raise Exception("Deadline must be in the future")
 
         self.wager_counter = u256(self.wager_counter + u256(1))
-        wager_id = f"wager_{self._now_iso()}_{self.wager_counter}"
+        wager_id = self._wager_id(self.wager_counter)
         wager = self._new_wager(
-            wager_id=wager_id,
             prediction=prediction,
             player_a=gl.message.sender_address,
             stake_amount=int(gl.message.value if gl.message.value != u256(0) else stake_u),
@@ -313,8 +567,10 @@ class PredictionWager(gl.Contract):
             category=category or "",
             verification_criteria=verification_criteria,
         )
-        self.wagers[wager_id] = wager
-        self.wager_index[u256(self.wager_counter - u256(1))] = wager_id
+        self._set_status(wager_id, wager, status)
+        self.wagers[self.wager_counter] = wager
+        self._index_player(wager.player_a, wager_id)
+        self._index_push(self.category_wager_count, self.category_wager_index, wager.category, wager_id)
         self.last_wager_id = wager_id
         self.total_wagers_created = u256(self.total_wagers_created + u256(1))
         self.total_volume = u256(self.total_volume + wager.stake_amount)
@@ -325,29 +581,125 @@ class PredictionWager(gl.Contract):
         stats.volume_contributed = u256(stats.volume_contributed + wager.stake_amount)
         stats.last_updated = self._now_iso()
         self.player_stats[wager.player_a] = stats
+        self._rerank(wager.player_a)
+        return wager_id, wager
+
+    @gl.public.write.payable
+    def create_wager(
+        self,
+        prediction: str,
+        stake_amount: int,
+        deadline: str,
+        category: Optional[str],
+        verification_criteria: str,
+    ):
+        self._open_wager(prediction, stake_amount, deadline, category, verification_criteria, "waiting")
+
+    def _normalize_stance(self, stance: Optional[str], default: str) -> str:
+        normalized = (stance or default).strip().lower()
+        if normalized not in ("agree", "disagree"):
+            raise Exception("Stance must be 'agree' or 'disagree'")
+        return normalized
+
+    def _pool_key(self, wager_id: str, addr: Address) -> str:
+        return f"{wager_id}#{str(addr).lower()}"
+
+    def _pool_add(self, wager_id: str, addr: Address, stance: str, amount: u256) -> bool:
+        """Add ``amount`` to ``addr``'s position; True if ``addr`` is a new member. O(1)."""
+        key = self._pool_key(wager_id, addr)
+        is_new = key not in self.pool_sides
+        if not is_new and self.pool_sides[key] != stance:
+            raise Exception("Already joined the other side of this pool")
+        totals = self.pools[wager_id]
+        if is_new:
+            self.pool_sides[key] = stance
+            self.pool_stakes[key] = amount
+            self.pool_members[self._index_key(wager_id, totals.members)] = str(addr)
+            totals.members = u256(totals.members + u256(1))
+        else:
+            self.pool_stakes[key] = u256(self.pool_stakes[key] + amount)
+        if stance == "agree":
+            totals.agree = u256(totals.agree + amount)
+        else:
+            totals.disagree = u256(totals.disagree + amount)
+        self.pools[wager_id] = totals
+        return is_new
+
+    @gl.public.write.payable
+    def create_pool(
+        self,
+        prediction: str,
+        stake_amount: int,
+        deadline: str,
+        category: Optional[str],
+        verification_criteria: str,
+        stance: Optional[str] = None,
+    ):
+        """Open a pooled wager: any number of players join either side until
+        verification, and one verification settles everyone pro-rata."""
+        normalized = self._normalize_stance(stance, "agree")
+        wager_id, w = self._open_wager(prediction, stake_amount, deadline, category, verification_criteria, "active")
+        w.player_a_stance = u8(STANCES.index(normalized))
+        self.wagers[self.wager_counter] = w
+        self.pools[wager_id] = gl.storage.inmem_allocate(PoolTotals, u256(0), u256(0), u256(0))
+        self._pool_add(wager_id, w.player_a, normalized, w.stake_amount)
+
+    @gl.public.write.payable
+    def join_pool(self, wager_id: str, stance: Optional[str] = None, stake_amount: int = 0):
+        wager_id, key = self._lookup(wager_id)
+        w = self.wagers[key]
+        if wager_id not in self.pools:
+            raise Exception("Wager is not a pool")
+        if self._status(w) != "active" or key in self.verifications:
+            raise Exception("Pool is closed")
+        if not ALLOW_DEV_DEADLINES and self._now_dt() >= self._deadline_dt(w.deadline):
+            raise Exception("Pool is closed")
+        normalized = self._normalize_stance(stance, "disagree")
+        # Studio/Dev fallback: allow zero-value calls and treat stake_amount as escrowed value.
+        amount = gl.message.value if gl.message.value != u256(0) else u256(stake_amount)
+        if amount <= u256(0):
+            raise Exception("Stake payment is required")
+
+        addr = gl.message.sender_address
+        is_new = self._pool_add(wager_id, addr, normalized, amount)
+        w.pot = u256(w.pot + amount)
+        self.wagers[key] = w
+        # Joins do not change the status; log them so followers refetch the pot.
+        self._log_change(wager_id, self._status(w))
+        self.total_volume = u256(self.total_volume + amount)
+
+        self._touch_player(addr)
+        stats = self.player_stats[addr]
+        if is_new and addr != w.player_a:
+            self._index_player(addr, wager_id)
+            stats.wagers_joined = u256(stats.wagers_joined + u256(1))
+        stats.volume_contributed = u256(stats.volume_contributed + amount)
+        stats.last_updated = self._now_iso()
+        self.player_stats[addr] = stats
+        self._rerank(addr)
 
     @gl.public.write.payable
     def accept_wager(self, wager_id: str, stance: Optional[str] = None):
-        w = self._get_wager(wager_id)
-        if w.status != "waiting":
+        wager_id, key = self._lookup(wager_id)
+        w = self.wagers[key]
+        if self._status(w) != "waiting":
             raise Exception("Wager is not available to accept")
         if gl.message.sender_address == w.player_a:
             raise Exception("Creator cannot accept their own wager")
-        normalized = (stance or "disagree").strip().lower()
-        if normalized not in ("agree", "disagree"):
-            raise Exception("Stance must be 'agree' or 'disagree'")
+        normalized = self._normalize_stance(stance, "disagree")
         # Studio/Dev fallback: allow zero-value calls and trust stored stake_amount.
         if gl.message.value != u256(0) and gl.message.value != w.stake_amount:
             raise Exception("Stake payment must match the original stake")
 
         w.player_b = gl.message.sender_address
-        w.player_b_stance = normalized
-        w.status = "active"
+        w.player_b_stance = u8(STANCES.index(normalized))
+        self._set_status(wager_id, w, "active")
+        self._index_player(w.player_b, wager_id)
         if gl.message.value == u256(0):
             w.pot = u256(w.pot + w.stake_amount)
         else:
             w.pot = u256(w.pot + gl.message.value)
-        self.wagers[wager_id] = w
+        self.wagers[key] = w
 
         self.total_volume = u256(self.total_volume + w.stake_amount)
         self._touch_player(w.player_b)
@@ -356,27 +708,30 @@ class PredictionWager(gl.Contract):
         stats.volume_contributed = u256(stats.volume_contributed + w.stake_amount)
         stats.last_updated = self._now_iso()
         self.player_stats[w.player_b] = stats
+        self._rerank(w.player_b)
 
     @gl.public.write
     def submit_verification(self, wager_id: str, evidence_url: Optional[str] = None):
-        w = self._get_wager(wager_id)
-        if w.status not in ("active", "verified"):
+        wager_id, key = self._lookup(wager_id)
+        w = self.wagers[key]
+        if self._status(w) not in ("active", "verified"):
             raise Exception("Wager is not active")
         if not ALLOW_DEV_DEADLINES and self._now_dt() < self._deadline_dt(w.deadline):
             raise Exception("Deadline has not been reached yet")
 
         mem_w = gl.storage.copy_to_memory(w)
         url = evidence_url or (mem_w.verification_criteria if mem_w.verification_criteria.startswith("http") else "")
-        result = self._classify_outcome(
+        result = self._classify_cached(
             prediction=mem_w.prediction,
             verification_criteria=mem_w.verification_criteria,
             evidence_url=url,
             appeal_reason="",
+            appeal=False,
         )
         outcome, digest = result.split("|", 1)
         evidence = f"url={url}; sha256={digest}" if url else f"criteria={mem_w.verification_criteria}"
 
-        w.verification = gl.storage.inmem_allocate(
+        self.verifications[key] = gl.storage.inmem_allocate(
             VerificationResult,
             outcome,
             0.85,
@@ -384,30 +739,31 @@ class PredictionWager(gl.Contract):
             MIN_QUORUM,
             False,
         )
-        w.has_verification = True
-        w.status = "verified"
-        self.wagers[wager_id] = w
+        self._set_status(wager_id, w, "verified")
+        self.wagers[key] = w
 
     @gl.public.write
     def submit_appeal(self, wager_id: str, appeal_reason: str, evidence_url: Optional[str] = None):
-        w = self._get_wager(wager_id)
-        if w.status != "verified":
+        wager_id, key = self._lookup(wager_id)
+        w = self.wagers[key]
+        if self._status(w) != "verified":
             raise Exception("Wager must be verified before appeal")
         if not ALLOW_DEV_DEADLINES and self._now_dt() < self._deadline_dt(w.deadline):
             raise Exception("Deadline has not been reached yet")
 
         mem_w = gl.storage.copy_to_memory(w)
         url = evidence_url or (mem_w.verification_criteria if mem_w.verification_criteria.startswith("http") else "")
-        result = self._classify_outcome(
+        result = self._classify_cached(
             prediction=mem_w.prediction,
             verification_criteria=mem_w.verification_criteria,
             evidence_url=url,
             appeal_reason=appeal_reason,
+            appeal=True,
         )
         outcome, digest = result.split("|", 1)
         evidence = f"url={url}; sha256={digest}" if url else f"criteria={mem_w.verification_criteria}"
 
-        w.verification = gl.storage.inmem_allocate(
+        self.verifications[key] = gl.storage.inmem_allocate(
             VerificationResult,
             outcome,
             0.95,
@@ -415,45 +771,47 @@ class PredictionWager(gl.Contract):
             APPEAL_QUORUM,
             True,
         )
-        w.has_verification = True
-        w.status = "verified"
-        self.wagers[wager_id] = w
+        self._set_status(wager_id, w, "verified")
+        self.wagers[key] = w
 
-    @gl.public.write
-    def resolve_wager(self, wager_id: str):
-        w = self._get_wager(wager_id)
-        if w.status == "resolved":
+    def _check_resolvable(self, key: u256, w: Wager):
+        if self._status(w) == "resolved":
             raise Exception("Wager already resolved")
-        if not w.has_verification:
+        v = self._verification(key)
+        if v is None:
             raise Exception("No verification submitted")
-        if not w.verification.is_final:
+        if not v.is_final:
             raise Exception("Verification is not final; submit an appeal to finalize")
-
-        outcome = w.verification.outcome
-        if outcome not in ("YES", "NO"):
+        if v.outcome not in ("YES", "NO"):
             raise Exception("Invalid verification outcome")
 
+    def _settle(self, wager_id: str, key: u256, w: Wager, deltas: dict, payments: dict):
+        """Mark ``w`` resolved and add its stat changes and payouts to the
+        per-address ``deltas`` ([wins, losses, volume_won]) and ``payments``."""
+        self._set_status(wager_id, w, "resolved")
+        w.resolved_at = u64(self._now_epoch())
+        self.wagers[key] = w
+        self.total_wagers_resolved = u256(self.total_wagers_resolved + u256(1))
+        outcome = self.verifications[key].outcome
+        if wager_id in self.pools:
+            self._settle_pool(wager_id, w, outcome, deltas, payments)
+            return
+
         supporters = []
         opposers = []
         if w.player_a != ZERO_ADDRESS:
-            if w.player_a_stance == "disagree":
+            if STANCES[int(w.player_a_stance)] == "disagree":
                 opposers.append(w.player_a)
             else:
                 supporters.append(w.player_a)
-        if w.player_b != ZERO_ADDRESS and w.player_b_stance:
-            if w.player_b_stance == "disagree":
+        if w.player_b != ZERO_ADDRESS and int(w.player_b_stance):
+            if STANCES[int(w.player_b_stance)] == "disagree":
                 opposers.append(w.player_b)
             else:
                 supporters.append(w.player_b)
 
         winners = supporters if outcome == "YES" else opposers
 
-        w.status = "resolved"
-        w.resolved_at = self._now_iso()
-        payout = w.pot
-        self.wagers[wager_id] = w
-        self.total_wagers_resolved = u256(self.total_wagers_resolved + u256(1))
-
         participants = []
         if w.player_a != ZERO_ADDRESS:
             participants.append(w.player_a)
@@ -473,95 +831,282 @@ class PredictionWager(gl.Contract):
                     payout_map[addr] = each + (remainder if idx == 0 else u256(0))
                     idx += 1
 
-        # Update winner/loser stats.
+        # Winner/loser stats; a refund (no winners) leaves stats untouched.
         if winners:
             for addr in participants:
-                self._touch_player(addr)
-                stats = self.player_stats[addr]
+                delta = deltas.setdefault(addr, [0, 0, 0])
                 if addr in winners:
-                    stats.wins = u256(stats.wins + u256(1))
-                    stats.volume_won = u256(stats.volume_won + payout_map.get(addr, u256(0)))
+                    delta[0] += 1
+                    delta[2] += int(payout_map.get(addr, u256(0)))
                 else:
-                    stats.losses = u256(stats.losses + u256(1))
-                stats.last_updated = self._now_iso()
-                self.player_stats[addr] = stats
-
-        # Transfer escrowed funds to the winner if the runtime supports it.
-        # Studio runtime does not expose ContractAt, so we guard calls.
-        def _pay(to_addr: Address, value: u256):
-            if value <= u256(0):
-                return
-            if hasattr(gl, "ContractAt"):
-                try:
-                    gl.ContractAt(to_addr).emit_transfer(value=value)
-                    return
-                except Exception:
-                    pass
-            if hasattr(gl, "transfer"):
-                try:
-                    gl.transfer(to=to_addr, value=value)
-                    return
-                except Exception:
-                    pass
-            if hasattr(gl, "emit_transfer"):
-                try:
-                    gl.emit_transfer(to=to_addr, value=value)
-                except Exception:
-                    pass
+                    delta[1] += 1
+
+        def _credit(addr: Address, value: u256):
+            payments[addr] = u256(payments.get(addr, u256(0)) + value)
 
         if not winners:
             if w.player_b != ZERO_ADDRESS:
                 half = u256(w.pot // u256(2))
-                _pay(w.player_a, half)
-                _pay(w.player_b, u256(w.pot - half))
+                _credit(w.player_a, half)
+                _credit(w.player_b, u256(w.pot - half))
             else:
-                _pay(w.player_a, w.pot)
+                _credit(w.player_a, w.pot)
         else:
             for addr in winners:
-                _pay(addr, payout_map.get(addr, u256(0)))
+                _credit(addr, payout_map.get(addr, u256(0)))
+
+    def _settle_pool(self, wager_id: str, w: Wager, outcome: str, deltas: dict, payments: dict):
+        """Pro-rata payout in one pass over the members: each winner gets
+        stake * pot // winning_total (rounding dust goes to the first
+        winner). With nobody on the winning side every stake is refunded."""
+        totals = self.pools[wager_id]
+        winning_side = "agree" if outcome == "YES" else "disagree"
+        winning_total = totals.agree if winning_side == "agree" else totals.disagree
+        paid = u256(0)
+        first_winner = None
+        for slot in range(int(totals.members)):
+            addr = Address(self.pool_members[self._index_key(wager_id, slot)])
+            key = self._pool_key(wager_id, addr)
+            stake = self.pool_stakes[key]
+            if winning_total == u256(0):
+                payments[addr] = u256(payments.get(addr, u256(0)) + stake)
+                continue
+            delta = deltas.setdefault(addr, [0, 0, 0])
+            if self.pool_sides[key] != winning_side:
+                delta[1] += 1
+                continue
+            share = u256(stake * w.pot // winning_total)
+            paid = u256(paid + share)
+            if first_winner is None:
+                first_winner = addr
+            delta[0] += 1
+            delta[2] += int(share)
+            payments[addr] = u256(payments.get(addr, u256(0)) + share)
+        if first_winner is not None and paid < w.pot:
+            dust = u256(w.pot - paid)
+            deltas[first_winner][2] += int(dust)
+            payments[first_winner] = u256(payments[first_winner] + dust)
+
+    def _apply_stats(self, deltas: dict):
+        """One stats write and one leaderboard pass per player."""
+        now = self._now_iso()
+        for addr, (wins, losses, won) in deltas.items():
+            self._touch_player(addr)
+            stats = self.player_stats[addr]
+            stats.wins = u256(stats.wins + u256(wins))
+            stats.losses = u256(stats.losses + u256(losses))
+            stats.volume_won = u256(stats.volume_won + u256(won))
+            stats.last_updated = now
+            self.player_stats[addr] = stats
+            self._rerank(addr)
+
+    def _transfer(self, transport: str, to_addr: Address, value: u256):
+        if transport == "contract_at":
+            gl.ContractAt(to_addr).emit_transfer(value=value)
+        elif transport == "transfer":
+            gl.transfer(to=to_addr, value=value)
+        elif transport == "emit_transfer":
+            gl.emit_transfer(to=to_addr, value=value)
+
+    def _probe_payout(self, to_addr: Address, value: u256) -> str:
+        """Pay through the first transfer mechanism that works and return its
+        name: "none" if the runtime has none (Studio), "" if all failed."""
+        available = [
+            name for name, present in (
+                ("contract_at", hasattr(gl, "ContractAt")),
+                ("transfer", hasattr(gl, "transfer")),
+                ("emit_transfer", hasattr(gl, "emit_transfer")),
+            ) if present
+        ]
+        if not available:
+            return "none"
+        for name in available:
+            try:
+                self._transfer(name, to_addr, value)
+                return name
+            except Exception:
+                pass
+        return ""
+
+    def _pay(self, to_addr: Address, value: u256):
+        # Transfer escrowed funds with the mechanism detected on first use;
+        # later payouts dispatch straight to it without probing.
+        if value <= u256(0) or self.payout_transport == "none":
+            return
+        if self.payout_transport:
+            try:
+                self._transfer(self.payout_transport, to_addr, value)
+                return
+            except Exception:
+                # The runtime changed under us; detect again below.
+                self.payout_transport = ""
+        self.payout_transport = self._probe_payout(to_addr, value)
 
-    @gl.public.view
-    def get_wager(self, wager_id: str):
-        w = self._get_wager(wager_id)
+    def _pay_all(self, payments: dict):
+        # The runtime has no multi-recipient transfer, so payouts are merged
+        # per address and sent with one call each.
+        for addr, value in payments.items():
+            self._pay(addr, value)
+
+    @gl.public.write
+    def resolve_wager(self, wager_id: str):
+        wager_id, key = self._lookup(wager_id)
+        w = self.wagers[key]
+        self._check_resolvable(key, w)
+        deltas = {}
+        payments = {}
+        self._settle(wager_id, key, w, deltas, payments)
+        self._apply_stats(deltas)
+        self._pay_all(payments)
+
+    @gl.public.write
+    def resolve_wagers(self, ids: list[str]):
+        """Settle many final wagers in one transaction.
+
+        Ineligible or unknown ids are skipped with their reason instead of
+        aborting the batch. Stat changes are merged into one write per
+        player and payouts into one transfer per address.
+        """
+        self._check_batch(len(ids))
+        deltas = {}
+        payments = {}
+        resolved = []
+        skipped = {}
+        for wager_id in ids:
+            if wager_id in skipped or wager_id in resolved:
+                continue
+            key = self._wager_key(wager_id)
+            if key is None:
+                skipped[wager_id] = "Wager not found"
+                continue
+            w = self.wagers[key]
+            try:
+                self._check_resolvable(key, w)
+            except Exception as e:
+                skipped[wager_id] = str(e)
+                continue
+            self._settle(self._wager_id(key), key, w, deltas, payments)
+            resolved.append(wager_id)
+        self._apply_stats(deltas)
+        self._pay_all(payments)
+        return {
+            "resolved": resolved,
+            "skipped": skipped,
+            "payouts": {str(addr): int(value) for addr, value in payments.items() if value > u256(0)},
+        }
+
+    def _wager_view(self, key: u256):
+        # Decodes the compact record into the original JSON shape.
+        w = self.wagers[key]
+        v = self._verification(key)
+        wager_id = self._wager_id(key)
         return {
-            "id": w.id,
+            "id": wager_id,
             "prediction": w.prediction,
             "player_a": str(w.player_a),
             "player_b": str(w.player_b),
-            "player_a_stance": w.player_a_stance,
-            "player_b_stance": w.player_b_stance,
+            "player_a_stance": STANCES[int(w.player_a_stance)],
+            "player_b_stance": STANCES[int(w.player_b_stance)],
             "stake_amount": int(w.stake_amount),
             "deadline": w.deadline,
             "category": w.category,
             "verification_criteria": w.verification_criteria,
-            "status": w.status,
+            "status": self._status(w),
             "pot": int(w.pot),
             "verification_result": {
-                "outcome": w.verification.outcome,
-                "confidence": w.verification.confidence,
-                "evidence": w.verification.evidence,
-                "validators_used": int(w.verification.validators_used),
-                "is_final": w.verification.is_final,
-            } if w.has_verification else None,
-            "created_at": w.created_at,
-            "resolved_at": w.resolved_at,
+                "outcome": v.outcome,
+                "confidence": v.confidence,
+                "evidence": v.evidence,
+                "validators_used": int(v.validators_used),
+                "is_final": v.is_final,
+            } if v is not None else None,
+            "created_at": self._iso(w.created_at),
+            "resolved_at": self._iso(w.resolved_at) if int(w.resolved_at) else "",
+            "pool": self._pool_view(wager_id),
+        }
+
+    def _pool_view(self, wager_id: str):
+        if wager_id not in self.pools:
+            return None
+        totals = self.pools[wager_id]
+        return {
+            "agree_total": int(totals.agree),
+            "disagree_total": int(totals.disagree),
+            "members": int(totals.members),
         }
 
     @gl.public.view
-    def get_status(self, wager_id: str):
-        w = self._get_wager(wager_id)
+    def get_wager(self, wager_id: str):
+        return self._wager_view(self._lookup(wager_id)[1])
+
+    def _check_batch(self, count: int):
+        if count > MAX_BATCH:
+            raise Exception(f"At most {MAX_BATCH} keys per batch")
+
+    def _status_view(self, key: u256):
+        w = self.wagers[key]
+        v = self._verification(key)
         return {
-            "status": w.status,
+            "status": self._status(w),
             "player_a": str(w.player_a),
             "player_b": str(w.player_b),
-            "player_a_stance": w.player_a_stance,
-            "player_b_stance": w.player_b_stance,
+            "player_a_stance": STANCES[int(w.player_a_stance)],
+            "player_b_stance": STANCES[int(w.player_b_stance)],
             "pot": int(w.pot),
-            "has_verification": w.has_verification,
-            "is_final": w.verification.is_final if w.has_verification else False,
-            "outcome": w.verification.outcome if w.has_verification else "",
+            "has_verification": v is not None,
+            "is_final": v.is_final if v is not None else False,
+            "outcome": v.outcome if v is not None else "",
         }
 
+    @gl.public.view
+    def get_pool_position(self, wager_id: str, addr: Address):
+        key = self._pool_key(self._lookup(wager_id)[0], addr)
+        if key not in self.pool_sides:
+            return {"side": "", "stake": 0}
+        return {"side": self.pool_sides[key], "stake": int(self.pool_stakes[key])}
+
+    @gl.public.view
+    def list_pool_members(self, wager_id: str, offset: int, limit: int):
+        wager_id = self._lookup(wager_id)[0]
+        if wager_id not in self.pools:
+            raise Exception("Wager is not a pool")
+        if offset < 0 or limit < 0:
+            raise Exception("Invalid pagination")
+        self._check_batch(limit)
+        total = int(self.pools[wager_id].members)
+        result = []
+        for slot in range(offset, min(offset + limit, total)):
+            addr = self.pool_members[self._index_key(wager_id, slot)]
+            key = self._pool_key(wager_id, Address(addr))
+            result.append({"address": addr, "side": self.pool_sides[key], "stake": int(self.pool_stakes[key])})
+        return result
+
+    @gl.public.view
+    def list_pool_members_json(self, wager_id: str, offset: int, limit: int) -> str:
+        return json.dumps(self.list_pool_members(wager_id, offset, limit))
+
+    @gl.public.view
+    def get_status(self, wager_id: str):
+        return self._status_view(self._lookup(wager_id)[1])
+
+    # Batch views: one call for many ids; unknown ids map to None.
+    @gl.public.view
+    def get_wagers(self, ids: list[str]):
+        self._check_batch(len(ids))
+        keys = {i: self._wager_key(i) for i in ids}
+        return {i: self._wager_view(k) if k is not None else None for i, k in keys.items()}
+
+    @gl.public.view
+    def get_statuses(self, ids: list[str]):
+        self._check_batch(len(ids))
+        keys = {i: self._wager_key(i) for i in ids}
+        return {i: self._status_view(k) if k is not None else None for i, k in keys.items()}
+
+    @gl.public.view
+    def get_player_stats_batch(self, addrs: list[Address]):
+        self._check_batch(len(addrs))
+        return {str(a): self.get_player_stats(a) for a in addrs}
+
     @gl.public.view
     def get_last_wager_id(self):
         return self.last_wager_id
@@ -571,15 +1116,84 @@ class PredictionWager(gl.Contract):
         if offset < 0 or limit < 0:
             raise Exception("Invalid pagination")
         total = int(self.wager_counter)
-        end = offset + limit
-        result = []
-        i = offset
-        while i < total and i < end:
-            key = u256(i)
-            if key in self.wager_index:
-                result.append(self.wager_index[key])
+        return [self._wager_id(u256(i + 1)) for i in range(offset, min(offset + limit, total))]
+
+    @gl.public.view
+    def list_wagers_by_player(self, player: Address, offset: int, limit: int):
+        ids = self._index_page(self.player_wager_count, self.player_wager_index, str(player), offset, limit)
+        return [self._wager_view(self._wager_key(i)) for i in ids]
+
+    @gl.public.view
+    def list_wagers_by_status(self, status: str, offset: int, limit: int):
+        # Order within a status is not stable: leaving a status moves that
+        # bucket's last wager into the freed slot.
+        ids = self._index_page(self.status_wager_count, self.status_wager_index, status, offset, limit)
+        return [self._wager_view(self._wager_key(i)) for i in ids]
+
+    @gl.public.view
+    def list_wagers_by_category(self, category: str, offset: int, limit: int):
+        ids = self._index_page(self.category_wager_count, self.category_wager_index, category, offset, limit)
+        return [self._wager_view(self._wager_key(i)) for i in ids]
+
+    @gl.public.view
+    def get_index_counts(self, player: Address, status: str, category: str):
+        return {
+            "player": int(self.player_wager_count[str(player)]) if str(player) in self.player_wager_count else 0,
+            "status": int(self.status_wager_count[status]) if status in self.status_wager_count else 0,
+            "category": int(self.category_wager_count[category]) if category in self.category_wager_count else 0,
+        }
+
+    @gl.public.view
+    def list_wagers_by_player_json(self, player: Address, offset: int, limit: int) -> str:
+        return json.dumps(self.list_wagers_by_player(player, offset, limit))
+
+    @gl.public.view
+    def list_wagers_by_status_json(self, status: str, offset: int, limit: int) -> str:
+        return json.dumps(self.list_wagers_by_status(status, offset, limit))
+
+    @gl.public.view
+    def list_wagers_by_category_json(self, category: str, offset: int, limit: int) -> str:
+        return json.dumps(self.list_wagers_by_category(category, offset, limit))
+
+    @gl.public.view
+    def list_wagers_full(self, offset: int, limit: int):
+        self._check_batch(limit)
+        return [self._wager_view(self._wager_key(i)) for i in self.list_wagers(offset, limit)]
+
+    @gl.public.view
+    def get_changes_since(self, seq: int, limit: int):
+        """Wager transitions with sequence number >= ``seq``; resume from ``next``."""
+        if seq < 0 or limit < 0:
+            raise Exception("Invalid pagination")
+        self._check_batch(limit)
+        total = int(self.change_count)
+        changes = []
+        i = seq
+        while i < total and i < seq + limit:
+            entry = self.change_log[u256(i)]
+            changes.append({"seq": i, "wager_id": entry.wager_id, "status": entry.status, "at": entry.at})
             i += 1
-        return result
+        return {"changes": changes, "next": i, "latest": total}
+
+    @gl.public.view
+    def get_changes_since_json(self, seq: int, limit: int) -> str:
+        return json.dumps(self.get_changes_since(seq, limit))
+
+    @gl.public.view
+    def get_wagers_json(self, ids: list[str]) -> str:
+        return json.dumps(self.get_wagers(ids))
+
+    @gl.public.view
+    def get_statuses_json(self, ids: list[str]) -> str:
+        return json.dumps(self.get_statuses(ids))
+
+    @gl.public.view
+    def get_player_stats_batch_json(self, addrs: list[Address]) -> str:
+        return json.dumps(self.get_player_stats_batch(addrs))
+
+    @gl.public.view
+    def list_wagers_full_json(self, offset: int, limit: int) -> str:
+        return json.dumps(self.list_wagers_full(offset, limit))
 
     @gl.public.view
     def get_wager_json(self, wager_id: str) -> str:
@@ -657,40 +1271,26 @@ class PredictionWager(gl.Contract):
         if offset < 0 or limit < 0:
             raise Exception("Invalid pagination")
         total = int(self.player_count)
+        end = offset + limit
         entries = []
-        i = 0
-        while i < total:
+        i = offset
+        while i < total and i < end:
             key = u256(i)
-            if key in self.player_index:
-                addr = self.player_index[key]
-                if addr in self.player_stats:
-                    s = self.player_stats[addr]
-                    wins = int(s.wins)
-                    losses = int(s.losses)
-                    volume_won = int(s.volume_won)
-                    volume_contributed = int(s.volume_contributed)
-                else:
-                    wins = 0
-                    losses = 0
-                    volume_won = 0
-                    volume_contributed = 0
+            if key in self.leaderboard:
+                addr = self.leaderboard[key]
+                s = self.player_stats[addr]
                 entries.append(
                     {
                         "address": str(addr),
-                        "username": s.username if addr in self.player_stats else "",
-                        "wins": wins,
-                        "losses": losses,
-                        "volume_won": volume_won,
-                        "volume_contributed": volume_contributed,
+                        "username": s.username,
+                        "wins": int(s.wins),
+                        "losses": int(s.losses),
+                        "volume_won": int(s.volume_won),
+                        "volume_contributed": int(s.volume_contributed),
                     }
                 )
             i += 1
-
-        entries.sort(
-            key=lambda e: (-e["wins"], -e["volume_won"], -e["volume_contributed"], e["address"])
-        )
-        end = offset + limit
-        return entries[offset:end]
+        return entries
 
     @gl.public.view
     def list_players_json(self, offset: int, limit: int) -> str:
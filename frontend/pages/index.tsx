@@ -91,6 +91,23 @@ export default function LobbyPage() {
       const ids = JSON.parse(result as string) as string[];
       setOffset(nextOffset);
       setWagerIds(ids);
+      if (ids.length === 0) return;
+      try {
+        const batch = await client.readContract({
+          address: CONTRACT,
+          functionName: "get_statuses_json",
+          args: [ids],
+        });
+        const statuses = JSON.parse(batch as string) as Record<string, any>;
+        const batchMap: StatusMap = {};
+        for (const [id, s] of Object.entries(statuses)) {
+          if (s) batchMap[id] = s;
+        }
+        setStatusMap((m) => ({ ...m, ...batchMap }));
+        return;
+      } catch (_e) {
+        // Fallback for older contracts without batch views
+      }
       const entries = await Promise.all(
         ids.map(async (id) => {
           try {
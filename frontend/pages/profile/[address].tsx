@@ -71,6 +71,19 @@ export default function ProfilePage() {
         setStats(null);
       }
 
+      try {
+        const page = await client.readContract({
+          address: CONTRACT,
+          functionName: "list_wagers_by_player_json",
+          args: [targetAddress, nextOffset, limit],
+        });
+        setOffset(nextOffset);
+        setWagers(JSON.parse(page as string));
+        return;
+      } catch (_e) {
+        // Fallback for older contracts without the player index
+      }
+
       const result = await client.readContract({
         address: CONTRACT,
         functionName: "list_wagers_json",
@@ -15,35 +15,107 @@ export async function getNonce(address: string) {
   return data as { nonce: string; timestamp: number };
 }
 
+// Session tokens from /relay/session, per address; valid until expiresAt (seconds).
+const sessions: Record<string, { token: string; expiresAt: number }> = {};
+
+async function signed(action: string, address: string, signMessageAsync: SignMessageAsync) {
+  const { nonce, timestamp } = await getNonce(address);
+  const message = `GenLayer Wager Relayer\nAction: ${action}\nAddress: ${address}\nNonce: ${nonce}\nTimestamp: ${timestamp}`;
+  const signature = await signMessageAsync({ message });
+  return { signature, nonce, timestamp };
+}
+
+export async function getSession(address: string, signMessageAsync: SignMessageAsync) {
+  const key = address.toLowerCase();
+  const cached = sessions[key];
+  if (cached && cached.expiresAt - 30 > Date.now() / 1000) return cached.token;
+  const res = await fetch(`${relayerUrl()}/relay/session`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ address, ...(await signed("session", address, signMessageAsync)) }),
+  });
+  const data = await res.json();
+  if (!res.ok) throw new Error(data.error || "Session error");
+  sessions[key] = { token: data.session, expiresAt: data.expires_at };
+  return data.session as string;
+}
+
 export async function relayAction(
-  action: "create" | "accept" | "verify" | "appeal" | "resolve" | "username",
+  action: "create" | "accept" | "pool" | "join" | "verify" | "appeal" | "resolve" | "username",
   payload: Record<string, any>,
   address: string,
   signMessageAsync: SignMessageAsync,
   hasRetried = false
 ) {
-  const { nonce, timestamp } = await getNonce(address);
-  const message = `GenLayer Wager Relayer\nAction: ${action}\nAddress: ${address}\nNonce: ${nonce}\nTimestamp: ${timestamp}`;
-  const signature = await signMessageAsync({ message });
+  // One signature per session; fall back to signing each action if the
+  // relayer does not offer sessions.
+  let auth: Record<string, any>;
+  try {
+    auth = { session: await getSession(address, signMessageAsync) };
+  } catch (_e) {
+    auth = await signed(action, address, signMessageAsync);
+  }
 
   const res = await fetch(`${relayerUrl()}/relay/${action}`, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
     body: JSON.stringify({
       address,
-      signature,
-      nonce,
-      timestamp,
+      ...auth,
       ...payload,
     }),
   });
   const data = await res.json();
   if (!res.ok) {
     const msg = data.error || "Relayer error";
-    if (!hasRetried && msg.toLowerCase().includes("nonce")) {
+    if (msg.toLowerCase().includes("session")) {
+      delete sessions[address.toLowerCase()];
+    }
+    if (!hasRetried && (msg.toLowerCase().includes("nonce") || msg.toLowerCase().includes("session"))) {
       return relayAction(action, payload, address, signMessageAsync, true);
     }
     throw new Error(msg);
   }
   return data;
 }
+
+export type RelayBatchAction = { action: "create" | "accept" | "pool" | "join" | "verify" | "appeal" | "resolve" | "username" } & Record<string, any>;
+
+// Submits several actions in one request under one session or signature.
+// The relayer returns per-action hashes without waiting for receipts; poll
+// `status_url` for all of them at once.
+export async function relayBatch(
+  actions: RelayBatchAction[],
+  address: string,
+  signMessageAsync: SignMessageAsync,
+  hasRetried = false
+) {
+  let auth: Record<string, any>;
+  try {
+    auth = { session: await getSession(address, signMessageAsync) };
+  } catch (_e) {
+    auth = await signed("batch", address, signMessageAsync);
+  }
+
+  const res = await fetch(`${relayerUrl()}/relay/batch`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ address, ...auth, actions }),
+  });
+  const data = await res.json();
+  if (!res.ok) {
+    const msg = data.error || "Relayer error";
+    if (msg.toLowerCase().includes("session")) {
+      delete sessions[address.toLowerCase()];
+    }
+    if (!hasRetried && (msg.toLowerCase().includes("nonce") || msg.toLowerCase().includes("session"))) {
+      return relayBatch(actions, address, signMessageAsync, true);
+    }
+    throw new Error(msg);
+  }
+  return data as {
+    results: { action: string; hash?: string; error?: string; skipped?: boolean }[];
+    submitted: number;
+    status_url: string;
+  };
+}
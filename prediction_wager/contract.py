@@ -1,8 +1,31 @@
 import asyncio
 import dataclasses
 import datetime
+import heapq
+import itertools
 import uuid
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+
+@dataclasses.dataclass
+class Pool:
+    """Side totals and per-player positions of a pooled wager."""
+    totals: Dict[str, float] = dataclasses.field(default_factory=lambda: {"agree": 0.0, "disagree": 0.0})
+    sides: Dict[str, str] = dataclasses.field(default_factory=dict)
+    stakes: Dict[str, float] = dataclasses.field(default_factory=dict)
+
+    def add(self, player: str, stance: str, amount: float) -> None:
+        if self.sides.setdefault(player, stance) != stance:
+            raise ValueError("Already joined the other side of this pool")
+        self.stakes[player] = self.stakes.get(player, 0.0) + amount
+        self.totals[stance] += amount
+
+    def payouts(self, outcome: str, pot: float) -> Dict[str, float]:
+        """Pro-rata shares of ``pot`` for the winning side (refunds if it is empty)."""
+        side = "agree" if outcome == "YES" else "disagree"
+        if self.totals[side] <= 0:
+            return dict(self.stakes)
+        return {p: stake * pot / self.totals[side] for p, stake in self.stakes.items() if self.sides[p] == side}
 
 
 @dataclasses.dataclass
@@ -20,6 +43,7 @@ class Wager:
     status: str = "waiting"
     pot: float = 0.0
     verification_result: Optional[dict] = None
+    pool: Optional[Pool] = None
 
 
 class PredictionWagerContract:
@@ -32,6 +56,12 @@ class PredictionWagerContract:
 
     def __init__(self):
         self.wagers: Dict[str, Wager] = {}
+        # Deadline index over accepted, unresolved wagers: a min-heap of
+        # (deadline, seq, wager_id). Resolved wagers are dropped lazily when
+        # they reach the top, and the heap is rebuilt once they make up half.
+        self._deadlines: List[Tuple[datetime.datetime, int, str]] = []
+        self._deadline_seq = itertools.count()
+        self._deadline_stale = 0
 
     async def create_wager(self, *, prediction: str, player_a: str, stake_amount: float,
                            deadline: str, category: Optional[str], verification_criteria: str) -> dict:
@@ -52,17 +82,50 @@ class PredictionWagerContract:
         self.wagers[wid] = w
         return {"wager_id": wid, "waiting_for_opponent": True}
 
-    async def accept_wager(self, *, wager_id: str, player_b: str, stance: Optional[str] = None) -> dict:
+    async def create_pool(self, *, prediction: str, player: str, stake_amount: float, deadline: str,
+                          category: Optional[str], verification_criteria: str, stance: str = "agree") -> dict:
+        """Open a pooled wager that any number of players can join on either side."""
+        normalized = self._stance(stance)
+        created = await self.create_wager(prediction=prediction, player_a=player, stake_amount=stake_amount,
+                                          deadline=deadline, category=category,
+                                          verification_criteria=verification_criteria)
+        w = self.wagers[created["wager_id"]]
+        w.player_a_stance = normalized
+        w.pool = Pool()
+        w.pool.add(player, normalized, stake_amount)
+        w.pot = stake_amount
+        w.status = "active"
+        heapq.heappush(self._deadlines, (w.deadline, next(self._deadline_seq), w.id))
+        return {"wager_id": w.id, "status": w.status, "total_pot": w.pot}
+
+    async def join_pool(self, *, wager_id: str, player: str, stake_amount: float, stance: Optional[str] = None) -> dict:
         w = self._get_wager(wager_id)
-        if w.status != "waiting":
-            raise ValueError("Wager is not available to accept")
+        if w.pool is None:
+            raise ValueError("Wager is not a pool")
+        if w.status != "active" or w.verification_result is not None:
+            raise ValueError("Pool is closed")
+        if stake_amount <= 0:
+            raise ValueError("Stake must be positive")
+        w.pool.add(player, self._stance(stance), stake_amount)
+        w.pot += stake_amount
+        return {"total_pot": w.pot, **{f"{side}_total": total for side, total in w.pool.totals.items()}}
+
+    def _stance(self, stance: Optional[str]) -> str:
         normalized = (stance or "disagree").strip().lower()
         if normalized not in ("agree", "disagree"):
             raise ValueError("Stance must be 'agree' or 'disagree'")
+        return normalized
+
+    async def accept_wager(self, *, wager_id: str, player_b: str, stance: Optional[str] = None) -> dict:
+        w = self._get_wager(wager_id)
+        if w.status != "waiting":
+            raise ValueError("Wager is not available to accept")
+        normalized = self._stance(stance)
         w.player_b = player_b
         w.player_b_stance = normalized
         w.status = "active"
         w.pot = w.stake_amount * 2
+        heapq.heappush(self._deadlines, (w.deadline, next(self._deadline_seq), w.id))
         return {"total_pot": w.pot, "status": w.status}
 
     async def verify_prediction(self, *, wager_id: str, current_date: Optional[str] = None,
@@ -86,7 +149,7 @@ class PredictionWagerContract:
             try:
                 from prediction_wager import verifier
 
-                vres = await verifier.verify_prediction_logic(
+                vres = await verifier.verify_prediction_cached(
                     prediction=w.prediction,
                     verification_criteria=w.verification_criteria,
                     deadline=w.deadline,
@@ -100,7 +163,9 @@ class PredictionWagerContract:
                 confidence = 0.6
                 evidence = "Verifier failure — replace with GenLayer validators"
 
-        if outcome == "YES":
+        if w.pool is not None:
+            winner = "agree" if outcome == "YES" else "disagree"
+        elif outcome == "YES":
             winner = w.player_a if w.player_a_stance != "disagree" else w.player_b
         else:
             winner = w.player_b if w.player_b_stance == "disagree" else w.player_a
@@ -148,7 +213,10 @@ class PredictionWagerContract:
                 confidence = 0.9
                 evidence = "Deep-check mock evidence (replace with real validator appeal flow)"
 
-        final_winner = w.player_a if outcome == "YES" else w.player_b
+        if w.pool is not None:
+            final_winner = "agree" if outcome == "YES" else "disagree"
+        else:
+            final_winner = w.player_a if outcome == "YES" else w.player_b
         res = {
             "outcome": outcome,
             "final_winner": final_winner,
@@ -164,11 +232,46 @@ class PredictionWagerContract:
         w = self._get_wager(wager_id)
         if w.status == "resolved":
             raise ValueError("Wager already resolved")
+        if w.status == "active":
+            self._deadline_stale += 1
         w.status = "resolved"
+        if self._deadline_stale * 2 > len(self._deadlines):
+            self._deadlines = [e for e in self._deadlines if self.wagers[e[2]].status != "resolved"]
+            heapq.heapify(self._deadlines)
+            self._deadline_stale = 0
         payout = w.pot
         # In a real GenLayer contract you'd transfer funds; here we just return the payout info.
+        if w.pool is not None:
+            return {"winner": winner, "payout": payout, "payouts": w.pool.payouts(outcome, payout)}
         return {"winner": winner, "payout": payout}
 
+    def _deadline_top(self) -> Optional[Tuple[datetime.datetime, int, str]]:
+        while self._deadlines and self.wagers[self._deadlines[0][2]].status == "resolved":
+            heapq.heappop(self._deadlines)
+            self._deadline_stale -= 1
+        return self._deadlines[0] if self._deadlines else None
+
+    def due_wagers(self, now: Union[str, datetime.datetime, None] = None, limit: int = 100) -> List[str]:
+        """Ids of accepted, unresolved wagers whose deadline is at or before
+        `now`, earliest first. Costs O(k log n) for k results."""
+        if isinstance(now, str):
+            now = datetime.datetime.fromisoformat(now)
+        now = now or datetime.datetime.utcnow()
+        taken = []
+        while len(taken) < limit:
+            top = self._deadline_top()
+            if top is None or top[0] > now:
+                break
+            taken.append(heapq.heappop(self._deadlines))
+        for entry in taken:
+            heapq.heappush(self._deadlines, entry)
+        return [entry[2] for entry in taken]
+
+    def next_deadline(self) -> Optional[datetime.datetime]:
+        """Earliest deadline among accepted, unresolved wagers (None if there are none)."""
+        top = self._deadline_top()
+        return top[0] if top else None
+
     def _get_wager(self, wager_id: str) -> Wager:
         if wager_id not in self.wagers:
             raise KeyError("Wager not found")
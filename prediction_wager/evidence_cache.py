@@ -0,0 +1,207 @@
+"""Evidence page cache for the verifier.
+
+Every validator and every appeal fetches the same evidence URLs
+(coinmarketcap, nba.com, boxofficemojo, ...). This cache keeps one copy per
+URL and time bucket: inside a bucket the stored page is served without any
+network call, and in a later bucket it is revalidated with
+``If-None-Match`` / ``If-Modified-Since`` so an unchanged page costs a 304.
+Each entry records the sha256 digest of the page text, the same digest the
+on-chain contract stores as evidence.
+
+Storage is pluggable: an in-memory LRU is always used and an optional
+SQLite store keeps pages across processes and restarts.
+"""
+import asyncio
+import collections
+import dataclasses
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+@dataclasses.dataclass
+class Evidence:
+    url: str
+    text: str
+    sha256: str
+    bucket: int
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+# fetcher(url, conditional_headers) -> (status, text, headers)
+Fetcher = Callable[[str, Dict[str, str]], Awaitable[Tuple[int, str, Dict[str, str]]]]
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class MemoryEvidenceStore:
+    """Thread-safe LRU of the latest Evidence per URL."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._items: "collections.OrderedDict[str, Evidence]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[Evidence]:
+        with self._lock:
+            ev = self._items.get(url)
+            if ev is not None:
+                self._items.move_to_end(url)
+            return ev
+
+    def put(self, ev: Evidence) -> None:
+        with self._lock:
+            self._items[ev.url] = ev
+            self._items.move_to_end(ev.url)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SQLiteEvidenceStore:
+    """Evidence persisted in a SQLite file, shareable between processes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS evidence ("
+            " url TEXT PRIMARY KEY, text TEXT NOT NULL, sha256 TEXT NOT NULL,"
+            " bucket INTEGER NOT NULL, fetched_at REAL NOT NULL,"
+            " etag TEXT, last_modified TEXT)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Evidence]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, text, sha256, bucket, fetched_at, etag, last_modified"
+                " FROM evidence WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return Evidence(*row) if row else None
+
+    def put(self, ev: Evidence) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO evidence VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (ev.url, ev.text, ev.sha256, ev.bucket, ev.fetched_at, ev.etag, ev.last_modified),
+            )
+            self._conn.commit()
+
+
+class EvidenceCache:
+    """Serve evidence pages per (URL, time bucket) with HTTP revalidation.
+
+    Concurrent lookups of the same URL on one event loop share a single
+    fetch. ``stats`` counts hits, revalidations (304s), fetches and errors.
+    """
+
+    def __init__(self, bucket_seconds: int = 300, memory: Optional[MemoryEvidenceStore] = None,
+                 disk: Optional[SQLiteEvidenceStore] = None):
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self.memory = memory or MemoryEvidenceStore()
+        self.disk = disk
+        self.stats = {"hits": 0, "revalidated": 0, "fetched": 0, "errors": 0}
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    def bucket(self, now: Optional[float] = None) -> int:
+        return int((time.time() if now is None else now) // self.bucket_seconds)
+
+    def lookup(self, url: str) -> Optional[Evidence]:
+        ev = self.memory.get(url)
+        if ev is None and self.disk is not None:
+            ev = self.disk.get(url)
+            if ev is not None:
+                self.memory.put(ev)
+        return ev
+
+    def store(self, ev: Evidence) -> None:
+        self.memory.put(ev)
+        if self.disk is not None:
+            self.disk.put(ev)
+
+    async def get(self, url: str, fetcher: Fetcher) -> Optional[Evidence]:
+        """Return evidence for ``url``, fetching or revalidating as needed.
+
+        Returns None when the page cannot be fetched and nothing is cached.
+        """
+        bucket = self.bucket()
+        cached = self.lookup(url)
+        if cached is not None and cached.bucket == bucket:
+            self.stats["hits"] += 1
+            return cached
+
+        key = (id(asyncio.get_running_loop()), url)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            ev = await self._refresh(url, cached, bucket, fetcher)
+            fut.set_result(ev)
+            return ev
+        except BaseException as e:
+            fut.set_exception(e)
+            # Nobody else may be awaiting; mark the exception as retrieved.
+            fut.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _refresh(self, url: str, cached: Optional[Evidence], bucket: int,
+                       fetcher: Fetcher) -> Optional[Evidence]:
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        try:
+            status, text, resp_headers = await fetcher(url, headers)
+        except Exception:
+            self.stats["errors"] += 1
+            return cached
+
+        now = time.time()
+        if status == 304 and cached is not None:
+            self.stats["revalidated"] += 1
+            ev = dataclasses.replace(cached, bucket=bucket, fetched_at=now)
+        elif 200 <= status < 300:
+            self.stats["fetched"] += 1
+            ev = Evidence(
+                url=url,
+                text=text,
+                sha256=sha256_text(text),
+                bucket=bucket,
+                fetched_at=now,
+                etag=resp_headers.get("ETag"),
+                last_modified=resp_headers.get("Last-Modified"),
+            )
+        else:
+            self.stats["errors"] += 1
+            return cached
+        self.store(ev)
+        return ev
+
+
+def from_env() -> EvidenceCache:
+    """Build the process-wide cache from EVIDENCE_CACHE_* env variables."""
+    path = os.getenv("EVIDENCE_CACHE_PATH")
+    return EvidenceCache(
+        bucket_seconds=int(os.getenv("EVIDENCE_CACHE_TTL", "300")),
+        memory=MemoryEvidenceStore(int(os.getenv("EVIDENCE_CACHE_SIZE", "256"))),
+        disk=SQLiteEvidenceStore(path) if path else None,
+    )
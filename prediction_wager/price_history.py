@@ -0,0 +1,221 @@
+"""Local OHLC price history for crypto predictions.
+
+Candles are kept per asset in parallel ``array`` columns (timestamps as
+int64 seconds, prices as float64) so a year of 30-minute candles is a few
+hundred KB and lookups are a ``bisect`` away. Range maxima use a sparse table
+built on first use, so "did BTC reach $X before the deadline" is O(1) after
+the bisects.
+
+Files are one binary blob per asset: ``<n:int64>`` followed by the ts, open,
+high, low and close columns. Keep the store current with::
+
+    python -m prediction_wager.price_history --dir data/prices --days 90 bitcoin ethereum
+"""
+import argparse
+import array
+import asyncio
+import bisect
+import datetime
+import os
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+
+_COLUMNS = ("ts", "open", "high", "low", "close")
+
+
+def to_epoch(value) -> int:
+    """Epoch seconds for a datetime (naive values are taken as UTC) or number."""
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return int(value.timestamp())
+    return int(value)
+
+
+class PriceSeries:
+    """Sorted OHLC candles for one asset."""
+
+    def __init__(self):
+        self.ts = array.array("q")
+        self.open = array.array("d")
+        self.high = array.array("d")
+        self.low = array.array("d")
+        self.close = array.array("d")
+        self._sparse: Optional[List[array.array]] = None
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def first_ts(self) -> Optional[int]:
+        return self.ts[0] if self.ts else None
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        return self.ts[-1] if self.ts else None
+
+    def extend(self, rows: Iterable[Sequence[float]]) -> int:
+        """Merge ``(ts, open, high, low, close)`` rows; newer rows win on equal ts.
+
+        Returns the number of candles after the merge.
+        """
+        incoming = sorted((int(r[0]), float(r[1]), float(r[2]), float(r[3]), float(r[4])) for r in rows)
+        if not incoming:
+            return len(self)
+        if not self.ts or incoming[0][0] > self.ts[-1]:
+            # Common refresh case: strictly newer candles, append in place.
+            merged = incoming
+        else:
+            by_ts = {t: (t, o, h, lo, c) for t, o, h, lo, c in zip(self.ts, self.open, self.high, self.low, self.close)}
+            for row in incoming:
+                by_ts[row[0]] = row
+            merged = sorted(by_ts.values())
+            for col in _COLUMNS:
+                setattr(self, col, array.array(getattr(self, col).typecode))
+        last = self.ts[-1] if self.ts else None
+        for t, o, h, lo, c in merged:
+            if t == last:
+                # Duplicate timestamps inside one batch: keep the later row.
+                self.open[-1], self.high[-1], self.low[-1], self.close[-1] = o, h, lo, c
+                continue
+            self.ts.append(t)
+            self.open.append(o)
+            self.high.append(h)
+            self.low.append(lo)
+            self.close.append(c)
+            last = t
+        self._sparse = None
+        return len(self)
+
+    def covers(self, t: int, slack: int = 86400) -> bool:
+        return bool(self.ts) and self.ts[0] <= t <= self.ts[-1] + slack
+
+    def price_at(self, t: int) -> Optional[Tuple[int, float]]:
+        """Close of the last candle at or before ``t`` as ``(candle_ts, price)``."""
+        i = bisect.bisect_right(self.ts, t) - 1
+        if i < 0:
+            return None
+        return self.ts[i], self.close[i]
+
+    def max_high(self, t0: int, t1: int) -> Optional[float]:
+        """Highest high over candles with ``t0 <= ts <= t1``."""
+        lo = bisect.bisect_left(self.ts, t0)
+        hi = bisect.bisect_right(self.ts, t1) - 1
+        if lo > hi:
+            return None
+        table = self._sparse_table()
+        k = (hi - lo + 1).bit_length() - 1
+        return max(table[k][lo], table[k][hi - (1 << k) + 1])
+
+    def _sparse_table(self) -> List[array.array]:
+        if self._sparse is None:
+            levels = [array.array("d", self.high)]
+            width = 1
+            n = len(self.high)
+            while width * 2 <= n:
+                prev = levels[-1]
+                levels.append(array.array("d", (max(prev[i], prev[i + width]) for i in range(n - 2 * width + 1))))
+                width *= 2
+            self._sparse = levels
+        return self._sparse
+
+    def to_bytes(self) -> bytes:
+        header = array.array("q", [len(self)])
+        return header.tobytes() + b"".join(getattr(self, col).tobytes() for col in _COLUMNS)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PriceSeries":
+        series = cls()
+        if not data:
+            return series
+        n = array.array("q", data[:8])[0]
+        offset = 8
+        for col in _COLUMNS:
+            column = getattr(series, col)
+            size = n * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            offset += size
+        return series
+
+
+class PriceHistory:
+    """Per-asset PriceSeries, optionally persisted under ``directory``."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _path(self, asset: str) -> str:
+        return os.path.join(self.directory, f"{asset}.ohlc")
+
+    def series(self, asset: str) -> PriceSeries:
+        with self._lock:
+            s = self._series.get(asset)
+            if s is None:
+                s = PriceSeries()
+                if self.directory and os.path.exists(self._path(asset)):
+                    with open(self._path(asset), "rb") as f:
+                        s = PriceSeries.from_bytes(f.read())
+                self._series[asset] = s
+            return s
+
+    def ingest(self, asset: str, rows: Iterable[Sequence[float]], save: bool = True) -> int:
+        s = self.series(asset)
+        with self._lock:
+            count = s.extend(rows)
+        if save:
+            self.save(asset)
+        return count
+
+    def save(self, asset: str) -> None:
+        if not self.directory:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        data = self.series(asset).to_bytes()
+        tmp = self._path(asset) + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._path(asset))
+
+    def price_at(self, asset: str, when) -> Optional[Tuple[int, float]]:
+        return self.series(asset).price_at(to_epoch(when))
+
+    def max_high(self, asset: str, start, end) -> Optional[float]:
+        return self.series(asset).max_high(to_epoch(start), to_epoch(end))
+
+
+async def refresh(history: PriceHistory, asset: str, days: int = 90, fetch_json=None) -> int:
+    """Backfill ``days`` of CoinGecko OHLC candles for ``asset``; returns candle count."""
+    if fetch_json is None:
+        from prediction_wager.verifier import _fetch_json as fetch_json
+    url = f"https://api.coingecko.com/api/v3/coins/{asset}/ohlc?vs_currency=usd&days={days}"
+    raw = await fetch_json(url, timeout=20)
+    rows = [(int(r[0]) // 1000, r[1], r[2], r[3], r[4]) for r in raw or []]
+    return history.ingest(asset, rows)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Backfill or refresh the local price history store")
+    parser.add_argument("assets", nargs="+", help="CoinGecko ids, e.g. bitcoin ethereum")
+    parser.add_argument("--dir", default=os.getenv("PRICE_HISTORY_DIR"), required=not os.getenv("PRICE_HISTORY_DIR"))
+    parser.add_argument("--days", type=int, default=90)
+    args = parser.parse_args(argv)
+
+    from prediction_wager import verifier
+
+    async def run():
+        history = PriceHistory(args.dir)
+        try:
+            for asset in args.assets:
+                count = await refresh(history, asset, days=args.days)
+                print(f"{asset}: {count} candles")
+        finally:
+            await verifier.aclose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Declarative rule registry for the verifier's category heuristics.
+
+Each category (NBA, box office, NOAA, ...) registers a handler together with
+the criteria keywords that trigger it. All keywords of all rules are compiled
+into one regex, so classifying a prediction is a single scan of the criteria
+text no matter how many categories exist; the matching handlers then run in
+registration order until one returns a verdict. Prediction fields (asset,
+threshold, team, year, ...) are parsed at most once per prediction.
+"""
+import dataclasses
+import functools
+import re
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+
+_NUMBER_RE = re.compile(r"\$?([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]+)?)")
+_DOLLAR_RE = re.compile(r"\$([0-9,]+)")
+_BTC_RE = re.compile(r"bitcoin|btc", re.I)
+_ETH_RE = re.compile(r"ethereum|eth", re.I)
+_TEAM_RE = re.compile(r"([A-Za-z ]+?) will win|([A-Za-z ]+?) will be|([A-Za-z ]+?) will", re.I)
+_WINNER_RE = re.compile(r"([A-Za-z ]+?) will win", re.I)
+_YEAR_RE = re.compile(r"(20[2-9][0-9])")
+_URL_RE = re.compile(r"(https?://[^\s]+)")
+_RACE_TIME_RE = re.compile(r"([0-9]+):([0-9]{2}):?([0-9]{2})?")
+
+
+def extract_number(s: str) -> Optional[float]:
+    m = _NUMBER_RE.search(s)
+    if not m:
+        return None
+    return float(m.group(1).replace(",", ""))
+
+
+class ParsedPrediction:
+    """Prediction + criteria with every derived field computed on first use."""
+
+    def __init__(self, prediction: str, criteria: str):
+        self.prediction = prediction
+        self.criteria = criteria
+        self.criteria_lower = criteria.lower()
+
+    @functools.cached_property
+    def prediction_lower(self) -> str:
+        return self.prediction.lower()
+
+    @functools.cached_property
+    def asset(self) -> Optional[str]:
+        if _BTC_RE.search(self.prediction):
+            return "bitcoin"
+        if _ETH_RE.search(self.prediction):
+            return "ethereum"
+        return None
+
+    @functools.cached_property
+    def threshold(self) -> Optional[float]:
+        m = _DOLLAR_RE.search(self.prediction)
+        return float(m.group(1).replace(",", "")) if m else None
+
+    @functools.cached_property
+    def number(self) -> Optional[float]:
+        return extract_number(self.prediction)
+
+    @functools.cached_property
+    def team(self) -> Optional[str]:
+        m = _TEAM_RE.search(self.prediction)
+        return m.group(1) if m else None
+
+    @functools.cached_property
+    def winner(self) -> Optional[str]:
+        m = _WINNER_RE.search(self.prediction)
+        return m.group(1) if m else None
+
+    @functools.cached_property
+    def year(self) -> Optional[int]:
+        m = _YEAR_RE.search(self.prediction)
+        return int(m.group(1)) if m else None
+
+    @functools.cached_property
+    def subject(self) -> str:
+        return self.prediction.split(" will ")[0]
+
+    @functools.cached_property
+    def url(self) -> Optional[str]:
+        m = _URL_RE.search(self.criteria)
+        return m.group(1) if m else None
+
+    @functools.cached_property
+    def race_time(self):
+        return _RACE_TIME_RE.search(self.prediction)
+
+
+class RuleContext:
+    """Per-verification state shared by handlers; the evidence page is fetched once."""
+
+    def __init__(self, parsed: ParsedPrediction, validators: int,
+                 fetch_text: Callable[[str], Awaitable[str]]):
+        self.parsed = parsed
+        self.validators = validators
+        self.fetch_text = fetch_text
+        self._page: Optional[str] = None
+
+    async def page(self) -> str:
+        if self._page is None:
+            self._page = await self.fetch_text(self.parsed.url) if self.parsed.url else ""
+        return self._page
+
+    async def page_lower(self) -> str:
+        return (await self.page()).lower()
+
+    def result(self, outcome: str, confidence: float, evidence: str) -> Dict[str, Any]:
+        return {"outcome": outcome, "confidence": confidence, "evidence": evidence, "validators": self.validators}
+
+
+Handler = Callable[[ParsedPrediction, RuleContext], Awaitable[Optional[Dict[str, Any]]]]
+
+
+@dataclasses.dataclass
+class Rule:
+    name: str
+    keywords: tuple
+    handler: Handler
+    order: int
+
+
+class RuleRegistry:
+    def __init__(self):
+        self._rules: Dict[str, Rule] = {}
+        self._pattern: Optional[re.Pattern] = None
+        self._keyword_rules: Dict[str, List[str]] = {}
+
+    def register(self, name: str, keywords: Iterable[str], order: Optional[int] = None):
+        """Decorator registering ``handler(parsed, ctx)`` for criteria containing any keyword.
+
+        Rules run in ascending ``order`` (registration order by default).
+        """
+        def deco(fn: Handler) -> Handler:
+            pos = order if order is not None else len(self._rules) * 10
+            self._rules[name] = Rule(name, tuple(k.lower() for k in keywords), fn, pos)
+            self._pattern = None
+            return fn
+        return deco
+
+    def _compile(self) -> re.Pattern:
+        if self._pattern is None:
+            keyword_rules: Dict[str, List[str]] = {}
+            for rule in self._rules.values():
+                for kw in rule.keywords:
+                    keyword_rules.setdefault(kw, []).append(rule.name)
+            alternation = "|".join(re.escape(k) for k in sorted(keyword_rules, key=len, reverse=True))
+            # Lookahead so overlapping keywords ("nba" inside "nba.com") all match,
+            # like independent substring checks would.
+            self._pattern = re.compile(f"(?=({alternation}))") if alternation else re.compile(r"(?!x)x")
+            self._keyword_rules = keyword_rules
+        return self._pattern
+
+    def classify(self, criteria_lower: str) -> List[Rule]:
+        pattern = self._compile()
+        names = set()
+        for m in pattern.finditer(criteria_lower):
+            names.update(self._keyword_rules[m.group(1)])
+        return sorted((self._rules[n] for n in names), key=lambda r: (r.order, r.name))
+
+    async def dispatch(self, ctx: RuleContext) -> Optional[Dict[str, Any]]:
+        for rule in self.classify(ctx.parsed.criteria_lower):
+            res = await rule.handler(ctx.parsed, ctx)
+            if res is not None:
+                return res
+        return None
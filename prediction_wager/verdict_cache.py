@@ -0,0 +1,140 @@
+"""Verdict cache shared by wagers that ask the same question.
+
+Many wagers carry the same prediction and criteria (every "Bitcoin will
+reach $100,000" wager reads the same price page). A verdict is keyed by:
+
+* the sha256 of the normalized prediction and criteria text (case and
+  whitespace folded, trailing punctuation dropped);
+* the sha256 digest of the evidence page, when the criteria name one, so a
+  changed page gives a new key;
+* the deadline bucket, so wagers with nearby deadlines share a verdict
+  while a different settlement date does not.
+
+Entries hold the verdict dict (outcome, confidence, evidence) and are
+evicted LRU-first beyond ``max_entries`` or once older than ``ttl``.
+Concurrent lookups of the same key on one event loop share a single
+computation, so the validators of an aggregation round or the wagers of a
+settlement sweep compute a verdict once.
+"""
+import asyncio
+import collections
+import datetime
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+Verdict = Dict[str, Any]
+
+
+def normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", (text or "").strip().lower()).rstrip(" .!?")
+
+
+def deadline_bucket(deadline: Union[str, datetime.datetime, None], bucket_seconds: int) -> int:
+    if deadline is None:
+        return -1
+    if isinstance(deadline, str):
+        deadline = datetime.datetime.fromisoformat(deadline)
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=datetime.timezone.utc)
+    return int(deadline.timestamp() // max(1, bucket_seconds))
+
+
+def verdict_key(prediction: str, criteria: str, evidence_digest: str,
+                deadline: Union[str, datetime.datetime, None], bucket_seconds: int = 3600) -> str:
+    text = hashlib.sha256(f"{normalize(prediction)}\x1f{normalize(criteria)}".encode("utf-8")).hexdigest()
+    return f"{text}:{evidence_digest or '-'}:{deadline_bucket(deadline, bucket_seconds)}"
+
+
+class VerdictCache:
+    """Thread-safe LRU of verdicts with a TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 600.0, bucket_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.bucket_seconds = max(1, int(bucket_seconds))
+        self.stats = {"hits": 0, "misses": 0}
+        self._items: "collections.OrderedDict[str, Tuple[float, Verdict]]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+
+    def key(self, prediction: str, criteria: str, evidence_digest: str,
+            deadline: Union[str, datetime.datetime, None]) -> str:
+        return verdict_key(prediction, criteria, evidence_digest, deadline, self.bucket_seconds)
+
+    def get(self, key: str) -> Optional[Verdict]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return dict(entry[1])
+
+    def put(self, key: str, verdict: Verdict) -> None:
+        with self._lock:
+            self._items[key] = (time.time() + self.ttl, dict(verdict))
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Verdict]],
+                             cacheable: Optional[Callable[[Verdict], bool]] = None) -> Verdict:
+        """Cached verdict for ``key``, or the result of ``compute()``.
+
+        Results rejected by ``cacheable`` are returned but not stored.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            self.stats["hits"] += 1
+            return cached
+
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            try:
+                verdict = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The computing task was cancelled (e.g. a validator timeout):
+                # take over instead of failing every waiter.
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and getattr(task, "cancelling", lambda: 0)()):
+                    raise
+                return await self.get_or_compute(key, compute, cacheable)
+            self.stats["hits"] += 1
+            return dict(verdict)
+        self.stats["misses"] += 1
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = fut
+        try:
+            verdict = await compute()
+            if cacheable is None or cacheable(verdict):
+                self.put(key, verdict)
+            fut.set_result(verdict)
+            return dict(verdict)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()
+            raise
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def from_env() -> VerdictCache:
+    """Build the process-wide cache from VERDICT_CACHE_* env variables."""
+    return VerdictCache(
+        max_entries=int(os.getenv("VERDICT_CACHE_SIZE", "1024")),
+        ttl=float(os.getenv("VERDICT_CACHE_TTL", "600")),
+        bucket_seconds=int(os.getenv("VERDICT_CACHE_BUCKET", "3600")),
+    )
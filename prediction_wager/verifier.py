@@ -3,26 +3,169 @@ import datetime
 import json
 import os
 import re
+import weakref
 from typing import Dict, Any, Optional
 
-import requests
+import aiohttp
 from urllib.parse import quote_plus
 
+from prediction_wager import evidence_cache, verdict_cache
+from prediction_wager.evidence_cache import Evidence, EvidenceCache
+from prediction_wager.verdict_cache import VerdictCache
+from prediction_wager.price_history import PriceHistory, to_epoch
+from prediction_wager.rules import ParsedPrediction, RuleContext, RuleRegistry, extract_number as _extract_number
 
-def _fetch_text(url: str, timeout: int = 6) -> str:
-    try:
-        r = requests.get(url, timeout=timeout)
+
+# One pooled HTTP session per event loop (aiohttp sessions cannot be shared
+# across loops). Keep-alive connections are reused between verifications and
+# the connector caps total and per-host connections.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+
+def _get_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=int(os.getenv("VERIFIER_MAX_CONNECTIONS", "100")),
+            limit_per_host=int(os.getenv("VERIFIER_MAX_PER_HOST", "10")),
+            keepalive_timeout=30,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+
+async def aclose() -> None:
+    """Close the HTTP session bound to the running loop (call before the loop ends)."""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+_evidence_cache: Optional[EvidenceCache] = None
+
+
+def get_evidence_cache() -> EvidenceCache:
+    global _evidence_cache
+    if _evidence_cache is None:
+        _evidence_cache = evidence_cache.from_env()
+    return _evidence_cache
+
+
+async def _http_fetch(url: str, headers: Dict[str, str], timeout: int = 6):
+    async with _get_session().get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        validators = {"ETag": r.headers.get("ETag"), "Last-Modified": r.headers.get("Last-Modified")}
+        if r.status == 304:
+            return 304, "", validators
         r.raise_for_status()
-        return r.text
+        return r.status, await r.text(), validators
+
+
+async def fetch_evidence(url: str, timeout: int = 6) -> Optional[Evidence]:
+    """Fetch an evidence page through the shared cache (text + sha256 digest)."""
+    return await get_evidence_cache().get(url, lambda u, h: _http_fetch(u, h, timeout))
+
+
+async def _fetch_text(url: str, timeout: int = 6) -> str:
+    try:
+        ev = await fetch_evidence(url, timeout)
     except Exception:
         return ""
+    return ev.text if ev is not None else ""
+
+
+_verdict_cache: Optional[VerdictCache] = None
+
+
+def get_verdict_cache() -> VerdictCache:
+    global _verdict_cache
+    if _verdict_cache is None:
+        _verdict_cache = verdict_cache.from_env()
+    return _verdict_cache
+
+
+def cacheable_verdict(verdict: Dict[str, Any]) -> bool:
+    # Fallback verdicts ("Price not found", verifier errors, unknown
+    # categories) carry 0.5 confidence and should be retried, not shared.
+    return float(verdict.get("confidence", 0)) > 0.5
+
+
+async def verdict_key(prediction: str, verification_criteria: str, deadline) -> str:
+    """Verdict cache key; includes the digest of the criteria's evidence page, if any."""
+    url = ParsedPrediction(prediction, verification_criteria).url
+    digest = ""
+    if url:
+        try:
+            ev = await fetch_evidence(url)
+            digest = ev.sha256 if ev is not None else ""
+        except Exception:
+            pass
+    return get_verdict_cache().key(prediction, verification_criteria, digest, deadline)
+
+
+async def verify_prediction_cached(*, prediction: str, verification_criteria: str,
+                                   deadline: datetime.datetime, validators: int = 5) -> Dict[str, Any]:
+    """verify_prediction_logic, computed once per (prediction, criteria, evidence, deadline bucket)."""
+    verdict = await get_verdict_cache().get_or_compute(
+        await verdict_key(prediction, verification_criteria, deadline),
+        lambda: verify_prediction_logic(prediction=prediction, verification_criteria=verification_criteria,
+                                        deadline=deadline, validators=validators),
+        cacheable=cacheable_verdict,
+    )
+    if "validators" in verdict:
+        verdict["validators"] = validators
+    return verdict
+
+
+async def _fetch_json(url: str, timeout: int = 5) -> Any:
+    async with _get_session().get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return await r.json(content_type=None)
+
 
+async def _post_json(url: str, payload: Dict[str, Any], headers: Dict[str, str], timeout: int = 10) -> Any:
+    async with _get_session().post(url, json=payload, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
+        r.raise_for_status()
+        return await r.json(content_type=None)
+
+
+_price_history: Optional[PriceHistory] = None
+_REACH_RE = re.compile(r"\b(reach|hit|touch|exceed|surpass|break|above|over)", re.I)
+
+
+def get_price_history() -> Optional[PriceHistory]:
+    """Local OHLC store from PRICE_HISTORY_DIR (None when not configured)."""
+    global _price_history
+    if _price_history is None and os.getenv("PRICE_HISTORY_DIR"):
+        _price_history = PriceHistory(os.getenv("PRICE_HISTORY_DIR"))
+    return _price_history
 
-def _extract_number(s: str):
-    m = re.search(r"\$?([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]+)?)", s)
-    if not m:
+
+def _check_price_history(asset: str, threshold: float, prediction: str,
+                         deadline: datetime.datetime, validators: int) -> Optional[Dict[str, Any]]:
+    history = get_price_history()
+    if history is None:
+        return None
+    series = history.series(asset)
+    t = to_epoch(deadline)
+    if not series.covers(t):
         return None
-    return float(m.group(1).replace(",", ""))
+    if _REACH_RE.search(prediction):
+        # "Will reach $X by <deadline>": any candle high in the window counts.
+        days = int(os.getenv("PRICE_WINDOW_DAYS", "365"))
+        price = series.max_high(t - days * 86400, t)
+        label = f"max {asset} price in the {days} days up to {deadline.isoformat()}"
+    else:
+        at = series.price_at(t)
+        price = at[1] if at else None
+        label = f"{asset} close at or before {deadline.isoformat()}"
+    if price is None:
+        return None
+    outcome = "YES" if price >= threshold else "NO"
+    confidence = 0.7 if abs(price - threshold) / max(threshold, 1) > 0.05 else 0.9
+    evidence = f"Price history {label}: ${price} (threshold ${threshold})"
+    return {"outcome": outcome, "confidence": confidence, "evidence": evidence, "validators": validators}
 
 
 def _check_team_champion(page_text: str, team: str, year: Optional[int] = None):
@@ -46,16 +189,9 @@ async def verify_prediction_logic(*, prediction: str, verification_criteria: str
     that run LLM-based searches and multi-validator voting for production.
     """
     # Detect asset and threshold from the prediction text.
-    asset = None
-    if re.search(r"bitcoin|btc", prediction, re.I):
-        asset = "bitcoin"
-    elif re.search(r"ethereum|eth", prediction, re.I):
-        asset = "ethereum"
-
-    m = re.search(r"\$([0-9,]+)", prediction)
-    threshold = None
-    if m:
-        threshold = float(m.group(1).replace(",", ""))
+    parsed = ParsedPrediction(prediction, verification_criteria)
+    asset = parsed.asset
+    threshold = parsed.threshold
 
     # If a GenLayer RPC url is provided, attempt to delegate verification to the
     # GenLayer node / validators via JSON-RPC. This requires that you provide
@@ -79,9 +215,7 @@ async def verify_prediction_logic(*, prediction: str, verification_criteria: str
             headers = {"Content-Type": "application/json"}
             if genlayer_api_key:
                 headers["Authorization"] = f"Bearer {genlayer_api_key}"
-            r = requests.post(genlayer_rpc, json=payload, headers=headers, timeout=10)
-            r.raise_for_status()
-            j = r.json()
+            j = await _post_json(genlayer_rpc, payload, headers, timeout=10)
             # Expect the node/validator to return a result object compatible with our verifier
             result = j.get("result") or j.get("data") or j
             outcome = result.get("outcome") if isinstance(result, dict) else None
@@ -97,121 +231,142 @@ async def verify_prediction_logic(*, prediction: str, verification_criteria: str
             pass
 
     if asset and threshold:
-        # Query CoinGecko simple price (current). For historical checks you would use /coins/{id}/history
-            try:
-                url = f"https://api.coingecko.com/api/v3/simple/price?ids={asset}&vs_currencies=usd"
-                r = requests.get(url, timeout=5)
-                r.raise_for_status()
-                j = r.json()
-                price = j.get(asset, {}).get("usd")
-                if price is None:
-                    return {"outcome": "NO", "confidence": 0.5, "evidence": "Price not found"}
-                outcome = "YES" if price >= threshold else "NO"
-                confidence = 0.7 if abs(price - threshold) / max(threshold, 1) > 0.05 else 0.9
-                evidence = f"CoinGecko current price for {asset}: ${price} (threshold ${threshold})"
-                return {"outcome": outcome, "confidence": confidence, "evidence": evidence, "validators": validators}
-            except Exception as e:
-                return {"outcome": "NO", "confidence": 0.5, "evidence": f"Verifier error: {e}"}
-
-    # Fallback: simple keyword match against verification_criteria. Not reliable.
-    lower_crit = verification_criteria.lower()
-
-    # If criteria contains a URL, try fetching it and perform heuristic checks.
-    url_match = re.search(r"(https?://[^\s]+)", verification_criteria)
-    page_text = ""
-    if url_match:
-        page_text = _fetch_text(url_match.group(1))
-
-    # Sports: NBA / FIFA / championships
-    if "nba.com" in lower_crit or "nba" in lower_crit or "championship" in lower_crit:
-        team_match = re.search(r"([A-Za-z ]+?) will win|([A-Za-z ]+?) will be|([A-Za-z ]+?) will", prediction, re.I)
-        team = team_match.group(1) if team_match else None
-        year_match = re.search(r"(20[2-9][0-9])", prediction)
-        year = int(year_match.group(1)) if year_match else None
-        if page_text and team:
-            ok, evidence = _check_team_champion(page_text, team, year)
-            return {"outcome": "YES" if ok else "NO", "confidence": 0.8 if ok else 0.55, "evidence": evidence, "validators": validators}
-
-    if "fifa" in lower_crit or "world cup" in lower_crit:
-        team_match = re.search(r"([A-Za-z ]+?) will win", prediction, re.I)
-        team = team_match.group(1) if team_match else None
-        if page_text and team:
-            ok, evidence = _check_team_champion(page_text, team)
-            return {"outcome": "YES" if ok else "NO", "confidence": 0.8 if ok else 0.55, "evidence": evidence, "validators": validators}
-
-    # Box office
-    if "box office" in lower_crit or "boxofficemojo" in lower_crit:
-        num = _extract_number(prediction)
-        if page_text and num:
-            found = _extract_number(page_text)
-            if found is not None:
-                ok = found >= num
-                return {"outcome": "YES" if ok else "NO", "confidence": 0.85 if ok else 0.6, "evidence": f"Found ${found} vs threshold ${num}", "validators": validators}
-
-    # Awards (Oscars)
-    if "academy" in lower_crit or "oscar" in lower_crit:
-        if page_text:
-            # simple presence check
-            if "best picture" in page_text.lower() and prediction.split(" will ")[0].lower() in page_text.lower():
-                return {"outcome": "YES", "confidence": 0.9, "evidence": "Found Best Picture winner on page", "validators": validators}
-
-    # Elections
-    if "election" in lower_crit or "official election results" in lower_crit:
-        # Check page text for party control phrases
-        txt = page_text.lower()
-        if "democrats" in txt and ("control" in txt or "majority" in txt):
-            return {"outcome": "YES", "confidence": 0.8, "evidence": "Found Democrats control both chambers mention", "validators": validators}
-
-    # Weather / NOAA
-    if "weather.gov" in lower_crit or "noaa" in lower_crit:
-        num = _extract_number(prediction)
-        if page_text and num:
-            found = _extract_number(page_text)
-            if found is not None:
-                ok = found >= num
-                return {"outcome": "YES" if ok else "NO", "confidence": 0.8 if ok else 0.55, "evidence": f"Found reported max {found} vs threshold {num}", "validators": validators}
-
-    # Stock / market cap
-    if "yahoo" in lower_crit or "google finance" in lower_crit or "market cap" in lower_crit:
-        num = _extract_number(prediction)
-        if page_text and num:
-            found = _extract_number(page_text)
-            if found is not None:
-                ok = found >= num
-                return {"outcome": "YES" if ok else "NO", "confidence": 0.8 if ok else 0.55, "evidence": f"Found value {found} vs threshold {num}", "validators": validators}
-
-    # Social media (Twitter/X) - try searching the site if criteria references it
-    if "twitter" in lower_crit or "x.com" in lower_crit:
-        # attempt a basic web search using the site's search page
-        query = quote_plus(prediction.split(" will ")[0])
-        search_url = f"https://twitter.com/search?q={query}&src=typed_query"
-        page = _fetch_text(search_url)
-        if page:
-            if "genlayer" in page.lower():
-                return {"outcome": "YES", "confidence": 0.7, "evidence": "Found matching tweet text", "validators": validators}
-
-    # Marathon / personal goals - look for official race results (best-effort)
-    if "marathon" in lower_crit or "race results" in lower_crit:
-        txt = page_text.lower()
-        time_match = re.search(r"([0-9]+):([0-9]{2}):?([0-9]{2})?", prediction)
-        if txt and time_match:
-            # naive check: presence of runner name or sub-4h mention
-            if "4:00:00" in prediction or "4 hours" in prediction:
-                if "sub-4" in txt or "<4:00" in txt:
-                    return {"outcome": "YES", "confidence": 0.75, "evidence": "Found sub-4h result", "validators": validators}
-
-    # Fallback: criteria mentions data sources but we couldn't parse
-    if "coinmarketcap" in lower_crit or "coingecko" in lower_crit or any(k in lower_crit for k in ("nba.com", "fifa", "boxofficemojo", "yahoo", "weather.gov", "noaa", "twitter", "oscar")):
-        return {"outcome": "NO", "confidence": 0.6, "evidence": "Criteria mentions data sources but automated parse failed"}
+        historical = _check_price_history(asset, threshold, prediction, deadline, validators)
+        if historical is not None:
+            return historical
+        # Query CoinGecko simple price (current) when the local history does not cover the deadline.
+        try:
+            url = f"https://api.coingecko.com/api/v3/simple/price?ids={asset}&vs_currencies=usd"
+            j = await _fetch_json(url, timeout=5)
+            price = j.get(asset, {}).get("usd")
+            if price is None:
+                return {"outcome": "NO", "confidence": 0.5, "evidence": "Price not found"}
+            outcome = "YES" if price >= threshold else "NO"
+            confidence = 0.7 if abs(price - threshold) / max(threshold, 1) > 0.05 else 0.9
+            evidence = f"CoinGecko current price for {asset}: ${price} (threshold ${threshold})"
+            return {"outcome": outcome, "confidence": confidence, "evidence": evidence, "validators": validators}
+        except Exception as e:
+            return {"outcome": "NO", "confidence": 0.5, "evidence": f"Verifier error: {e}"}
 
+    # Fallback: keyword-triggered category heuristics (see RULES below). Not reliable.
+    ctx = RuleContext(parsed, validators, _fetch_text)
+    res = await RULES.dispatch(ctx)
+    if res is not None:
+        return res
     return {"outcome": "NO", "confidence": 0.5, "evidence": "Unable to verify with simple verifier"}
 
 
+# ---- category heuristics ----
+# Register new categories with @RULES.register(name, keywords); they run in
+# registration order and only when one of their keywords is in the criteria.
+
+RULES = RuleRegistry()
+
+
+def _threshold_result(ctx: RuleContext, found: float, num: float, yes_conf: float, no_conf: float, evidence: str):
+    ok = found >= num
+    return ctx.result("YES" if ok else "NO", yes_conf if ok else no_conf, evidence)
+
+
+@RULES.register("nba", ("nba.com", "nba", "championship"))
+async def _nba_rule(p: ParsedPrediction, ctx: RuleContext):
+    page_text = await ctx.page()
+    if page_text and p.team:
+        ok, evidence = _check_team_champion(page_text, p.team, p.year)
+        return ctx.result("YES" if ok else "NO", 0.8 if ok else 0.55, evidence)
+    return None
+
+
+@RULES.register("fifa", ("fifa", "world cup"))
+async def _fifa_rule(p: ParsedPrediction, ctx: RuleContext):
+    page_text = await ctx.page()
+    if page_text and p.winner:
+        ok, evidence = _check_team_champion(page_text, p.winner)
+        return ctx.result("YES" if ok else "NO", 0.8 if ok else 0.55, evidence)
+    return None
+
+
+@RULES.register("box_office", ("box office", "boxofficemojo"))
+async def _box_office_rule(p: ParsedPrediction, ctx: RuleContext):
+    page_text = await ctx.page()
+    if page_text and p.number:
+        found = _extract_number(page_text)
+        if found is not None:
+            return _threshold_result(ctx, found, p.number, 0.85, 0.6, f"Found ${found} vs threshold ${p.number}")
+    return None
+
+
+@RULES.register("oscar", ("academy", "oscar"))
+async def _oscar_rule(p: ParsedPrediction, ctx: RuleContext):
+    txt = await ctx.page_lower()
+    if txt and "best picture" in txt and p.subject.lower() in txt:
+        return ctx.result("YES", 0.9, "Found Best Picture winner on page")
+    return None
+
+
+@RULES.register("election", ("election", "official election results"))
+async def _election_rule(p: ParsedPrediction, ctx: RuleContext):
+    # Check page text for party control phrases
+    txt = await ctx.page_lower()
+    if "democrats" in txt and ("control" in txt or "majority" in txt):
+        return ctx.result("YES", 0.8, "Found Democrats control both chambers mention")
+    return None
+
+
+@RULES.register("weather", ("weather.gov", "noaa"))
+async def _weather_rule(p: ParsedPrediction, ctx: RuleContext):
+    page_text = await ctx.page()
+    if page_text and p.number:
+        found = _extract_number(page_text)
+        if found is not None:
+            return _threshold_result(ctx, found, p.number, 0.8, 0.55, f"Found reported max {found} vs threshold {p.number}")
+    return None
+
+
+@RULES.register("market", ("yahoo", "google finance", "market cap"))
+async def _market_rule(p: ParsedPrediction, ctx: RuleContext):
+    page_text = await ctx.page()
+    if page_text and p.number:
+        found = _extract_number(page_text)
+        if found is not None:
+            return _threshold_result(ctx, found, p.number, 0.8, 0.55, f"Found value {found} vs threshold {p.number}")
+    return None
+
+
+@RULES.register("social", ("twitter", "x.com"))
+async def _social_rule(p: ParsedPrediction, ctx: RuleContext):
+    # attempt a basic web search using the site's search page
+    query = quote_plus(p.subject)
+    page = await _fetch_text(f"https://twitter.com/search?q={query}&src=typed_query")
+    if page and "genlayer" in page.lower():
+        return ctx.result("YES", 0.7, "Found matching tweet text")
+    return None
+
+
+@RULES.register("marathon", ("marathon", "race results"))
+async def _marathon_rule(p: ParsedPrediction, ctx: RuleContext):
+    txt = await ctx.page_lower()
+    if txt and p.race_time:
+        # naive check: presence of runner name or sub-4h mention
+        if "4:00:00" in p.prediction or "4 hours" in p.prediction:
+            if "sub-4" in txt or "<4:00" in txt:
+                return ctx.result("YES", 0.75, "Found sub-4h result")
+    return None
+
+
+# Last resort: criteria mentions data sources but we couldn't parse.
+@RULES.register("known_source", (
+    "coinmarketcap", "coingecko", "nba.com", "fifa", "boxofficemojo", "yahoo", "weather.gov", "noaa", "twitter", "oscar",
+), order=10000)
+async def _known_source_rule(p: ParsedPrediction, ctx: RuleContext):
+    return {"outcome": "NO", "confidence": 0.6, "evidence": "Criteria mentions data sources but automated parse failed"}
+
+
 async def appeal_verification_logic(*, prediction: str, verification_criteria: str,
                                     appeal_reason: str, validators: int = 50) -> Dict[str, Any]:
     # For appeals, run a deeper check (same logic here but mark higher confidence)
-    base = await verify_prediction_logic(prediction=prediction, verification_criteria=verification_criteria,
-                                         deadline=datetime.datetime.utcnow(), validators=validators)
+    base = await verify_prediction_cached(prediction=prediction, verification_criteria=verification_criteria,
+                                          deadline=datetime.datetime.utcnow(), validators=validators)
     base["confidence"] = min(0.99, base.get("confidence", 0.7) + 0.2)
     base["is_final"] = True
     base["appeal_reason"] = appeal_reason
@@ -1,32 +1,57 @@
-from flask import Flask, request, jsonify
-from werkzeug.exceptions import HTTPException
-from flask_cors import CORS
 import asyncio
+import contextlib
+import json
 import os
+import re
 import subprocess
+import threading
 import time
 from typing import Dict
 
-from eth_account import Account
-from eth_account.messages import encode_defunct
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
 
 from prediction_wager.contract import PredictionWagerContract
+from tools import nonce_store, relay_auth
 
-app = Flask(__name__)
-# Allow browser calls to the relayer endpoints.
-CORS(app, resources={r"/relay/*": {"origins": "*"}, r"/health": {"origins": "*"}})
+routes = []
 
-@app.errorhandler(Exception)
-def handle_exception(e):
+def route(path: str, methods):
+    def deco(fn):
+        routes.append(Route(path, fn, methods=methods))
+        return fn
+    return deco
+
+def jsonify(value, status_code: int = 200):
+    return JSONResponse(value, status_code=status_code)
+
+async def _body(request) -> dict:
+    raw = await request.body()
+    return json.loads(raw) if raw else {}
+
+async def handle_exception(request, e):
     if isinstance(e, HTTPException):
-        return jsonify({"error": e.description}), e.code
-    return jsonify({"error": str(e)}), 500
-contract = PredictionWagerContract()
-nonces: Dict[str, str] = {}
+        return jsonify({"error": e.detail}, e.status_code)
+    return jsonify({"error": str(e)}, 500)
 
+# In-memory local contract: one copy per process. With WEB_CONCURRENCY > 1
+# only the relay routes and /api/* behave consistently across workers.
+contract = PredictionWagerContract()
+# Shared across worker processes when NONCE_STORE_PATH is set.
+nonces = nonce_store.from_env()
+_relay_pool = None
+_relay_pool_lock = threading.Lock()
+_tx_tracker = None
+_native_client = None
+_index_store = None
+_api_cache: Dict[tuple, tuple] = {}
+_API_CACHE_SIZE = 512
 
-def run_async(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
 
 def _relayer_env():
     env = os.environ.copy()
@@ -35,6 +60,11 @@ def _relayer_env():
     env["GENLAYER_PRIVATE_KEY"] = os.getenv("RELAYER_PRIVATE_KEY", "")
     return env
 
+def _relayer_keys():
+    # Optional pool keys, one per Node worker: workers sharing an account
+    # race for its nonce.
+    return [k.strip() for k in os.getenv("RELAYER_PRIVATE_KEYS", "").split(",") if k.strip()]
+
 def _require_relayer_env():
     if not os.getenv("CONTRACT_ADDRESS"):
         raise Exception("CONTRACT_ADDRESS env not set")
@@ -50,6 +80,13 @@ def _verify_signature(data, action: str):
         return
 
     address = data.get("address", "")
+    session = data.get("session", "")
+    if session and action != "session":
+        # Fast path: HMAC token from /relay/session instead of a new signature.
+        if not address or not relay_auth.check_session(session, address):
+            raise Exception("Invalid session")
+        return
+
     signature = data.get("signature", "")
     nonce = data.get("nonce", "")
     ts = int(data.get("timestamp", 0))
@@ -57,22 +94,59 @@ def _verify_signature(data, action: str):
     if not address or not signature or not nonce or not ts:
         raise Exception("Missing signature fields")
 
-    # basic replay protection
-    if nonces.get(address) != nonce:
-        raise Exception("Invalid nonce")
     if abs(int(time.time()) - ts) > 300:
         raise Exception("Signature expired")
 
     msg = _message(action, address, nonce, ts)
-    recovered = Account.recover_message(encode_defunct(text=msg), signature=signature)
-    if recovered.lower() != address.lower():
+    if not relay_auth.verify_signature(msg, signature, address):
         raise Exception("Invalid signature")
 
-    # consume nonce
-    nonces.pop(address, None)
+    # basic replay protection: consume only after the signature checks out,
+    # so a forged request cannot burn the owner's nonce.
+    if not nonces.consume(address, nonce):
+        raise Exception("Invalid nonce")
+
+def _get_relay_pool():
+    global _relay_pool
+    with _relay_pool_lock:
+        if _relay_pool is None:
+            from tools.relay_pool import RelayPool
+
+            keys = _relayer_keys()
+            envs = [{**_relayer_env(), "GENLAYER_PRIVATE_KEY": k} for k in keys] or None
+            _relay_pool = RelayPool(
+                size=int(os.getenv("RELAYER_WORKERS", "1")),
+                max_inflight=int(os.getenv("RELAYER_MAX_INFLIGHT", "16")),
+                env=_relayer_env(),
+                envs=envs,
+            )
+        return _relay_pool
+
+def _get_native_client():
+    global _native_client
+    with _relay_pool_lock:
+        if _native_client is None:
+            from tools.genlayer_client import GenLayerClient
+
+            _native_client = GenLayerClient(
+                os.getenv("GENLAYER_RPC_URL", "https://studio.genlayer.com/api"),
+                private_key=os.getenv("RELAYER_PRIVATE_KEY"),
+                api_key=os.getenv("GENLAYER_API_KEY"),
+            )
+        return _native_client
+
+def _run_native(cmd: str, args: list):
+    from tools.genlayer_client import run_command, to_json
+
+    return to_json(run_command(_get_native_client(), os.getenv("CONTRACT_ADDRESS", ""), cmd, [str(a) for a in args]))
 
 def _run_node(cmd: str, args: list):
     _require_relayer_env()
+    if os.getenv("RELAYER_BACKEND", "node") == "python":
+        return _run_native(cmd, args)
+    if os.getenv("RELAYER_POOL", "1") == "1":
+        return _get_relay_pool().run(cmd, args)
+    # One-shot mode: spawn a fresh Node process per request.
     proc = subprocess.run(
         ["node", "tools/genlayer_interact.mjs", cmd, *args],
         capture_output=True,
@@ -84,146 +158,434 @@ def _run_node(cmd: str, args: list):
         raise Exception(proc.stderr.strip() or proc.stdout.strip() or "Relayer failed")
     return proc.stdout.strip()
 
-
-@app.route('/relay/nonce', methods=['POST'])
-def relay_nonce():
-    data = request.json or {}
+async def _run_node_async(cmd: str, args: list):
+    """_run_node without blocking the event loop."""
+    _require_relayer_env()
+    if os.getenv("RELAYER_BACKEND", "node") == "python":
+        return await run_in_threadpool(_run_native, cmd, args)
+    if os.getenv("RELAYER_POOL", "1") == "1":
+        return await _get_relay_pool().run_async(cmd, args)
+    proc = await asyncio.create_subprocess_exec(
+        "node", "tools/genlayer_interact.mjs", cmd, *[str(a) for a in args],
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=_relayer_env(),
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise Exception(stderr.decode().strip() or stdout.decode().strip() or "Relayer failed")
+    return stdout.decode().strip()
+
+def _fetch_tx_statuses(hashes: list) -> dict:
+    return json.loads(_run_node("receipts", ["--hashes", ",".join(hashes)]))
+
+def _get_tx_tracker():
+    global _tx_tracker
+    with _relay_pool_lock:
+        if _tx_tracker is None:
+            from tools.tx_tracker import TxTracker
+
+            _tx_tracker = TxTracker(
+                _fetch_tx_statuses,
+                interval=float(os.getenv("RELAYER_TRACK_INTERVAL", "4")),
+                batch_size=int(os.getenv("RELAYER_TRACK_BATCH", "50")),
+            )
+        return _tx_tracker
+
+async def _relay(cmd: str, args: list, data: dict):
+    """Run a relayed write. With `wait: false` in the body (or
+    RELAYER_WAIT=0) return the tx hash immediately and track the receipt
+    in the background; clients poll `/relay/tx/<hash>`."""
+    wait = data.get("wait", os.getenv("RELAYER_WAIT", "1") == "1")
+    if wait:
+        return jsonify({"result": await _run_node_async(cmd, args)})
+    out = await _run_node_async(cmd, [*args, "--no-wait"])
+    tx_hash = json.loads(out)["hash"]
+    record = _get_tx_tracker().track(tx_hash, cmd, address=data.get("address", ""))
+    return jsonify({
+        "result": out,
+        "hash": tx_hash,
+        "status_url": f"/relay/tx/{tx_hash}",
+        "tx": record,
+    }, 202)
+
+
+@route('/relay/nonce', methods=['POST'])
+async def relay_nonce(request):
+    data = await _body(request)
     address = data.get("address", "")
     if not address:
-        return jsonify({"error": "address required"}), 400
-    nonce = os.urandom(8).hex()
-    nonces[address] = nonce
+        return jsonify({"error": "address required"}, 400)
+    nonce = nonces.issue(address)
     return jsonify({"nonce": nonce, "timestamp": int(time.time())})
 
-@app.route('/health', methods=['GET', 'HEAD'])
-def health():
-    return jsonify({"ok": True}), 200
-
-
-@app.route('/create', methods=['POST'])
-def create():
-    data = request.json
-    res = run_async(contract.create_wager(
+@route('/relay/session', methods=['POST'])
+async def relay_session(request):
+    """Exchange one signed "session" message for a short-lived token that
+    later relay calls send as `session` instead of a nonce + signature."""
+    data = await _body(request)
+    _verify_signature(data, "session")
+    token, expires = relay_auth.issue_session(data.get("address", ""))
+    return jsonify({"session": token, "expires_at": expires})
+
+@route('/relay/metrics', methods=['GET'])
+async def relay_metrics(request):
+    if _relay_pool is None:
+        return jsonify({"started": False})
+    return jsonify({"started": True, **_relay_pool.metrics()})
+
+@route('/health', methods=['GET', 'HEAD'])
+async def health(request):
+    return jsonify({"ok": True})
+
+
+@route('/create', methods=['POST'])
+async def create(request):
+    data = await _body(request)
+    res = await contract.create_wager(
         prediction=data['prediction'],
         player_a=data['player_a'],
         stake_amount=float(data.get('stake_amount', 0)),
         deadline=data['deadline'],
         category=data.get('category'),
         verification_criteria=data.get('verification_criteria', ''),
-    ))
+    )
     return jsonify(res)
 
 
-@app.route('/accept', methods=['POST'])
-def accept():
-    data = request.json
-    res = run_async(contract.accept_wager(wager_id=data['wager_id'], player_b=data['player_b'], stance=data.get('stance')))
+@route('/accept', methods=['POST'])
+async def accept(request):
+    data = await _body(request)
+    res = await contract.accept_wager(wager_id=data['wager_id'], player_b=data['player_b'], stance=data.get('stance'))
     return jsonify(res)
 
 
-@app.route('/verify', methods=['POST'])
-def verify():
-    data = request.json
-    res = run_async(contract.verify_prediction(
+@route('/verify', methods=['POST'])
+async def verify(request):
+    data = await _body(request)
+    res = await contract.verify_prediction(
         wager_id=data['wager_id'],
         current_date=data.get('current_date'),
         mock_outcome=data.get('mock_outcome'),
-    ))
+    )
     return jsonify(res)
 
 
-@app.route('/appeal', methods=['POST'])
-def appeal():
-    data = request.json
-    res = run_async(contract.appeal_verification(
+@route('/appeal', methods=['POST'])
+async def appeal(request):
+    data = await _body(request)
+    res = await contract.appeal_verification(
         wager_id=data['wager_id'],
         appealing_player=data['appealing_player'],
         appeal_reason=data.get('appeal_reason', ''),
         current_date=data.get('current_date'),
         mock_outcome=data.get('mock_outcome'),
-    ))
+    )
     return jsonify(res)
 
 
-@app.route('/resolve', methods=['POST'])
-def resolve():
-    data = request.json
-    res = run_async(contract.resolve_wager(
+@route('/resolve', methods=['POST'])
+async def resolve(request):
+    data = await _body(request)
+    res = await contract.resolve_wager(
         wager_id=data['wager_id'],
         outcome=data['outcome'],
         winner=data['winner'],
         verification_data=data.get('verification_data', {}),
-    ))
+    )
     return jsonify(res)
 
-@app.route('/relay/create', methods=['POST'])
-def relay_create():
-    data = request.json or {}
-    _verify_signature(data, "create")
-    args = [
-        "--prediction", data["prediction"],
-        "--deadline", data["deadline"],
-        "--category", data.get("category", ""),
-        "--criteria", data["verification_criteria"],
-        "--stake", str(data.get("stake_amount", 0)),
-    ]
-    out = _run_node("create", args)
-    return jsonify({"result": out})
-
-@app.route('/relay/accept', methods=['POST'])
-def relay_accept():
-    data = request.json or {}
-    _verify_signature(data, "accept")
-    stance = data.get("stance", "disagree")
-    args = ["--wager", data["wager_id"], "--stake", str(data.get("stake_amount", 0)), "--stance", stance]
-    out = _run_node("accept", args)
-    return jsonify({"result": out})
-
-@app.route('/relay/verify', methods=['POST'])
-def relay_verify():
-    data = request.json or {}
-    _verify_signature(data, "verify")
-    args = ["--wager", data["wager_id"], "--evidence-url", data.get("evidence_url", "")]
-    out = _run_node("verify", args)
-    return jsonify({"result": out})
-
-@app.route('/relay/appeal', methods=['POST'])
-def relay_appeal():
-    data = request.json or {}
-    _verify_signature(data, "appeal")
-    args = [
-        "--wager", data["wager_id"],
-        "--reason", data.get("appeal_reason", ""),
-        "--evidence-url", data.get("evidence_url", ""),
-    ]
-    out = _run_node("appeal", args)
-    return jsonify({"result": out})
-
-@app.route('/relay/resolve', methods=['POST'])
-def relay_resolve():
-    data = request.json or {}
-    _verify_signature(data, "resolve")
-    args = ["--wager", data["wager_id"]]
-    out = _run_node("resolve", args)
-    return jsonify({"result": out})
-
-@app.route('/relay/username', methods=['POST'])
-def relay_username():
-    data = request.json or {}
-    _verify_signature(data, "username")
-    args = ["--username", data["username"]]
-    out = _run_node("username", args)
-    return jsonify({"result": out})
-
-
-@app.route('/aggregate_and_submit', methods=['POST'])
-def aggregate_and_submit_endpoint():
+@route('/pool/create', methods=['POST'])
+async def create_pool(request):
+    data = await _body(request)
+    res = await contract.create_pool(
+        prediction=data['prediction'],
+        player=data['player'],
+        stake_amount=float(data.get('stake_amount', 0)),
+        deadline=data['deadline'],
+        category=data.get('category'),
+        verification_criteria=data.get('verification_criteria', ''),
+        stance=data.get('stance', 'agree'),
+    )
+    return jsonify(res)
+
+
+@route('/pool/join', methods=['POST'])
+async def join_pool(request):
+    data = await _body(request)
+    res = await contract.join_pool(
+        wager_id=data['wager_id'],
+        player=data['player'],
+        stake_amount=float(data.get('stake_amount', 0)),
+        stance=data.get('stance'),
+    )
+    return jsonify(res)
+
+
+@route('/due', methods=['GET'])
+async def due(request):
+    """Accepted, unresolved wagers past their deadline (earliest first)."""
+    limit = min(int(request.query_params.get("limit", "100")), 1000)
+    ids = contract.due_wagers(request.query_params.get("now"), limit)
+    upcoming = contract.next_deadline()
+    return jsonify({"due": ids, "next_deadline": upcoming.isoformat() if upcoming else None})
+
+def _relay_args(action: str, data: dict) -> list:
+    """CLI arguments for a relayed write, from the request body fields."""
+    if action == "create":
+        return [
+            "--prediction", data["prediction"],
+            "--deadline", data["deadline"],
+            "--category", data.get("category", ""),
+            "--criteria", data["verification_criteria"],
+            "--stake", str(data.get("stake_amount", 0)),
+        ]
+    if action == "accept":
+        stance = data.get("stance", "disagree")
+        return ["--wager", data["wager_id"], "--stake", str(data.get("stake_amount", 0)), "--stance", stance]
+    if action == "verify":
+        return ["--wager", data["wager_id"], "--evidence-url", data.get("evidence_url", "")]
+    if action == "appeal":
+        return [
+            "--wager", data["wager_id"],
+            "--reason", data.get("appeal_reason", ""),
+            "--evidence-url", data.get("evidence_url", ""),
+        ]
+    if action == "pool":
+        return [
+            "--prediction", data["prediction"],
+            "--deadline", data["deadline"],
+            "--category", data.get("category", ""),
+            "--criteria", data["verification_criteria"],
+            "--stake", str(data.get("stake_amount", 0)),
+            "--stance", data.get("stance", "agree"),
+        ]
+    if action == "join":
+        stance = data.get("stance", "disagree")
+        return ["--wager", data["wager_id"], "--stake", str(data.get("stake_amount", 0)), "--stance", stance]
+    if action == "resolve":
+        return ["--wager", data["wager_id"]]
+    if action == "username":
+        return ["--username", data["username"]]
+    raise Exception(f"Unknown action: {action}")
+
+RELAY_ACTIONS = ("create", "accept", "pool", "join", "verify", "appeal", "resolve", "username")
+
+async def _relay_action(request, action: str):
+    data = await _body(request)
+    _verify_signature(data, action)
+    return await _relay(action, _relay_args(action, data), data)
+
+@route('/relay/create', methods=['POST'])
+async def relay_create(request):
+    return await _relay_action(request, "create")
+
+@route('/relay/accept', methods=['POST'])
+async def relay_accept(request):
+    return await _relay_action(request, "accept")
+
+@route('/relay/pool', methods=['POST'])
+async def relay_pool(request):
+    return await _relay_action(request, "pool")
+
+@route('/relay/join', methods=['POST'])
+async def relay_join(request):
+    return await _relay_action(request, "join")
+
+@route('/relay/verify', methods=['POST'])
+async def relay_verify(request):
+    return await _relay_action(request, "verify")
+
+@route('/relay/appeal', methods=['POST'])
+async def relay_appeal(request):
+    return await _relay_action(request, "appeal")
+
+@route('/relay/resolve', methods=['POST'])
+async def relay_resolve(request):
+    return await _relay_action(request, "resolve")
+
+@route('/relay/username', methods=['POST'])
+async def relay_username(request):
+    return await _relay_action(request, "username")
+
+@route('/relay/batch', methods=['POST'])
+async def relay_batch(request):
+    """Submit an ordered list of actions under one signature (or session).
+
+    Body: `{"address", <signature or session fields>, "actions": [{"action":
+    "resolve", "wager_id": ...}, ...]}`. The message is signed with action
+    "batch". Every write goes through one relayer client without waiting for
+    receipts, so the account nonces are pipelined; submission stops at the
+    first failure and later actions are reported as skipped. All hashes are
+    tracked together; poll them with `GET /relay/txs?hashes=...`.
+    """
+    data = await _body(request)
+    actions = data.get("actions") or []
+    limit = int(os.getenv("RELAYER_BATCH_MAX", "25"))
+    if not isinstance(actions, list) or not actions:
+        return jsonify({"error": "actions required"}, 400)
+    if len(actions) > limit:
+        return jsonify({"error": f"At most {limit} actions per batch"}, 400)
+    items = []
+    for n, item in enumerate(actions):
+        action = item.get("action") if isinstance(item, dict) else None
+        if action not in RELAY_ACTIONS:
+            return jsonify({"error": f"actions[{n}]: unknown action {action!r}"}, 400)
+        try:
+            items.append([action, _relay_args(action, item)])
+        except KeyError as e:
+            return jsonify({"error": f"actions[{n}]: missing {e.args[0]}"}, 400)
+    _verify_signature(data, "batch")
+
+    out = json.loads(await _run_node_async("batch", ["--actions", json.dumps(items)]))
+    tracker = _get_tx_tracker()
+    address = data.get("address", "")
+    results = []
+    for n, (action, _args) in enumerate(items):
+        entry = out[n] if n < len(out) else None
+        if entry is None:
+            results.append({"action": action, "skipped": True})
+        elif "hash" in entry:
+            tx_hash = entry["hash"]
+            results.append({
+                "action": action,
+                "hash": tx_hash,
+                "status_url": f"/relay/tx/{tx_hash}",
+                "tx": tracker.track(tx_hash, action, address=address, batch_index=n),
+            })
+        else:
+            results.append({"action": action, "error": entry.get("error", "Relayer failed")})
+    submitted = [r["hash"] for r in results if "hash" in r]
+    return jsonify({
+        "results": results,
+        "submitted": len(submitted),
+        "status_url": "/relay/txs?hashes=" + ",".join(submitted),
+    }, 202)
+
+_TX_HASH = re.compile(r"^0x[0-9a-fA-F]{64}$")
+
+async def _tracked(hashes: list) -> dict:
+    """Tracker records for ``hashes``. Hashes submitted through another web
+    worker (WEB_CONCURRENCY > 1) are fetched once and tracked here too;
+    malformed hashes and hashes the node does not know map to None."""
+    tracker = _get_tx_tracker()
+    records = {h: tracker.get(h) for h in hashes}
+    missing = [h for h, r in records.items() if r is None and _TX_HASH.match(h)]
+    if missing:
+        try:
+            statuses = await run_in_threadpool(_fetch_tx_statuses, missing)
+        except Exception:
+            statuses = {}
+        for h in missing:
+            update = statuses.get(h) or {}
+            if update.get("transaction") and update.get("status") not in (None, "", "UNKNOWN"):
+                records[h] = tracker.adopt(h, update)
+    return records
+
+@route('/relay/txs', methods=['GET'])
+async def relay_txs_status(request):
+    hashes = [h for h in request.query_params.get("hashes", "").split(",") if h]
+    return jsonify(await _tracked(hashes))
+
+@route('/relay/tx/{tx_hash}', methods=['GET'])
+async def relay_tx_status(request):
+    tx_hash = request.path_params["tx_hash"]
+    record = (await _tracked([tx_hash]))[tx_hash]
+    if record is None:
+        return jsonify({"error": "Unknown transaction"}, 404)
+    return jsonify(record)
+
+@route('/relay/tx/{tx_hash}/events', methods=['GET'])
+async def relay_tx_events(request):
+    tx_hash = request.path_params["tx_hash"]
+    tracker = _get_tx_tracker()
+    record = (await _tracked([tx_hash]))[tx_hash]
+    if record is None:
+        return jsonify({"error": "Unknown transaction"}, 404)
+
+    async def stream(record):
+        # Records live in memory, so polling them is cheap.
+        yield f"data: {json.dumps(record)}\n\n"
+        idle = 0.0
+        while not record["done"]:
+            await asyncio.sleep(0.25)
+            update = tracker.get(tx_hash)
+            if update is None:
+                return
+            if update["version"] == record["version"]:
+                idle += 0.25
+                if idle >= 15:
+                    idle = 0.0
+                    yield ": keep-alive\n\n"
+                continue
+            idle = 0.0
+            record = update
+            yield f"data: {json.dumps(record)}\n\n"
+
+    return StreamingResponse(stream(record), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def _get_index_store():
+    global _index_store
+    with _relay_pool_lock:
+        if _index_store is None:
+            path = os.getenv("INDEXER_DB")
+            if not path:
+                raise Exception("INDEXER_DB env not set")
+            from tools.indexer import IndexStore
+
+            _index_store = IndexStore(path)
+        return _index_store
+
+def _page_args(request, default_limit: int):
+    offset = max(0, int(request.query_params.get("offset", 0)))
+    limit = min(100, max(0, int(request.query_params.get("limit", default_limit))))
+    return offset, limit
+
+def _cached_api(request, build):
+    """Serve a read-model query, reusing the last answer until the indexer commits again."""
+    store = _get_index_store()
+    key = (request.url.path, tuple(sorted(request.query_params.items())))
+    version = store.data_version()
+    hit = _api_cache.get(key)
+    if hit is not None and hit[0] == version:
+        return Response(hit[1], media_type="application/json")
+    body = json.dumps(build(store))
+    if len(_api_cache) >= _API_CACHE_SIZE:
+        _api_cache.clear()
+    _api_cache[key] = (version, body)
+    return Response(body, media_type="application/json")
+
+@route('/api/wagers', methods=['GET'])
+async def api_wagers(request):
+    offset, limit = _page_args(request, 20)
+    return _cached_api(request, lambda store: store.list_wagers(
+        status=request.query_params.get("status"),
+        player=request.query_params.get("player"),
+        category=request.query_params.get("category"),
+        offset=offset,
+        limit=limit,
+    ))
+
+@route('/api/players', methods=['GET'])
+async def api_players(request):
+    offset, limit = _page_args(request, 20)
+    return _cached_api(request, lambda store: store.list_players(offset, limit))
+
+@route('/api/leaderboard', methods=['GET'])
+async def api_leaderboard(request):
+    offset, limit = _page_args(request, 10)
+    return _cached_api(request, lambda store: store.leaderboard(offset, limit))
+
+
+@route('/aggregate_and_submit', methods=['POST'])
+async def aggregate_and_submit_endpoint(request):
     """Aggregate validator votes (off-chain) and submit verification payload
     to the deployed contract via GenLayer RPC. Expects JSON:
       {"wager_id": "wager_123", "validators": 5, "appeal": false, "contract": "0x...", "current_date": "..."}
     Requires environment variables: `GENLAYER_RPC_URL` and `CONTRACT_ADDRESS` or pass `contract` in body.
     """
-    data = request.json
+    data = await _body(request)
     wager_id = data['wager_id']
     validators_count = int(data.get('validators', 5))
     appeal = bool(data.get('appeal', False))
@@ -234,12 +596,54 @@ def aggregate_and_submit_endpoint():
     from tools.aggregator import aggregate_and_submit
 
     try:
-        res = aggregate_and_submit(wager_id=wager_id, contract_address=contract_addr, validators=validators_count, appeal=appeal, current_date=current_date)
+        # Synchronous (runs its own event loop for the validator fan-out).
+        res = await run_in_threadpool(
+            aggregate_and_submit, wager_id=wager_id, contract_address=contract_addr,
+            validators=validators_count, appeal=appeal, current_date=current_date,
+        )
         return jsonify(res)
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jsonify({"error": str(e)}, 500)
+
+
+class _ScopedCORS:
+    """CORSMiddleware for the relayer endpoints only; the local contract and
+    read-model APIs stay same-origin."""
+
+    def __init__(self, app, paths=("/relay/", "/health"), **options):
+        self.app = app
+        self.paths = paths
+        self.cors = CORSMiddleware(app, **options)
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] == "http" and any(path == p or (p.endswith("/") and path.startswith(p)) for p in self.paths):
+            await self.cors(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_app):
+    yield
+    if _relay_pool is not None:
+        _relay_pool.close()
+    if _tx_tracker is not None:
+        _tx_tracker.stop()
+
+
+app = Starlette(
+    routes=routes,
+    # Allow browser calls to the relayer endpoints.
+    middleware=[Middleware(_ScopedCORS, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])],
+    exception_handlers={Exception: handle_exception, HTTPException: handle_exception},
+    lifespan=lifespan,
+)
 
 
 if __name__ == '__main__':
+    import uvicorn
+
     port = int(os.getenv("PORT", "5000"))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    # WEB_CONCURRENCY > 1 is for relay-only deployments (see `contract` above).
+    uvicorn.run("server:app", host="0.0.0.0", port=port, workers=int(os.getenv("WEB_CONCURRENCY", "1")))
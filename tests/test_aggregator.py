@@ -0,0 +1,70 @@
+import asyncio
+import datetime
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_wager.verdict_cache import VerdictCache
+from tools import aggregator
+
+
+DEADLINE = datetime.datetime(2026, 12, 31)
+
+
+@pytest.fixture(autouse=True)
+def fresh_verdict_cache(monkeypatch):
+    monkeypatch.setattr(aggregator.verifier, "_verdict_cache", VerdictCache())
+
+
+def test_validators_run_concurrently_and_stop_at_quorum(monkeypatch):
+    started = []
+
+    async def fake_verify(**kwargs):
+        started.append(time.monotonic())
+        await asyncio.sleep(0.05 if len(started) <= 6 else 5)
+        return {"outcome": "YES", "confidence": 0.9, "evidence": "e"}
+
+    monkeypatch.setattr(aggregator.verifier, "verify_prediction_logic", fake_verify)
+    t0 = time.monotonic()
+    res = aggregator.aggregate_votes("p", "c", DEADLINE, validators=11, concurrency=6)
+    assert time.monotonic() - t0 < 1.0
+    assert res["outcome"] == "YES"
+    assert res["votes"]["YES"] == 6
+    assert res["validators_completed"] == 6
+    assert res["validators_used"] == 11
+
+
+def test_timeouts_and_failures_vote_no(monkeypatch):
+    calls = {"n": 0}
+
+    async def fake_verify(**kwargs):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("boom")
+        await asyncio.sleep(1)
+        return {"outcome": "YES", "confidence": 0.9}
+
+    monkeypatch.setattr(aggregator.verifier, "verify_prediction_logic", fake_verify)
+    res = aggregator.aggregate_votes("p", "c", DEADLINE, validators=3, timeout=0.05)
+    assert res["outcome"] == "NO"
+    assert res["votes"] == {"YES": 0, "NO": 2}
+    assert res["evidence"] in ("verifier-failed", "verifier-timeout")
+
+
+def test_rounds_are_shared_across_identical_predictions(monkeypatch):
+    calls = []
+
+    async def fake_verify(**kwargs):
+        calls.append(kwargs["prediction"])
+        return {"outcome": "YES", "confidence": 0.9, "evidence": "e"}
+
+    monkeypatch.setattr(aggregator.verifier, "verify_prediction_logic", fake_verify)
+    first = aggregator.aggregate_votes("BTC will reach $100k", "cmc", DEADLINE, validators=3)
+    again = aggregator.aggregate_votes("  btc will reach $100K.", "CMC", DEADLINE + datetime.timedelta(minutes=5), validators=3)
+    assert again == first and len(calls) == 3
+    aggregator.aggregate_votes("BTC will reach $100k", "cmc", DEADLINE + datetime.timedelta(days=2), validators=3)
+    assert len(calls) == 6
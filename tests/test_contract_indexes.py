@@ -0,0 +1,307 @@
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture
+def contract(monkeypatch):
+    # The contract falls back to local stand-ins when the GenLayer runtime is
+    # absent; an empty ``genlayer`` module is enough to take that path.
+    monkeypatch.setitem(sys.modules, "genlayer", types.ModuleType("genlayer"))
+    spec = importlib.util.spec_from_file_location("prediction_wager_contract", os.path.join(ROOT, "contracts", "prediction_wager.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+
+    def as_sender(addr):
+        mod.gl.message.sender_address = mod.Address(addr)
+
+    def at_time(iso):
+        mod.gl.message_raw = {"datetime": iso}
+
+    c = mod.PredictionWager()
+    c.as_sender = as_sender
+    c.at_time = at_time
+    c.runtime = mod.gl
+    return c
+
+
+def _finalize(c, wager_id, outcome):
+    c._classify_outcome = lambda **_kw: f"{outcome}|"
+    c.submit_verification(wager_id)
+    c.submit_appeal(wager_id, "final")
+
+
+def test_player_status_and_category_indexes(contract):
+    c = contract
+    c.as_sender("0xa")
+    c.create_wager("p1", 10, "2026-01-01", "crypto", "crit")
+    c.create_wager("p2", 10, "2026-01-01", "sports", "crit")
+    c.create_wager("p3", 10, "2026-01-01", "crypto", "crit")
+    w1, w2, w3 = c.list_wagers(0, 3)
+
+    c.as_sender("0xb")
+    c.accept_wager(w1)
+    c.accept_wager(w3)
+
+    assert [w["id"] for w in c.list_wagers_by_player("0xa", 0, 10)] == [w1, w2, w3]
+    assert [w["id"] for w in c.list_wagers_by_player("0xb", 0, 10)] == [w1, w3]
+    assert [w["id"] for w in c.list_wagers_by_player("0xa", 1, 1)] == [w2]
+    assert [w["id"] for w in c.list_wagers_by_category("crypto", 0, 10)] == [w1, w3]
+    assert [w["id"] for w in c.list_wagers_by_status("waiting", 0, 10)] == [w2]
+    assert sorted(w["id"] for w in c.list_wagers_by_status("active", 0, 10)) == [w1, w3]
+
+    _finalize(c, w1, "YES")
+    c.resolve_wager(w1)
+    assert [w["id"] for w in c.list_wagers_by_status("active", 0, 10)] == [w3]
+    resolved = c.list_wagers_by_status("resolved", 0, 10)
+    assert [w["id"] for w in resolved] == [w1] and resolved[0]["status"] == "resolved"
+    assert c.list_wagers_by_status("verified", 0, 10) == []
+    assert c.get_index_counts("0xb", "resolved", "sports") == {"player": 2, "status": 1, "category": 1}
+
+
+def test_leaderboard_matches_full_sort(contract):
+    c = contract
+    players = ["0x%02x" % i for i in range(6)]
+    outcomes = ["YES", "NO", "YES", "YES", "NO", "YES", "NO"]
+    for n, outcome in enumerate(outcomes):
+        c.as_sender(players[n % 6])
+        c.create_wager(f"p{n}", 10 + n, "2026-01-01", "misc", "crit")
+        wager_id = c.get_last_wager_id()
+        c.as_sender(players[(n * 5 + 1) % 6])
+        c.accept_wager(wager_id)
+        _finalize(c, wager_id, outcome)
+        c.resolve_wager(wager_id)
+    c.as_sender("0xff")
+    c.set_username("late")
+
+    expected = []
+    for addr in c.list_players(0, 100):
+        s = c.get_player_stats(addr)
+        expected.append({
+            "address": addr,
+            "username": s["username"],
+            "wins": s["wins"],
+            "losses": s["losses"],
+            "volume_won": s["volume_won"],
+            "volume_contributed": s["volume_contributed"],
+        })
+    expected.sort(key=lambda e: (-e["wins"], -e["volume_won"], -e["volume_contributed"], e["address"]))
+
+    assert c.get_leaderboard(0, 100) == expected
+    assert c.get_leaderboard(2, 3) == expected[2:5]
+
+
+def test_batch_views(contract):
+    c = contract
+    c.as_sender("0xa")
+    c.create_wager("p1", 10, "2026-01-01", "crypto", "crit")
+    c.create_wager("p2", 10, "2026-01-01", "crypto", "crit")
+    w1, w2 = c.list_wagers(0, 2)
+
+    assert c.get_wagers([w1, "missing"]) == {w1: c.get_wager(w1), "missing": None}
+    assert c.get_statuses([w2]) == {w2: c.get_status(w2)}
+    assert c.get_player_stats_batch(["0xa", "0xz"])["0xz"]["wins"] == 0
+    assert c.list_wagers_full(1, 5) == [c.get_wager(w2)]
+    with pytest.raises(Exception):
+        c.get_statuses(["x"] * 101)
+    assert len(c.list_wagers_by_category("crypto", 0, 100)) == 2
+    for view in (c.list_wagers_by_player, c.list_wagers_by_status, c.list_wagers_by_category):
+        with pytest.raises(Exception, match="At most"):
+            view("crypto", 0, 101)
+
+
+def test_change_log(contract):
+    c = contract
+    c.as_sender("0xa")
+    c.create_wager("p1", 10, "2026-01-01", "crypto", "crit")
+    w1 = c.get_last_wager_id()
+    c.as_sender("0xb")
+    c.accept_wager(w1)
+    _finalize(c, w1, "YES")
+
+    page = c.get_changes_since(0, 2)
+    assert [(e["seq"], e["status"]) for e in page["changes"]] == [(0, "waiting"), (1, "active")]
+    assert page["next"] == 2 and page["latest"] == 4
+    rest = c.get_changes_since(page["next"], 10)
+    assert [e["status"] for e in rest["changes"]] == ["verified", "verified"]
+    assert c.get_changes_since(rest["next"], 10) == {"changes": [], "next": 4, "latest": 4}
+
+
+def test_classification_is_reused_across_duplicate_wagers(contract):
+    c = contract
+    calls = []
+
+    def classify(**kw):
+        calls.append(kw["appeal_reason"])
+        return "YES|abc"
+
+    c._classify_outcome = classify
+    c.at_time("2026-02-01T00:00:00")
+    c.as_sender("0xa")
+    for criteria in ("https://cmc.test/btc", "https://cmc.test/btc", "https://other.test"):
+        c.create_wager("BTC > 100k", 10, "2026-01-01", "crypto", criteria)
+    w1, w2, w3 = c.list_wagers(0, 3)
+    c.as_sender("0xb")
+    for w in (w1, w2, w3):
+        c.accept_wager(w)
+
+    c.submit_verification(w1)
+    c.submit_verification(w2)
+    assert len(calls) == 1
+    assert c.get_wager(w2)["verification_result"]["evidence"] == "url=https://cmc.test/btc; sha256=abc"
+    c.submit_verification(w3)
+    c.submit_appeal(w1, "recheck")
+    assert calls == ["", "", "recheck"]
+
+    c.at_time("2026-02-01T00:11:00")
+    c.submit_appeal(w2, "recheck")
+    assert len(calls) == 4
+
+    # New appeal reasoning is classified again; expired entries are evicted.
+    c.submit_appeal(w2, "the page was updated after the deadline")
+    assert len(calls) == 5
+    assert len(c.classification_cache) == 2
+
+
+def test_classification_cache_is_bounded(contract, monkeypatch):
+    c = contract
+    monkeypatch.setitem(c._evict_classifications.__globals__, "CLASSIFICATION_CACHE_MAX", 3)
+    c._classify_outcome = lambda **_kw: "YES|"
+    c.at_time("2026-02-01T00:00:00")
+    c.as_sender("0xa")
+    for n in range(5):
+        c.create_wager(f"p{n}", 10, "2026-01-01", "crypto", "crit")
+    c.as_sender("0xb")
+    for w in c.list_wagers(0, 5):
+        c.accept_wager(w)
+        c.submit_verification(w)
+    assert len(c.classification_cache) == 3
+    assert int(c.classification_tail - c.classification_head) == 3
+
+
+def test_resolve_wagers_merges_stats_and_skips_ineligible(contract):
+    c = contract
+    ids = []
+    for n in range(3):
+        c.as_sender("0xa")
+        c.create_wager(f"p{n}", 10, "2026-01-01", "sports", "crit")
+        ids.append(c.get_last_wager_id())
+        c.as_sender("0xb")
+        c.accept_wager(ids[-1])
+        if n < 2:
+            _finalize(c, ids[-1], "YES")
+    pays = []
+    c._pay = lambda addr, value: pays.append((addr, int(value)))
+
+    summary = c.resolve_wagers([ids[0], ids[1], ids[2], "missing", ids[0]])
+    assert summary["resolved"] == ids[:2]
+    assert summary["skipped"] == {ids[2]: "No verification submitted", "missing": "Wager not found"}
+    assert summary["payouts"] == {"0xa": 40}
+    assert pays == [("0xa", 40)]
+
+    a, b = c.get_player_stats("0xa"), c.get_player_stats("0xb")
+    assert (a["wins"], a["volume_won"], b["losses"]) == (2, 40, 2)
+    assert [e["address"] for e in c.get_leaderboard(0, 2)] == ["0xa", "0xb"]
+    assert c.get_index_counts("0xa", "resolved", "sports")["status"] == 2
+
+
+def test_payout_transport_is_detected_once(contract):
+    c = contract
+    calls = []
+
+    class BrokenContractAt:
+        def __init__(self, _addr):
+            calls.append("contract_at")
+            raise RuntimeError("not supported")
+
+    c.runtime.ContractAt = BrokenContractAt
+    c.runtime.transfer = lambda to, value: calls.append(("transfer", str(to), int(value)))
+    for n in range(2):
+        c.as_sender("0xa")
+        c.create_wager(f"p{n}", 10, "2026-01-01", "misc", "crit")
+        wager_id = c.get_last_wager_id()
+        c.as_sender("0xb")
+        c.accept_wager(wager_id)
+        _finalize(c, wager_id, "NO")
+        c.resolve_wager(wager_id)
+
+    assert c.payout_transport == "transfer"
+    assert calls == ["contract_at", ("transfer", "0xb", 20), ("transfer", "0xb", 20)]
+
+
+def test_pool_settles_every_member_pro_rata(contract):
+    c = contract
+    c.as_sender("0xa")
+    c.create_pool("BTC > 100k", 30, "2026-01-01", "crypto", "crit", "agree")
+    pool = c.get_last_wager_id()
+    for addr, stance, stake in (("0xb", "agree", 10), ("0xc", "disagree", 25), ("0xd", "disagree", 15), ("0xb", "agree", 5)):
+        c.as_sender(addr)
+        c.join_pool(pool, stance, stake)
+    with pytest.raises(Exception):
+        c.join_pool(pool, "disagree", 1)
+
+    view = c.get_wager(pool)
+    assert view["pot"] == 85 and view["status"] == "active"
+    assert view["pool"] == {"agree_total": 45, "disagree_total": 40, "members": 4}
+    assert c.get_pool_position(pool, "0xb") == {"side": "agree", "stake": 15}
+    assert [m["address"] for m in c.list_pool_members(pool, 1, 10)] == ["0xb", "0xc", "0xd"]
+    assert [w["id"] for w in c.list_wagers_by_player("0xc", 0, 10)] == [pool]
+
+    _finalize(c, pool, "YES")
+    with pytest.raises(Exception):
+        c.join_pool(pool, "agree", 1)
+    summary = c.resolve_wagers([pool])
+    # 85 split 30:15 between the agree side; the rounding unit goes to the creator.
+    assert summary["payouts"] == {"0xa": 57, "0xb": 28}
+    assert c.get_player_stats("0xa")["wins"] == 1 and c.get_player_stats("0xd")["losses"] == 1
+    assert c.get_player_stats("0xb")["volume_contributed"] == 15
+
+
+def test_pool_with_empty_winning_side_refunds(contract):
+    c = contract
+    c.as_sender("0xa")
+    c.create_pool("p", 10, "2026-01-01", "misc", "crit", "agree")
+    pool = c.get_last_wager_id()
+    c.as_sender("0xb")
+    c.join_pool(pool, "agree", 20)
+    _finalize(c, pool, "NO")
+    assert c.resolve_wagers([pool])["payouts"] == {"0xa": 10, "0xb": 20}
+    assert c.get_player_stats("0xa")["losses"] == 0
+
+
+def test_compact_wager_records_keep_the_view_shape(contract):
+    c = contract
+    c.at_time("2026-01-01T00:00:00")
+    c.as_sender("0xa")
+    c.create_wager("p", 10, "2026-02-01", "crypto", "crit")
+    wid = c.get_last_wager_id()
+    assert wid == "wager_1"
+    # Verification storage is only written once a verification exists.
+    assert len(c.verifications) == 0
+    view = c.get_wager(wid)
+    assert view["status"] == "waiting" and view["player_a_stance"] == "agree"
+    assert view["deadline"] == "2026-02-01"
+    assert view["created_at"] == "2026-01-01T00:00:00"
+    assert view["resolved_at"] == "" and view["verification_result"] is None
+
+    c.as_sender("0xb")
+    # Ids minted before the compact layout resolve by their trailing counter.
+    c.accept_wager("wager_2025-12-31T10:00:00_1")
+    _finalize(c, wid, "NO")
+    c.at_time("2026-02-02T12:00:00")
+    c.resolve_wager(wid)
+    view = c.get_wager(wid)
+    assert view["player_b_stance"] == "disagree" and view["status"] == "resolved"
+    assert view["verification_result"]["is_final"] is True
+    assert view["resolved_at"] == "2026-02-02T12:00:00"
+    assert c.get_status(wid)["outcome"] == "NO"
+    assert c.get_wagers([wid, "wager_9", "bogus"])["wager_9"] is None
+    for alias in ("wager_junk_1", "wager_01", "wager_x_y_1", "wager_2026-01-01_1", "wager_", "wager_1_"):
+        with pytest.raises(Exception, match="Wager not found"):
+            c.get_wager(alias)
+    assert c.get_wager("wager_2026-01-01T00:00:00+00:00_1")["id"] == wid
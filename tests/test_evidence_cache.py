@@ -0,0 +1,56 @@
+import asyncio
+import hashlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_wager.evidence_cache import EvidenceCache, MemoryEvidenceStore, SQLiteEvidenceStore
+
+
+class FakeOrigin:
+    def __init__(self):
+        self.requests = []
+        self.text = "BTC $105,432"
+
+    async def fetch(self, url, headers):
+        self.requests.append(dict(headers))
+        await asyncio.sleep(0.01)
+        if headers.get("If-None-Match") == '"v1"':
+            return 304, "", {"ETag": '"v1"'}
+        return 200, self.text, {"ETag": '"v1"', "Last-Modified": "Wed, 30 Dec 2026 00:00:00 GMT"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_fetch_and_record_digest():
+    origin = FakeOrigin()
+    cache = EvidenceCache(bucket_seconds=3600)
+    results = await asyncio.gather(*[cache.get("https://cmc.test/btc", origin.fetch) for _ in range(10)])
+    assert len(origin.requests) == 1
+    assert {r.sha256 for r in results} == {hashlib.sha256(origin.text.encode()).hexdigest()}
+
+    await cache.get("https://cmc.test/btc", origin.fetch)
+    assert len(origin.requests) == 1
+    assert cache.stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_bucket_revalidates_and_disk_store_survives(tmp_path):
+    origin = FakeOrigin()
+    path = str(tmp_path / "evidence.sqlite")
+    cache = EvidenceCache(bucket_seconds=3600, disk=SQLiteEvidenceStore(path))
+    first = await cache.get("https://cmc.test/btc", origin.fetch)
+
+    # Age the entry into an older bucket: next lookup sends validators and gets a 304.
+    cache.store(first.__class__(**{**first.__dict__, "bucket": first.bucket - 1}))
+    again = await cache.get("https://cmc.test/btc", origin.fetch)
+    assert origin.requests[-1]["If-None-Match"] == '"v1"'
+    assert again.text == origin.text and again.bucket == first.bucket
+    assert cache.stats["revalidated"] == 1
+
+    # A fresh process with an empty memory LRU reads it back from SQLite.
+    other = EvidenceCache(bucket_seconds=3600, memory=MemoryEvidenceStore(), disk=SQLiteEvidenceStore(path))
+    assert (await other.get("https://cmc.test/btc", origin.fetch)).sha256 == first.sha256
+    assert len(origin.requests) == 2
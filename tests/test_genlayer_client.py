@@ -0,0 +1,180 @@
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import rlp
+from eth_abi import decode as abi_decode
+from eth_account import Account
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools.genlayer_client import (
+    GenLayerClient,
+    decode_calldata,
+    encode_calldata,
+    run_command,
+)
+
+
+CONTRACT = "0x" + "ab" * 20
+CONSENSUS = "0x" + "cd" * 20
+
+
+class StubNode:
+    """Minimal JSON-RPC node: enough of eth_* / gen_call for the client."""
+
+    def __init__(self):
+        self.sent = []
+        self.nonce = 7
+        self.calls = []
+
+    def handle(self, method, params):
+        self.calls.append(method)
+        if method == "eth_chainId":
+            return hex(61999)
+        if method == "sim_getConsensusContract":
+            return {"address": CONSENSUS, "abi": []}
+        if method == "eth_gasPrice":
+            return "0x0"
+        if method == "eth_estimateGas":
+            return hex(50000)
+        if method == "eth_getTransactionCount":
+            return hex(self.nonce)
+        if method == "eth_sendRawTransaction":
+            raw = bytes.fromhex(params[0][2:])
+            self.sent.append(raw)
+            return "0x" + str(len(self.sent)).zfill(64)
+        if method == "eth_getTransactionByHash":
+            return {"hash": params[0], "status": 5}
+        if method == "gen_call":
+            calldata, _leader_only = rlp.decode(bytes.fromhex(params[0]["data"][2:]))
+            call = decode_calldata(calldata)
+            return encode_calldata({"echo": call["method"], "args": call.get("args", [])}).hex()
+        raise KeyError(method)
+
+    def respond(self, req):
+        try:
+            return {"jsonrpc": "2.0", "id": req["id"], "result": self.handle(req["method"], req["params"])}
+        except KeyError:
+            return {"jsonrpc": "2.0", "id": req["id"], "error": {"code": -32601, "message": "Method not found"}}
+
+
+@pytest.fixture
+def node():
+    stub = StubNode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            out = [stub.respond(r) for r in body] if isinstance(body, list) else stub.respond(body)
+            data = json.dumps(out).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+
+def test_calldata_roundtrip():
+    assert encode_calldata(None) == b"\x00"
+    assert encode_calldata(True) == b"\x10"
+    assert encode_calldata(5) == b"\x29"
+    assert encode_calldata("a") == b"\x0c" + b"a"
+    value = {"method": "f", "args": [1, -2, "x", b"\x01", [True, None], {"b": 1, "a": 2}]}
+    assert decode_calldata(encode_calldata(value)) == value
+
+
+def test_read_contract(node):
+    client = GenLayerClient(node.url)
+    assert client.read_contract(CONTRACT, "get_status", ["w1"]) == {"echo": "get_status", "args": ["w1"]}
+
+
+def test_write_signs_and_uses_local_nonces(node):
+    acct = Account.create()
+    client = GenLayerClient(node.url, private_key=acct.key.hex())
+
+    out = run_command(client, CONTRACT, "create", [
+        "--prediction", "BTC > 100k", "--deadline", "2026-12-31", "--criteria", "cmc", "--stake", "10",
+    ])
+    assert out["receipt"]["statusName"] == "ACCEPTED"
+    second = run_command(client, CONTRACT, "resolve", ["--wager", "w1", "--no-wait"])
+    assert set(second) == {"hash"}
+
+    assert node.calls.count("eth_getTransactionCount") == 1
+    nonces = []
+    for raw in node.sent:
+        assert Account.recover_transaction(raw) == acct.address
+        nonces.append(rlp.decode(raw)[0])
+    assert [int.from_bytes(n, "big") for n in nonces] == [7, 8]
+
+    tx = rlp.decode(node.sent[0])
+    assert "0x" + tx[3].hex() == CONSENSUS
+    assert int.from_bytes(tx[4], "big") == 10
+    sender, recipient, _validators, _rotations, tx_data = abi_decode(
+        ["address", "address", "uint256", "uint256", "bytes"], tx[5][4:]
+    )
+    assert sender == acct.address.lower() and recipient == CONTRACT
+    call = decode_calldata(rlp.decode(tx_data)[0])
+    assert call == {"method": "create_wager", "args": ["BTC > 100k", 10, "2026-12-31", "", "cmc"]}
+
+
+def test_receipts_batch(node):
+    client = GenLayerClient(node.url)
+    out = run_command(client, CONTRACT, "receipts", ["--hashes", "0x1,0x2"])
+    assert {h: r["status"] for h, r in out.items()} == {"0x1": "ACCEPTED", "0x2": "ACCEPTED"}
+
+
+def test_batch_pipelines_writes_and_stops_at_first_failure(node):
+    client = GenLayerClient(node.url, private_key=Account.create().key.hex())
+    actions = [
+        ["resolve", ["--wager", "w1"]],
+        ["verify", ["--wager", "w2"]],
+        ["appeal", ["--wager", "w3"]],
+        ["resolve", ["--wager", "w4"]],
+    ]
+    out = run_command(client, CONTRACT, "batch", ["--actions", json.dumps(actions)])
+
+    assert [set(r) for r in out[:2]] == [{"hash"}, {"hash"}]
+    assert out[2] == {"error": "Missing --reason"} and len(out) == 3
+    assert [int.from_bytes(rlp.decode(raw)[0], "big") for raw in node.sent] == [7, 8]
+    assert "eth_getTransactionReceipt" not in node.calls
+
+
+def test_resolvemany_sends_one_transaction(node):
+    client = GenLayerClient(node.url, private_key=Account.create().key.hex())
+    out = run_command(client, CONTRACT, "resolvemany", ["--wagers", "w1,w2", "--no-wait"])
+    assert set(out) == {"hash"} and len(node.sent) == 1
+    _sender, _recipient, _validators, _rotations, tx_data = abi_decode(
+        ["address", "address", "uint256", "uint256", "bytes"], rlp.decode(node.sent[0])[5][4:]
+    )
+    assert decode_calldata(rlp.decode(tx_data)[0]) == {"method": "resolve_wagers", "args": [["w1", "w2"]]}
+
+
+def test_batch_read_commands_make_one_call():
+    calls = []
+
+    class FakeClient:
+        def read_contract(self, address, fn, args):
+            calls.append((fn, args))
+            return json.dumps({str(k): {"status": "waiting"} for k in args[0]})
+
+    out = run_command(FakeClient(), CONTRACT, "statuses", ["--wagers", "w1,w2"])
+    assert out == {"result": {"w1": {"status": "waiting"}, "w2": {"status": "waiting"}}}
+    run_command(FakeClient(), CONTRACT, "players", ["--addresses", CONTRACT])
+    assert [fn for fn, _ in calls] == ["get_statuses_json", "get_player_stats_batch_json"]
+    assert str(calls[1][1][0][0]) == CONTRACT
+    with pytest.raises(RuntimeError):
+        run_command(FakeClient(), CONTRACT, "getmany", [])
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools import genlayer_interact as gi
+
+
+def _positional_node(calls, state):
+    def post(payload):
+        calls.append(payload["params"])
+        params = payload["params"]
+        if isinstance(params, list) and state["accept"] == "positional":
+            return {"result": {"ok": params[1]}}
+        if isinstance(params, dict) and state["accept"] == "named" and "contract" in params:
+            return {"result": {"ok": params["method"]}}
+        return {"error": {"code": -32602, "message": "Unexpected parameter"}}
+    return post
+
+
+def test_call_contract_negotiates_shape_once_and_persists(monkeypatch, tmp_path):
+    calls = []
+    state = {"accept": "positional"}
+    cache_file = tmp_path / "shapes.json"
+    monkeypatch.setattr(gi, "GENLAYER_RPC_URL", "http://node.test")
+    monkeypatch.setattr(gi, "_post", _positional_node(calls, state))
+    monkeypatch.setattr(gi, "_shape_cache", {})
+    monkeypatch.setattr(gi, "_shape_cache_loaded", False)
+    monkeypatch.setenv("GENLAYER_RPC_SHAPE_CACHE", str(cache_file))
+
+    assert gi.call_contract("0xc", "get_wager", ["w1"]) == {"result": {"ok": "get_wager"}}
+    negotiated = len(calls)
+    assert negotiated > 50
+
+    assert gi.call_contract("0xc", "get_status", ["w1"]) == {"result": {"ok": "get_status"}}
+    assert len(calls) == negotiated + 1
+    assert json.loads(cache_file.read_text()) == {"http://node.test|gen_call": ["positional"]}
+
+    # A fresh process picks the shape up from disk.
+    monkeypatch.setattr(gi, "_shape_cache", {})
+    monkeypatch.setattr(gi, "_shape_cache_loaded", False)
+    gi.call_contract("0xc", "get_status", ["w1"])
+    assert len(calls) == negotiated + 2
+
+    # Node switches schema: the cached shape is rejected and detection re-runs.
+    state["accept"] = "named"
+    assert gi.call_contract("0xc", "get_wager", ["w1"]) == {"result": {"ok": "get_wager"}}
+    assert calls[-1] == {"contract": "0xc", "method": "get_wager", "args": ["w1"]}
+    assert gi._shape_cache["http://node.test|gen_call"] == ("named", "contract", "method", "args")
+
+
+def test_call_contract_keeps_shape_on_non_schema_error(monkeypatch):
+    calls = []
+    monkeypatch.setattr(gi, "GENLAYER_RPC_URL", "http://node.test")
+    monkeypatch.setattr(gi, "_shape_cache", {})
+    monkeypatch.setattr(gi, "_shape_cache_loaded", True)
+
+    def post(payload):
+        calls.append(payload["params"])
+        return {"error": {"code": -32000, "message": "Wager not found"}}
+
+    monkeypatch.setattr(gi, "_post", post)
+    res = gi.call_contract("0xc", "get_wager", ["nope"])
+    assert res["error"]["message"] == "Wager not found"
+    assert len(calls) == 1
+    gi.call_contract("0xc", "get_wager", ["nope"])
+    assert len(calls) == 2
+
+
+def test_argument_error_with_invalid_params_code_keeps_cached_shape(monkeypatch):
+    calls = []
+    key = "http://node.test|gen_call"
+    monkeypatch.setattr(gi, "GENLAYER_RPC_URL", "http://node.test")
+    monkeypatch.setattr(gi, "_shape_cache", {key: ("positional",)})
+    monkeypatch.setattr(gi, "_shape_cache_loaded", True)
+    monkeypatch.delenv("GENLAYER_RPC_SHAPE_CACHE", raising=False)
+
+    def post(payload):
+        calls.append(payload["params"])
+        return {"error": {"code": -32602, "message": "Invalid params: argument 1 is not an address"}}
+
+    monkeypatch.setattr(gi, "_post", post)
+    res = gi.call_contract("0xc", "get_player_stats", ["nope"])
+    assert res["error"]["code"] == -32602
+    assert calls == [["0xc", "get_player_stats", ["nope"]]]
+    assert gi._shape_cache[key] == ("positional",)
@@ -0,0 +1,139 @@
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+from starlette.testclient import TestClient
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from tools.indexer import Indexer, IndexStore
+
+
+@pytest.fixture
+def node(monkeypatch):
+    """The contract's dev fallback stands in for the RPC node."""
+    monkeypatch.setitem(sys.modules, "genlayer", types.ModuleType("genlayer"))
+    spec = importlib.util.spec_from_file_location("prediction_wager_contract", os.path.join(ROOT, "contracts", "prediction_wager.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    c = mod.PredictionWager()
+    c.calls = []
+
+    def as_sender(addr):
+        mod.gl.message.sender_address = mod.Address(addr)
+
+    def read(name, args):
+        c.calls.append(name)
+        return getattr(c, name)(*args)
+
+    c.as_sender = as_sender
+    c.read = read
+    return c
+
+
+def test_incremental_sync(node, tmp_path):
+    store = IndexStore(str(tmp_path / "index.sqlite3"))
+    indexer = Indexer(node.read, store, batch_size=2)
+
+    node.as_sender("0xa")
+    for n in range(3):
+        node.create_wager(f"p{n}", 10, "2026-01-01", "crypto" if n != 1 else "sports", "crit")
+    w0, w1, w2 = node.list_wagers(0, 3)
+    assert indexer.sync_once() == {"new": 3, "updated": 0, "players": 1}
+    assert [w["id"] for w in store.list_wagers(category="crypto")] == [w0, w2]
+
+    # Nothing changed: a change-log probe, no status polling or record fetches.
+    node.calls.clear()
+    assert indexer.sync_once() == {"new": 0, "updated": 0, "players": 0}
+    assert "get_changes_since_json" in node.calls
+    assert not {"get_wagers_json", "get_statuses_json", "list_wagers"} & set(node.calls)
+
+    node.as_sender("0xb")
+    node.accept_wager(w1)
+    node._classify_outcome = lambda **_kw: "NO|"
+    node.submit_verification(w1)
+    node.submit_appeal(w1, "final")
+    node.resolve_wager(w1)
+    assert indexer.sync_once() == {"new": 0, "updated": 1, "players": 2}
+
+    assert [w["id"] for w in store.list_wagers(status="resolved")] == [w1]
+    assert [w["id"] for w in store.list_wagers(player="0xB")] == [w1]
+    assert store.leaderboard(0, 10) == node.get_leaderboard(0, 10)
+    assert w1 not in store.open_wagers()
+
+
+def test_api_endpoints_serve_read_model(node, tmp_path, monkeypatch):
+    import server
+
+    path = str(tmp_path / "index.sqlite3")
+    node.as_sender("0xa")
+    node.create_wager("p", 10, "2026-01-01", "crypto", "crit")
+    Indexer(node.read, IndexStore(path)).sync_once()
+
+    monkeypatch.setenv("INDEXER_DB", path)
+    monkeypatch.setattr(server, "_index_store", None)
+    monkeypatch.setattr(server, "_api_cache", {})
+    client = TestClient(server.app)
+
+    wagers = client.get("/api/wagers?status=waiting").json()
+    assert [w["prediction"] for w in wagers] == ["p"]
+    assert client.get("/api/leaderboard").json()[0]["address"] == "0xa"
+    assert client.get("/api/players?limit=5").json()[0]["volume_contributed"] == 10
+    assert len(server._api_cache) == 3
+
+
+def test_status_polling_without_change_log(node, tmp_path):
+    def read(name, args):
+        if name == "get_changes_since_json":
+            raise RuntimeError("Method not found")
+        return node.read(name, args)
+
+    store = IndexStore(str(tmp_path / "index.sqlite3"))
+    indexer = Indexer(read, store)
+    node.as_sender("0xa")
+    node.create_wager("p", 10, "2026-01-01", "crypto", "crit")
+    indexer.sync_once()
+
+    node.as_sender("0xb")
+    node.accept_wager(node.get_last_wager_id())
+    assert indexer.sync_once()["updated"] == 1
+    assert store.list_wagers()[0]["status"] == "active"
+
+
+def test_wagers_created_between_syncs_keep_their_order(node, tmp_path):
+    store = IndexStore(str(tmp_path / "index.sqlite3"))
+    indexer = Indexer(node.read, store, batch_size=2)
+    node.as_sender("0xa")
+    node.create_wager("p0", 10, "2026-01-01", "crypto", "crit")
+    indexer.sync_once()
+
+    for n in range(1, 4):
+        node.create_wager(f"p{n}", 10, "2026-01-01", "crypto", "crit")
+    assert indexer.sync_once() == {"new": 3, "updated": 0, "players": 1}
+    assert [w["prediction"] for w in store.list_wagers()] == ["p0", "p1", "p2", "p3"]
+    seqs = [r[0] for r in store._conn.execute("SELECT seq FROM wagers ORDER BY id")]
+    assert seqs == [0, 1, 2, 3]
+    assert indexer.sync_once() == {"new": 0, "updated": 0, "players": 0}
+
+
+def test_pool_members_stats_are_refreshed(node, tmp_path):
+    store = IndexStore(str(tmp_path / "index.sqlite3"))
+    indexer = Indexer(node.read, store, batch_size=2)
+    node.as_sender("0xa")
+    node.create_pool("p", 30, "2026-01-01", "crypto", "crit", "agree")
+    pool = node.get_last_wager_id()
+    for addr, stance in (("0xb", "agree"), ("0xc", "disagree"), ("0xd", "disagree")):
+        node.as_sender(addr)
+        node.join_pool(pool, stance, 10)
+    indexer.sync_once()
+
+    node._classify_outcome = lambda **_kw: "NO|"
+    node.submit_verification(pool)
+    node.submit_appeal(pool, "final")
+    node.resolve_wagers([pool])
+    assert indexer.sync_once() == {"new": 0, "updated": 1, "players": 4}
+    assert store.leaderboard(0, 10) == node.get_leaderboard(0, 10)
+    assert {p["address"]: p["wins"] for p in store.list_players(0, 10)} == {"0xa": 0, "0xb": 0, "0xc": 1, "0xd": 1}
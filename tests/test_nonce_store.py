@@ -0,0 +1,70 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools.nonce_store import MemoryNonceStore, SQLiteNonceStore
+
+
+def test_memory_store_ttl_and_cap(monkeypatch):
+    store = MemoryNonceStore(ttl=10, max_entries=3)
+    nonces = {f"0x{i}": store.issue(f"0x{i}") for i in range(5)}
+    assert len(store) == 3
+    assert not store.consume("0x0", nonces["0x0"])
+    assert store.consume("0X4", nonces["0x4"])
+    assert not store.consume("0x4", nonces["0x4"])
+
+    n = store.issue("0xa")
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() + 11)
+    assert not store.consume("0xa", n)
+
+
+def test_sqlite_store_is_shared_and_consumed_once(tmp_path):
+    path = str(tmp_path / "nonces.sqlite3")
+    issuer, workers = SQLiteNonceStore(path), [SQLiteNonceStore(path) for _ in range(4)]
+    nonce = issuer.issue("0xabc")
+    assert not workers[0].consume("0xabc", "wrong")
+
+    results = []
+    threads = [threading.Thread(target=lambda w=w: results.append(w.consume("0xABC", nonce))) for w in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(results) == [False, False, False, True]
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_signed_relay_consumes_nonce(kind, tmp_path, monkeypatch):
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+    from starlette.testclient import TestClient
+
+    import server
+
+    store = MemoryNonceStore() if kind == "memory" else SQLiteNonceStore(str(tmp_path / "n.sqlite3"))
+    monkeypatch.setattr(server, "nonces", store)
+
+    async def relayer(cmd, args):
+        return "{}"
+
+    monkeypatch.setattr(server, "_run_node_async", relayer)
+    acct = Account.create()
+    client = TestClient(server.app, raise_server_exceptions=False)
+    issued = client.post("/relay/nonce", json={"address": acct.address}).json()
+    msg = server._message("resolve", acct.address, issued["nonce"], issued["timestamp"])
+    body = {
+        "address": acct.address,
+        "nonce": issued["nonce"],
+        "timestamp": issued["timestamp"],
+        "signature": Account.sign_message(encode_defunct(text=msg), acct.key).signature.hex(),
+        "wager_id": "w1",
+    }
+    assert client.post("/relay/resolve", json=body).status_code == 200
+    replay = client.post("/relay/resolve", json=body)
+    assert replay.status_code == 500 and replay.json()["error"] == "Invalid nonce"
@@ -0,0 +1,58 @@
+import asyncio
+import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_wager import verifier
+from prediction_wager.price_history import PriceHistory, PriceSeries, to_epoch
+
+
+DAY = 86400
+T0 = to_epoch(datetime.datetime(2026, 12, 1))
+
+
+def _rows(closes, start=T0):
+    return [(start + i * DAY, c, c + 10, c - 10, c) for i, c in enumerate(closes)]
+
+
+def test_series_queries_and_merge():
+    s = PriceSeries()
+    s.extend(_rows([100, 300, 200, 150]))
+    assert s.price_at(T0 + DAY + 5) == (T0 + DAY, 300.0)
+    assert s.price_at(T0 - 1) is None
+    assert s.max_high(T0, T0 + 3 * DAY) == 310.0
+    assert s.max_high(T0 + 2 * DAY, T0 + 3 * DAY) == 210.0
+
+    # Overlapping refresh replaces candles and keeps ordering.
+    s.extend(_rows([500, 120], start=T0 + 3 * DAY))
+    assert list(s.ts) == [T0 + i * DAY for i in range(5)]
+    assert s.price_at(T0 + 3 * DAY)[1] == 500.0
+    assert s.max_high(T0 + 3 * DAY, T0 + 10 * DAY) == 510.0
+
+    assert list(PriceSeries.from_bytes(s.to_bytes()).close) == list(s.close)
+
+
+def test_verifier_uses_history_at_deadline(monkeypatch, tmp_path):
+    history = PriceHistory(str(tmp_path))
+    history.ingest("bitcoin", _rows([90000, 101000, 95000]))
+    monkeypatch.setattr(verifier, "_price_history", PriceHistory(str(tmp_path)))
+    monkeypatch.delenv("GENLAYER_RPC_URL", raising=False)
+
+    async def no_network(*_a, **_k):
+        raise AssertionError("network used")
+
+    monkeypatch.setattr(verifier, "_fetch_json", no_network)
+    deadline = datetime.datetime(2026, 12, 3, 12)
+
+    reach = asyncio.run(verifier.verify_prediction_logic(
+        prediction="Bitcoin will reach $100,000 by December 3, 2026",
+        verification_criteria="coinmarketcap", deadline=deadline))
+    assert reach["outcome"] == "YES"
+
+    close = asyncio.run(verifier.verify_prediction_logic(
+        prediction="Bitcoin closes at $100,000 or more on December 3, 2026",
+        verification_criteria="coinmarketcap", deadline=deadline))
+    assert close["outcome"] == "NO"
+    assert "95000" in close["evidence"]
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools import relay_auth
+
+
+def _sign(acct, message):
+    return Account.sign_message(encode_defunct(text=message), acct.key).signature.hex()
+
+
+def test_session_tokens(monkeypatch):
+    token, expires = relay_auth.issue_session("0xABC", ttl=60)
+    assert expires > time.time()
+    assert relay_auth.check_session(token, "0xabc")
+    assert not relay_auth.check_session(token, "0xdef")
+    assert not relay_auth.check_session(token[:-1] + ("0" if token[-1] != "0" else "1"), "0xabc")
+    assert not relay_auth.check_session("garbage", "0xabc")
+
+    expired, _ = relay_auth.issue_session("0xabc", ttl=-1)
+    assert not relay_auth.check_session(expired, "0xabc")
+
+
+def test_verify_signature():
+    a = Account.create()
+    assert relay_auth.verify_signature("m1", _sign(a, "m1"), a.address.lower())
+    assert not relay_auth.verify_signature("m2", _sign(a, "m1"), a.address)
+    assert not relay_auth.verify_signature("m1", "0x00", a.address)
+
+
+def test_relay_with_session_token(monkeypatch):
+    from starlette.testclient import TestClient
+
+    import server
+
+    async def relayer(cmd, args):
+        return "{}"
+
+    monkeypatch.setattr(server, "_run_node_async", relayer)
+    acct = Account.create()
+    client = TestClient(server.app, raise_server_exceptions=False)
+    issued = client.post("/relay/nonce", json={"address": acct.address}).json()
+    msg = server._message("session", acct.address, issued["nonce"], issued["timestamp"])
+    session = client.post("/relay/session", json={
+        "address": acct.address, "nonce": issued["nonce"], "timestamp": issued["timestamp"],
+        "signature": _sign(acct, msg),
+    }).json()["session"]
+
+    for wager in ("w1", "w2"):
+        resp = client.post("/relay/resolve", json={"address": acct.address, "session": session, "wager_id": wager})
+        assert resp.status_code == 200
+    other = client.post("/relay/resolve", json={"address": Account.create().address, "session": session, "wager_id": "w3"})
+    assert other.json()["error"] == "Invalid session"
@@ -0,0 +1,107 @@
+import os
+import sys
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools.relay_pool import RelayPool
+
+
+FAKE_WORKER = textwrap.dedent('''
+    import json, os, sys, time
+    for line in sys.stdin:
+        req = json.loads(line)
+        if req["cmd"] == "crash":
+            sys.stderr.write("boom\\n")
+            sys.stderr.flush()
+            os._exit(1)
+        if req["cmd"] == "slow":
+            time.sleep(0.5)
+        if req["cmd"] == "fail":
+            reply = {"id": req["id"], "ok": False, "error": "bad args"}
+        else:
+            print("noise from a library")
+            reply = {"id": req["id"], "ok": True,
+                     "output": json.dumps({"cmd": req["cmd"], "args": req["args"],
+                                         "key": os.environ.get("GENLAYER_PRIVATE_KEY"), "pid": os.getpid()})}
+        sys.stdout.write(json.dumps(reply) + "\\n")
+        sys.stdout.flush()
+''')
+
+
+@pytest.fixture
+def pool(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(FAKE_WORKER)
+    p = RelayPool(size=1, max_inflight=4, timeout=10, command=[sys.executable, str(script)])
+    yield p
+    p.close()
+
+
+def test_pool_reuses_worker_and_reports_metrics(pool):
+    first = pool.run("create", ["--stake", 5])
+    second = pool.run("resolve", ["--wager", "w1"])
+    assert '"args": ["--stake", "5"]' in first
+    assert first.split('"pid": ')[1] == second.split('"pid": ')[1]
+
+    with pytest.raises(RuntimeError, match="bad args"):
+        pool.run("fail", [])
+
+    m = pool.metrics()
+    assert m["submitted"] == 3
+    assert m["succeeded"] == 2
+    assert m["failed"] == 1
+    assert m["alive"] == 1
+    assert m["inflight"] == 0
+
+
+def test_pool_restarts_crashed_worker(pool):
+    with pytest.raises(RuntimeError, match="boom"):
+        pool.run("crash", [])
+    assert '"cmd": "get"' in pool.run("get", [])
+    assert pool.metrics()["restarts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_async_overlaps_requests(pool):
+    import asyncio
+
+    outs = await asyncio.gather(*(pool.run_async("get", ["--wager", f"w{i}"]) for i in range(6)))
+    assert [f'"w{i}"' in out for i, out in enumerate(outs)] == [True] * 6
+    assert pool.metrics()["succeeded"] == 6
+
+
+def test_pool_starts_one_worker_per_account(tmp_path):
+    script = tmp_path / "worker.py"
+    script.write_text(FAKE_WORKER)
+    envs = [{**os.environ, "GENLAYER_PRIVATE_KEY": key} for key in ("k1", "k2")]
+    p = RelayPool(size=1, timeout=10, command=[sys.executable, str(script)], envs=envs)
+    try:
+        assert p.size == 2
+        assert '"key": "k1"' in p.run("get", [])
+        assert p.metrics()["alive"] == 2
+    finally:
+        p.close()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_command_keeps_its_slot_until_the_reply(tmp_path):
+    import asyncio
+
+    script = tmp_path / "worker.py"
+    script.write_text(FAKE_WORKER)
+    p = RelayPool(size=1, max_inflight=1, acquire_timeout=0.1, command=[sys.executable, str(script)])
+    try:
+        with pytest.raises(RuntimeError, match="timed out"):
+            await p.run_async("slow", [], timeout=0.1)
+        # The slow command is still running on the worker.
+        with pytest.raises(RuntimeError, match="busy"):
+            await p.run_async("get", [])
+        assert p.metrics()["inflight"] == 1
+        await asyncio.sleep(0.6)
+        assert '"cmd": "get"' in await p.run_async("get", [])
+        assert p.metrics()["rejected"] == 1
+    finally:
+        p.close()
@@ -0,0 +1,69 @@
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_wager import verifier
+from prediction_wager.rules import ParsedPrediction, RuleContext, RuleRegistry
+
+
+def test_classify_single_scan_matches_overlapping_keywords():
+    names = [r.name for r in verifier.RULES.classify("official results on nba.com and twitter")]
+    assert names == ["nba", "social", "known_source"]
+    assert verifier.RULES.classify("ask my friend") == []
+
+
+def test_parsed_prediction_fields():
+    p = ParsedPrediction("Bitcoin will reach $100,000 by 2026", "see https://coingecko.com/x")
+    assert p.asset == "bitcoin"
+    assert p.threshold == 100000.0
+    assert p.year == 2026
+    assert p.subject == "Bitcoin"
+    assert p.url == "https://coingecko.com/x"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_falls_through_and_fetches_page_once():
+    fetched = []
+
+    async def fetch(url):
+        fetched.append(url)
+        return "nothing useful"
+
+    registry = RuleRegistry()
+
+    @registry.register("first", ("alpha",))
+    async def first(p, ctx):
+        await ctx.page()
+        return None
+
+    @registry.register("second", ("beta", "alpha"))
+    async def second(p, ctx):
+        return ctx.result("YES", 0.9, await ctx.page())
+
+    @registry.register("unmatched", ("gamma",))
+    async def unmatched(p, ctx):
+        raise AssertionError("should not run")
+
+    ctx = RuleContext(ParsedPrediction("X will win", "alpha http://e/1"), 3, fetch)
+    res = await registry.dispatch(ctx)
+    assert res == {"outcome": "YES", "confidence": 0.9, "evidence": "nothing useful", "validators": 3}
+    assert fetched == ["http://e/1"]
+
+
+@pytest.mark.asyncio
+async def test_no_page_fetch_without_matching_rule(monkeypatch):
+    monkeypatch.delenv("GENLAYER_RPC_URL", raising=False)
+
+    async def fail(url, *a, **kw):
+        raise AssertionError("unexpected fetch")
+
+    monkeypatch.setattr(verifier, "_fetch_text", fail)
+    res = await verifier.verify_prediction_logic(
+        prediction="Alice will finish the book", verification_criteria="ask Alice http://e/1",
+        deadline=datetime.datetime(2026, 1, 1),
+    )
+    assert res["evidence"] == "Unable to verify with simple verifier"
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+from starlette.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import server
+
+
+@pytest.fixture
+def client():
+    with TestClient(server.app, raise_server_exceptions=False) as c:
+        yield c
+
+
+def test_local_api_awaits_contract_directly(client):
+    created = client.post("/create", json={
+        "prediction": "Bitcoin will reach $100,000",
+        "player_a": "0xAlice",
+        "stake_amount": 100,
+        "deadline": "2026-12-31T23:59:59",
+        "category": "crypto",
+        "verification_criteria": "coinmarketcap",
+    }).json()
+    wager_id = created["wager_id"]
+    assert client.post("/accept", json={"wager_id": wager_id, "player_b": "0xBob"}).json()["total_pot"] == 200
+    verified = client.post("/verify", json={"wager_id": wager_id, "current_date": "2027-01-01", "mock_outcome": "YES"}).json()
+    assert verified["outcome"] == "YES"
+    assert wager_id in client.get("/due?now=2027-01-01T00:00:00").json()["due"]
+
+
+def test_errors_are_json(client):
+    resp = client.post("/accept", json={"wager_id": "missing", "player_b": "0xBob"})
+    assert resp.status_code == 500 and "error" in resp.json()
+    assert client.post("/relay/nonce", json={}).status_code == 400
+    assert client.get("/relay/tx/0xabc").status_code == 404
+
+
+def test_relay_calls_overlap(client, monkeypatch):
+    monkeypatch.setenv("RELAYER_REQUIRE_SIGNATURE", "0")
+
+    async def slow_relayer(cmd, args):
+        await asyncio.sleep(0.3)
+        return '{"hash": "0x1"}'
+
+    monkeypatch.setattr(server, "_run_node_async", slow_relayer)
+
+    async def burst():
+        import httpx
+
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            started = asyncio.get_running_loop().time()
+            replies = await asyncio.gather(*(ac.post("/relay/resolve", json={"wager_id": f"w{i}"}) for i in range(20)))
+            return replies, asyncio.get_running_loop().time() - started
+
+    replies, elapsed = asyncio.run(burst())
+    assert all(r.status_code == 200 for r in replies)
+    assert elapsed < 2
+
+
+def test_relay_batch_submits_once_and_tracks_all(client, monkeypatch):
+    monkeypatch.setenv("RELAYER_REQUIRE_SIGNATURE", "0")
+    calls = []
+
+    async def relayer(cmd, args):
+        calls.append((cmd, args))
+        return '[{"hash": "0x1"}, {"error": "boom"}]'
+
+    class Tracker:
+        records = {}
+
+        def track(self, tx_hash, action, **meta):
+            self.records[tx_hash] = {"hash": tx_hash, "action": action, **meta}
+            return self.records[tx_hash]
+
+        def get(self, tx_hash):
+            return self.records.get(tx_hash)
+
+    monkeypatch.setattr(server, "_run_node_async", relayer)
+    monkeypatch.setattr(server, "_get_tx_tracker", lambda: Tracker())
+    actions = [
+        {"action": "resolve", "wager_id": "w1"},
+        {"action": "appeal", "wager_id": "w2", "appeal_reason": "r"},
+        {"action": "username", "username": "x"},
+    ]
+    resp = client.post("/relay/batch", json={"address": "0xa", "actions": actions})
+
+    assert resp.status_code == 202
+    body = resp.json()
+    assert [cmd for cmd, _ in calls] == ["batch"]
+    assert json.loads(calls[0][1][1])[0] == ["resolve", ["--wager", "w1"]]
+    assert body["submitted"] == 1
+    assert body["results"][1] == {"action": "appeal", "error": "boom"}
+    assert body["results"][2] == {"action": "username", "skipped": True}
+    assert client.get(body["status_url"]).json()["0x1"]["batch_index"] == 0
+
+    bad = client.post("/relay/batch", json={"address": "0xa", "actions": [{"action": "drain"}]})
+    assert bad.status_code == 400 and len(calls) == 1
+
+
+def test_tx_submitted_by_another_worker_is_adopted(client, monkeypatch):
+    known, junk = "0x" + "fe" * 32, "0x" + "00" * 32
+    fetched = []
+
+    def fetch(hashes):
+        fetched.append(list(hashes))
+        # Shape of the Node `receipts` command before it reported missing
+        # transactions as errors.
+        return {h: {"status": "ACCEPTED", "transaction": {"hash": h}} if h == known
+                else {"status": "UNKNOWN", "transaction": None} for h in hashes}
+
+    monkeypatch.setattr(server, "_tx_tracker", None)
+    monkeypatch.setattr(server, "_fetch_tx_statuses", fetch)
+    record = client.get(f"/relay/tx/{known}").json()
+    assert record["status"] == "ACCEPTED" and record["done"] is True
+    # Adopted records are served from this worker's tracker afterwards.
+    assert client.get(f"/relay/txs?hashes={known},{junk}").json()[known]["status"] == "ACCEPTED"
+    assert client.get(f"/relay/tx/{junk}").status_code == 404
+    # Malformed hashes never reach the node.
+    assert client.get("/relay/tx/0xnotahash").status_code == 404
+    assert fetched == [[known], [junk], [junk]]
+    server._tx_tracker.stop()
+
+
+def test_cors_only_on_relay_and_health(client):
+    origin = {"Origin": "https://app.test"}
+    preflight = client.options("/relay/nonce", headers={**origin, "Access-Control-Request-Method": "POST"})
+    assert preflight.headers.get("access-control-allow-origin") == "*"
+    assert client.get("/health", headers=origin).headers.get("access-control-allow-origin") == "*"
+    assert "access-control-allow-origin" not in client.get("/due", headers=origin).headers
+    blocked = client.options("/create", headers={**origin, "Access-Control-Request-Method": "POST"})
+    assert "access-control-allow-origin" not in blocked.headers
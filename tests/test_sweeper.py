@@ -0,0 +1,112 @@
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from tools.indexer import Indexer, IndexStore
+from tools.sweeper import SweepLog, Sweeper
+
+
+@pytest.fixture
+def node(monkeypatch):
+    monkeypatch.setitem(sys.modules, "genlayer", types.ModuleType("genlayer"))
+    spec = importlib.util.spec_from_file_location("prediction_wager_contract", os.path.join(ROOT, "contracts", "prediction_wager.py"))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    c = mod.PredictionWager()
+    c._classify_outcome = lambda **_kw: "YES|"
+    c.submitted = []
+
+    def as_sender(addr):
+        mod.gl.message.sender_address = mod.Address(addr)
+
+    def submit(action, wager_id):
+        c.submitted.append((action, wager_id))
+        if action == "verify":
+            c.submit_verification(wager_id)
+        elif action == "appeal":
+            c.submit_appeal(wager_id, "auto")
+        else:
+            c.resolve_wager(wager_id)
+        return f"0x{len(c.submitted)}"
+
+    c.as_sender = as_sender
+    c.read = lambda name, args: getattr(c, name)(*args)
+    c.submit = submit
+    return c
+
+
+def _open(node, stake, deadline):
+    node.as_sender("0xa")
+    node.create_wager("p", stake, deadline, "misc", "crit")
+    wager_id = node.get_last_wager_id()
+    node.as_sender("0xb")
+    node.accept_wager(wager_id)
+    return wager_id
+
+
+def test_sweeps_expired_wagers_in_priority_order(node):
+    small = _open(node, 10, "2026-01-01")
+    big = _open(node, 50, "2026-01-01")
+    oldest = _open(node, 5, "2025-06-01")
+    _open(node, 99, "2099-01-01")
+    node.as_sender("0xa")
+    node.create_wager("unmatched", 10, "2020-01-01", "misc", "crit")
+
+    sweeper = Sweeper(node.submit, read=node.read, workers=1, rate=0, appeal_after=0)
+    planned = Sweeper(node.submit, read=node.read, dry_run=True).sweep_once()
+    assert [s["wager_id"] for s in planned] == [oldest, big, small] and node.submitted == []
+
+    for expected in ("verify", "appeal", "resolve"):
+        results = sweeper.sweep_once()
+        assert [(r["action"], r["wager_id"]) for r in results] == [(expected, w) for w in (oldest, big, small)]
+    assert sweeper.sweep_once() == []
+    assert node.get_status(big)["status"] == "resolved"
+
+
+def test_restart_does_not_resubmit_pending_steps(node, tmp_path):
+    wager_id = _open(node, 10, "2026-01-01")
+    state = str(tmp_path / "sweeper.sqlite3")
+    store = IndexStore(str(tmp_path / "index.sqlite3"))
+    Indexer(node.read, store).sync_once()
+    calls = []
+
+    def pending_submit(action, wager_id):
+        calls.append(action)
+        return "0xpending"
+
+    assert len(Sweeper(pending_submit, store=store, log=SweepLog(state)).sweep_once()) == 1
+    # A fresh process with the same state file sees the step as in flight.
+    assert Sweeper(pending_submit, store=store, log=SweepLog(state)).sweep_once() == []
+    assert calls == ["verify"]
+    assert SweepLog(state).get(wager_id, "verify")["hash"] == "0xpending"
+
+    def failing_submit(action, wager_id):
+        raise RuntimeError("node down")
+
+    retry = Sweeper(failing_submit, store=store, log=SweepLog(state), retry_after=0)
+    assert retry.sweep_once()[0]["error"] == "node down"
+    assert SweepLog(state).get(wager_id, "verify") is None
+
+
+def test_automatic_appeal_waits_for_the_grace_period(node):
+    wager_id = _open(node, 10, "2026-01-01")
+    clock = [2_000_000_000.0]
+    manual = Sweeper(node.submit, read=node.read, workers=1, rate=0, clock=lambda: clock[0])
+    assert [r["action"] for r in manual.sweep_once()] == ["verify"]
+    # Opt-in: without appeal_after a verified wager is left to the players.
+    assert manual.sweep_once() == []
+
+    log = SweepLog()
+    graced = Sweeper(node.submit, read=node.read, log=log, workers=1, rate=0,
+                     appeal_after=3600, clock=lambda: clock[0])
+    assert graced.sweep_once() == []
+    clock[0] += 3599
+    assert graced.sweep_once() == []
+    clock[0] += 1
+    assert [(r["action"], r["wager_id"]) for r in graced.sweep_once()] == [("appeal", wager_id)]
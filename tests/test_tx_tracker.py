@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools.tx_tracker import TxTracker
+
+
+def test_tracker_polls_pending_hashes_in_batches():
+    calls = []
+    statuses = {"0xa": {"status": "PENDING"}, "0xb": {"status": "PROPOSING"}}
+
+    def fetch(hashes):
+        calls.append(list(hashes))
+        return {h: statuses[h] for h in hashes}
+
+    t = TxTracker(fetch, interval=3600)
+    t.track("0xa", "create")
+    t.track("0xb", "accept")
+    t.stop()
+
+    assert t.poll_once() == 2
+    assert sorted(calls[0]) == ["0xa", "0xb"]
+    assert t.get("0xb")["status"] == "PROPOSING"
+
+    statuses["0xa"] = {"status": "ACCEPTED", "transaction": {"id": "0xa"}}
+    t.poll_once()
+    a = t.get("0xa")
+    assert a["done"] and a["status"] == "ACCEPTED"
+    assert a["transaction"] == {"id": "0xa"}
+
+    t.poll_once()
+    assert calls[-1] == ["0xb"]
+
+
+def test_tracker_times_out_and_reports_fetch_errors():
+    def fetch(hashes):
+        raise RuntimeError("rpc down")
+
+    t = TxTracker(fetch, interval=3600, max_wait=0)
+    rec = t.track("0xc", "resolve")
+    t.stop()
+    t.poll_once()
+    update = t.get("0xc")
+    assert update["version"] > rec["version"]
+    assert update["error"] == "rpc down"
+    assert update["status"] == "TIMEOUT"
+    assert update["done"]
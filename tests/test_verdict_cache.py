@@ -0,0 +1,71 @@
+import asyncio
+import datetime
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_wager import verifier
+from prediction_wager.contract import PredictionWagerContract
+from prediction_wager.verdict_cache import VerdictCache, verdict_key
+
+
+def test_key_normalizes_text_and_buckets_deadlines():
+    deadline = datetime.datetime(2026, 12, 31, 23, 0)
+    base = verdict_key("Bitcoin will reach $100,000.", "Check  CMC", "abc", deadline)
+    assert verdict_key("bitcoin will reach $100,000", "check cmc", "abc", "2026-12-31T23:59:00") == base
+    assert verdict_key("bitcoin will reach $100,000", "check cmc", "def", deadline) != base
+    assert verdict_key("bitcoin will reach $100,000", "check cmc", "abc", "2027-01-01T00:00:00") != base
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_computation_and_evict():
+    cache = VerdictCache(max_entries=2)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"outcome": "YES", "confidence": 0.9, "evidence": "e"}
+
+    results = await asyncio.gather(*[cache.get_or_compute("k", compute) for _ in range(5)])
+    assert len(calls) == 1 and all(r["outcome"] == "YES" for r in results)
+    assert await cache.get_or_compute("k", compute) == results[0] and len(calls) == 1
+
+    await cache.get_or_compute("fallback", compute, cacheable=lambda v: False)
+    assert cache.get("fallback") is None
+    cache.put("a", {})
+    cache.put("b", {})
+    assert cache.get("k") is None and len(cache) == 2
+
+    expired = VerdictCache(ttl=-1)
+    expired.put("k", {"outcome": "NO"})
+    assert expired.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_contract_verifications_share_verdicts(monkeypatch):
+    calls = []
+
+    async def fake_verify(**kwargs):
+        calls.append(kwargs["prediction"])
+        return {"outcome": "YES", "confidence": 0.9, "evidence": "cmc", "validators": kwargs["validators"]}
+
+    monkeypatch.setattr(verifier, "_verdict_cache", VerdictCache())
+    monkeypatch.setattr(verifier, "verify_prediction_logic", fake_verify)
+    c = PredictionWagerContract()
+    ids = []
+    for player in ("0xA", "0xB", "0xC"):
+        created = await c.create_wager(prediction="Bitcoin will reach $100,000", player_a=player, stake_amount=10,
+                                       deadline="2026-12-31T23:59:59", category="crypto",
+                                       verification_criteria="Check coinmarketcap for BTC price")
+        ids.append(created["wager_id"])
+        await c.accept_wager(wager_id=ids[-1], player_b="0xD")
+
+    verdicts = [await c.verify_prediction(wager_id=w, current_date="2027-01-01") for w in ids]
+    assert [v["outcome"] for v in verdicts] == ["YES"] * 3
+    appeal = await c.appeal_verification(wager_id=ids[0], appealing_player="0xD", appeal_reason="recheck",
+                                         current_date="2027-01-01")
+    assert appeal["is_final"] and len(calls) == 2
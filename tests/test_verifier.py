@@ -0,0 +1,74 @@
+import asyncio
+import datetime
+import os
+import sys
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from prediction_wager import verifier
+
+
+@pytest_asyncio.fixture
+async def evidence_server(monkeypatch):
+    monkeypatch.delenv("GENLAYER_RPC_URL", raising=False)
+    hits = []
+
+    async def page(request):
+        hits.append(request.path)
+        await asyncio.sleep(0.2)
+        return web.Response(text="The Boston Celtics won the 2026 NBA championship")
+
+    app = web.Application()
+    app.router.add_get("/{name}", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await verifier.aclose()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_verifications_overlap(evidence_server):
+    base, hits = evidence_server
+    kwargs = dict(
+        prediction="Boston Celtics will win the 2026 NBA championship",
+        deadline=datetime.datetime(2026, 6, 30),
+    )
+    t0 = time.monotonic()
+    results = await asyncio.gather(*[
+        verifier.verify_prediction_logic(verification_criteria=f"Check nba.com {base}/p{i}", **kwargs)
+        for i in range(5)
+    ])
+    assert time.monotonic() - t0 < 0.8
+    assert len(hits) == 5
+    assert all(r["outcome"] == "YES" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_price_threshold_falls_back_to_coingecko(monkeypatch):
+    monkeypatch.delenv("GENLAYER_RPC_URL", raising=False)
+    monkeypatch.delenv("PRICE_HISTORY_DIR", raising=False)
+    monkeypatch.setattr(verifier, "_price_history", None)
+    urls = []
+
+    async def fake_fetch_json(url, timeout=5):
+        urls.append(url)
+        return {"bitcoin": {"usd": 150000}}
+
+    monkeypatch.setattr(verifier, "_fetch_json", fake_fetch_json)
+    result = await verifier.verify_prediction_logic(
+        prediction="Bitcoin will reach $100,000",
+        verification_criteria="BTC price",
+        deadline=datetime.datetime(2026, 6, 30),
+    )
+    assert len(urls) == 1 and "coingecko" in urls[0]
+    assert result["outcome"] == "YES"
+    assert "$150000" in result["evidence"]
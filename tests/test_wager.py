@@ -35,3 +35,46 @@ async def test_full_flow_with_mock_outcome():
     resolved = await c.resolve_wager(wager_id=wid, outcome=verification["outcome"], winner=verification["winner"], verification_data=verification)
     assert resolved["winner"] == "0xAlice..."
     assert resolved["payout"] == 200
+
+
+@pytest.mark.asyncio
+async def test_deadline_index_returns_due_wagers_in_order():
+    c = PredictionWagerContract()
+    ids = {}
+    for name, deadline in (("late", "2026-12-31T00:00:00"), ("early", "2026-06-01T00:00:00"),
+                           ("mid", "2026-09-01T00:00:00"), ("future", "2030-01-01T00:00:00")):
+        created = await c.create_wager(prediction=name, player_a="0xA", stake_amount=1, deadline=deadline,
+                                       category=None, verification_criteria="")
+        ids[name] = created["wager_id"]
+        await c.accept_wager(wager_id=ids[name], player_b="0xB")
+    await c.create_wager(prediction="unmatched", player_a="0xA", stake_amount=1,
+                         deadline="2026-01-01T00:00:00", category=None, verification_criteria="")
+
+    assert c.due_wagers("2027-01-01T00:00:00") == [ids["early"], ids["mid"], ids["late"]]
+    assert c.due_wagers("2027-01-01T00:00:00", limit=1) == [ids["early"]]
+    assert c.next_deadline().isoformat() == "2026-06-01T00:00:00"
+
+    await c.resolve_wager(wager_id=ids["early"], outcome="YES", winner="0xA", verification_data={})
+    await c.resolve_wager(wager_id=ids["mid"], outcome="YES", winner="0xA", verification_data={})
+    assert c.due_wagers("2027-01-01T00:00:00") == [ids["late"]]
+    assert c.next_deadline().isoformat() == "2026-12-31T00:00:00"
+    assert len(c._deadlines) == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_pays_winning_side_pro_rata():
+    c = PredictionWagerContract()
+    created = await c.create_pool(prediction="Team X wins", player="0xA", stake_amount=30,
+                                  deadline="2026-12-31T23:59:59", category="sports", verification_criteria="espn")
+    wid = created["wager_id"]
+    await c.join_pool(wager_id=wid, player="0xB", stake_amount=10, stance="agree")
+    joined = await c.join_pool(wager_id=wid, player="0xC", stake_amount=60, stance="disagree")
+    assert joined == {"total_pot": 100, "agree_total": 40, "disagree_total": 60}
+    with pytest.raises(ValueError):
+        await c.join_pool(wager_id=wid, player="0xC", stake_amount=1, stance="agree")
+
+    verification = await c.verify_prediction(wager_id=wid, current_date="2027-01-01", mock_outcome="YES")
+    assert verification["winner"] == "agree"
+    resolved = await c.resolve_wager(wager_id=wid, outcome="YES", winner=verification["winner"], verification_data=verification)
+    assert resolved["payouts"] == {"0xA": 75, "0xB": 25}
+    assert c.due_wagers("2027-01-01T00:00:00") == []
@@ -3,6 +3,7 @@ import sys
 import json
 import requests
 import asyncio
+import concurrent.futures
 from typing import Optional
 
 # ensure local package imports work when run from workspace root
@@ -35,22 +36,85 @@ def call_contract_function(contract: str, fn_name: str, args: list):
     return send_genlayer_rpc(GENLAYER_RPC_METHOD, params)
 
 
-def aggregate_votes(prediction: str, verification_criteria: str, deadline, validators: int = 5):
+def _verify_in_process(prediction: str, verification_criteria: str, deadline) -> dict:
+    # Entry point for pooled validators; each call gets its own loop, so it
+    # also closes the verifier's HTTP session bound to that loop.
+    async def run():
+        try:
+            return await verifier.verify_prediction_logic(prediction=prediction, verification_criteria=verification_criteria, deadline=deadline, validators=1)
+        finally:
+            await verifier.aclose()
+
+    return asyncio.run(run())
+
+
+async def aggregate_votes_async(prediction: str, verification_criteria: str, deadline, validators: int = 5,
+                                concurrency: int = 10, timeout: float = 20.0, mode: str = "async"):
+    """Run `validators` simulated validators concurrently and tally their votes.
+
+    `mode` picks where each validator runs: "async" awaits the verifier on
+    this loop, "thread" and "process" offload it to a pool. At most
+    `concurrency` validators run at once and each gets `timeout` seconds; a
+    failed or timed-out validator votes NO. Returns as soon as the remaining
+    validators can no longer change the majority.
+
+    The tally is memoized in the verifier's verdict cache, so wagers with
+    the same prediction, criteria, evidence and deadline bucket share one
+    round; validators within a round still vote independently.
+    """
+    key = await verifier.verdict_key(prediction, verification_criteria, deadline)
+    return await verifier.get_verdict_cache().get_or_compute(
+        f"{key}:agg{validators}",
+        lambda: _aggregate(prediction, verification_criteria, deadline, validators, concurrency, timeout, mode),
+        cacheable=lambda res: res["validators_completed"] > 0 and verifier.cacheable_verdict(res),
+    )
+
+
+async def _aggregate(prediction: str, verification_criteria: str, deadline, validators: int,
+                     concurrency: int, timeout: float, mode: str):
+    if mode not in ("async", "thread", "process"):
+        raise ValueError("mode must be 'async', 'thread' or 'process'")
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max(1, concurrency))
+    pool = None
+    if mode == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers=max(1, min(concurrency, validators)))
+    elif mode == "thread":
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(concurrency, validators)))
+
+    async def run_one():
+        async with sem:
+            if pool is not None:
+                job = loop.run_in_executor(pool, _verify_in_process, prediction, verification_criteria, deadline)
+            else:
+                job = verifier.verify_prediction_logic(prediction=prediction, verification_criteria=verification_criteria, deadline=deadline, validators=1)
+            try:
+                return await asyncio.wait_for(job, timeout)
+            except asyncio.TimeoutError:
+                return {"outcome": "NO", "confidence": 0.5, "evidence": "verifier-timeout"}
+            except Exception:
+                return {"outcome": "NO", "confidence": 0.5, "evidence": "verifier-failed"}
+
     votes = {"YES": 0, "NO": 0}
     confidences = []
     evidences = []
-    for _ in range(validators):
-        # run local verifier (best-effort)
-        try:
-            v = asyncio.get_event_loop().run_until_complete(
-                verifier.verify_prediction_logic(prediction=prediction, verification_criteria=verification_criteria, deadline=deadline, validators=1)
-            )
-        except Exception:
-            v = {"outcome": "NO", "confidence": 0.5, "evidence": "verifier-failed"}
-        outcome = v.get("outcome", "NO")
-        votes[outcome] = votes.get(outcome, 0) + 1
-        confidences.append(float(v.get("confidence", 0.0)))
-        evidences.append(v.get("evidence", ""))
+    tasks = [asyncio.ensure_future(run_one()) for _ in range(validators)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            v = await next_done
+            outcome = v.get("outcome", "NO")
+            votes[outcome] = votes.get(outcome, 0) + 1
+            confidences.append(float(v.get("confidence", 0.0)))
+            evidences.append(v.get("evidence", ""))
+            remaining = validators - len(confidences)
+            # Ties go to NO, so NO is locked once it can't be overtaken.
+            if votes["YES"] > votes["NO"] + remaining or votes["NO"] >= votes["YES"] + remaining:
+                break
+    finally:
+        for t in tasks:
+            t.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     outcome = "YES" if votes["YES"] > votes["NO"] else "NO"
     avg_conf = sum(confidences) / len(confidences) if confidences else 0.0
@@ -60,10 +124,27 @@ def aggregate_votes(prediction: str, verification_criteria: str, deadline, valid
         "confidence": avg_conf,
         "evidence": evidence,
         "validators_used": validators,
+        "validators_completed": len(confidences),
+        "votes": votes,
     }
 
 
-def aggregate_and_submit(wager_id: str, contract_address: Optional[str] = None, validators: int = 5, appeal: bool = False, current_date: Optional[str] = None):
+def aggregate_votes(prediction: str, verification_criteria: str, deadline, validators: int = 5,
+                    concurrency: int = 10, timeout: float = 20.0, mode: str = "async"):
+    async def run():
+        try:
+            return await aggregate_votes_async(
+                prediction, verification_criteria, deadline, validators=validators,
+                concurrency=concurrency, timeout=timeout, mode=mode,
+            )
+        finally:
+            await verifier.aclose()
+
+    return asyncio.run(run())
+
+
+def aggregate_and_submit(wager_id: str, contract_address: Optional[str] = None, validators: int = 5, appeal: bool = False, current_date: Optional[str] = None,
+                         concurrency: int = 10, mode: str = "async"):
     contract = contract_address or CONTRACT_ADDRESS
     if not contract:
         raise RuntimeError('CONTRACT_ADDRESS not provided (env CONTRACT_ADDRESS or pass contract_address)')
@@ -83,7 +164,8 @@ def aggregate_and_submit(wager_id: str, contract_address: Optional[str] = None,
     except Exception as e:
         raise RuntimeError(f'Failed to fetch wager from contract: {e}')
 
-    verification = aggregate_votes(prediction, verification_criteria, deadline, validators=validators)
+    verification = aggregate_votes(prediction, verification_criteria, deadline, validators=validators,
+                                   concurrency=concurrency, mode=mode)
     # Use appeal path if requested
     fn = 'submit_verification'
     if appeal:
@@ -109,6 +191,9 @@ if __name__ == '__main__':
     parser.add_argument('--validators', type=int, default=5)
     parser.add_argument('--appeal', action='store_true')
     parser.add_argument('--date')
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--mode', choices=['async', 'thread', 'process'], default='async')
     args = parser.parse_args()
-    out = aggregate_and_submit(args.wager, contract_address=args.contract, validators=args.validators, appeal=args.appeal, current_date=args.date)
+    out = aggregate_and_submit(args.wager, contract_address=args.contract, validators=args.validators, appeal=args.appeal, current_date=args.date,
+                               concurrency=args.concurrency, mode=args.mode)
     print(json.dumps(out, indent=2))
@@ -0,0 +1,575 @@
+"""In-process GenLayer JSON-RPC client.
+
+Pure-Python counterpart of ``tools/genlayer_interact.mjs``: reads go through
+``gen_call``, writes are signed locally with eth-account and submitted as an
+``addTransaction`` call on the consensus contract, and receipts are polled
+with ``eth_getTransactionByHash``. One pooled ``requests.Session`` is kept per
+client so relayed actions do not pay for Node startup, IPC or new TLS
+connections.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+import rlp
+from eth_abi import encode as abi_encode
+from eth_account import Account
+from eth_utils import keccak, to_checksum_address
+from requests.adapters import HTTPAdapter
+
+
+# ---- GenLayer calldata encoding (mirrors genlayer-js abi/calldata) ----
+
+_BITS_IN_TYPE = 3
+_TYPE_SPECIAL = 0
+_TYPE_PINT = 1
+_TYPE_NINT = 2
+_TYPE_BYTES = 3
+_TYPE_STR = 4
+_TYPE_ARR = 5
+_TYPE_MAP = 6
+_SPECIAL_NULL = 0
+_SPECIAL_FALSE = 1
+_SPECIAL_TRUE = 2
+_SPECIAL_ADDR = 3
+
+
+class CalldataAddress(bytes):
+    """20-byte address encoded with the calldata address tag (not as a str)."""
+
+    def __new__(cls, value):
+        if isinstance(value, str):
+            value = bytes.fromhex(value[2:] if value.startswith("0x") else value)
+        if len(value) != 20:
+            raise ValueError("Address must be 20 bytes")
+        return super().__new__(cls, value)
+
+    def __str__(self) -> str:
+        return "0x" + self.hex()
+
+
+def _write_uleb(out: bytearray, n: int) -> None:
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def _read_uleb(buf: bytes, pos: int):
+    n = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return n, pos
+        shift += 7
+
+
+def _encode_into(out: bytearray, value: Any) -> None:
+    if value is None:
+        _write_uleb(out, _SPECIAL_NULL << _BITS_IN_TYPE | _TYPE_SPECIAL)
+    elif value is True:
+        _write_uleb(out, _SPECIAL_TRUE << _BITS_IN_TYPE | _TYPE_SPECIAL)
+    elif value is False:
+        _write_uleb(out, _SPECIAL_FALSE << _BITS_IN_TYPE | _TYPE_SPECIAL)
+    elif isinstance(value, CalldataAddress):
+        _write_uleb(out, _SPECIAL_ADDR << _BITS_IN_TYPE | _TYPE_SPECIAL)
+        out.extend(value)
+    elif isinstance(value, int):
+        if value >= 0:
+            _write_uleb(out, value << _BITS_IN_TYPE | _TYPE_PINT)
+        else:
+            _write_uleb(out, (-value - 1) << _BITS_IN_TYPE | _TYPE_NINT)
+    elif isinstance(value, (bytes, bytearray)):
+        _write_uleb(out, len(value) << _BITS_IN_TYPE | _TYPE_BYTES)
+        out.extend(value)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        _write_uleb(out, len(raw) << _BITS_IN_TYPE | _TYPE_STR)
+        out.extend(raw)
+    elif isinstance(value, (list, tuple)):
+        _write_uleb(out, len(value) << _BITS_IN_TYPE | _TYPE_ARR)
+        for item in value:
+            _encode_into(out, item)
+    elif isinstance(value, dict):
+        items = sorted((str(k), v) for k, v in value.items())
+        _write_uleb(out, len(items) << _BITS_IN_TYPE | _TYPE_MAP)
+        for k, v in items:
+            raw = k.encode("utf-8")
+            _write_uleb(out, len(raw))
+            out.extend(raw)
+            _encode_into(out, v)
+    else:
+        raise TypeError(f"Cannot encode {type(value).__name__} as calldata")
+
+
+def encode_calldata(value: Any) -> bytes:
+    out = bytearray()
+    _encode_into(out, value)
+    return bytes(out)
+
+
+def _decode_at(buf: bytes, pos: int):
+    code, pos = _read_uleb(buf, pos)
+    kind = code & ((1 << _BITS_IN_TYPE) - 1)
+    rest = code >> _BITS_IN_TYPE
+    if kind == _TYPE_SPECIAL:
+        if rest == _SPECIAL_NULL:
+            return None, pos
+        if rest == _SPECIAL_FALSE:
+            return False, pos
+        if rest == _SPECIAL_TRUE:
+            return True, pos
+        if rest == _SPECIAL_ADDR:
+            return "0x" + buf[pos:pos + 20].hex(), pos + 20
+        raise ValueError(f"Unknown special calldata value {rest}")
+    if kind == _TYPE_PINT:
+        return rest, pos
+    if kind == _TYPE_NINT:
+        return -rest - 1, pos
+    if kind == _TYPE_BYTES:
+        return bytes(buf[pos:pos + rest]), pos + rest
+    if kind == _TYPE_STR:
+        return buf[pos:pos + rest].decode("utf-8"), pos + rest
+    if kind == _TYPE_ARR:
+        items = []
+        for _ in range(rest):
+            item, pos = _decode_at(buf, pos)
+            items.append(item)
+        return items, pos
+    if kind == _TYPE_MAP:
+        result = {}
+        for _ in range(rest):
+            key_len, pos = _read_uleb(buf, pos)
+            key = buf[pos:pos + key_len].decode("utf-8")
+            pos += key_len
+            result[key], pos = _decode_at(buf, pos)
+        return result, pos
+    raise ValueError(f"Unknown calldata type {kind}")
+
+
+def decode_calldata(buf: bytes) -> Any:
+    value, pos = _decode_at(bytes(buf), 0)
+    if pos != len(buf):
+        raise ValueError("Trailing bytes after calldata value")
+    return value
+
+
+def make_calldata_object(method: str, args: Optional[List[Any]] = None,
+                         kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    obj: Dict[str, Any] = {"method": method}
+    if args:
+        obj["args"] = list(args)
+    if kwargs:
+        obj["kwargs"] = dict(kwargs)
+    return obj
+
+
+def serialize_tx_data(calldata: bytes, leader_only: bool = False) -> bytes:
+    return rlp.encode([calldata, b"\x01" if leader_only else b"\x00"])
+
+
+# ---- JSON-RPC client ----
+
+# genlayer-js transactionsStatusNumberToName
+TRANSACTION_STATUS_NAMES = {
+    0: "UNINITIALIZED",
+    1: "PENDING",
+    2: "PROPOSING",
+    3: "COMMITTING",
+    4: "REVEALING",
+    5: "ACCEPTED",
+    6: "UNDETERMINED",
+    7: "FINALIZED",
+    8: "CANCELED",
+    9: "APPEAL_REVEALING",
+    10: "APPEAL_COMMITTING",
+    11: "READY_TO_FINALIZE",
+    12: "VALIDATORS_TIMEOUT",
+    13: "LEADER_TIMEOUT",
+}
+
+# addTransaction(address _sender, address _recipient,
+#                uint256 _numOfInitialValidators, uint256 _maxRotations, bytes _txData)
+_ADD_TRANSACTION_SELECTOR = keccak(text="addTransaction(address,address,uint256,uint256,bytes)")[:4]
+
+
+def _to_hex(data: bytes) -> str:
+    return "0x" + bytes(data).hex()
+
+
+def status_name(status: Any) -> str:
+    if isinstance(status, int):
+        return TRANSACTION_STATUS_NAMES.get(status, str(status))
+    text = str(status)
+    if text.isdigit():
+        return TRANSACTION_STATUS_NAMES.get(int(text), text)
+    return text.upper()
+
+
+class GenLayerClient:
+    """Read, write and wait on a GenLayer node over a pooled HTTP session.
+
+    ``private_key`` is only needed for writes. ``consensus_address`` defaults
+    to ``GENLAYER_CONSENSUS_ADDRESS`` and otherwise is asked from the node via
+    ``sim_getConsensusContract`` (Studio / localnet).
+    """
+
+    def __init__(self, rpc_url: str, private_key: Optional[str] = None,
+                 api_key: Optional[str] = None, chain_id: Optional[int] = None,
+                 consensus_address: Optional[str] = None, timeout: float = 20.0,
+                 pool_size: int = 8, num_validators: int = 5, max_rotations: int = 3,
+                 default_gas: int = 200000):
+        if not rpc_url:
+            raise RuntimeError("GENLAYER_RPC_URL not set")
+        self.rpc_url = rpc_url
+        self.timeout = timeout
+        self.account = Account.from_key(private_key) if private_key else None
+        self.num_validators = num_validators
+        self.max_rotations = max_rotations
+        self.default_gas = default_gas
+        self._chain_id = chain_id
+        self._consensus_address = consensus_address or os.getenv("GENLAYER_CONSENSUS_ADDRESS")
+        self._nonce: Optional[int] = None
+        self._nonce_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Content-Type"] = "application/json"
+        if api_key:
+            self.session.headers["Authorization"] = f"Bearer {api_key}"
+
+    @property
+    def address(self) -> Optional[str]:
+        return self.account.address if self.account else None
+
+    # -- transport --
+    def request(self, method: str, params: Any = None) -> Any:
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []}
+        r = self.session.post(self.rpc_url, json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        return self._unwrap(r.json())
+
+    def batch_request(self, calls: List[tuple]) -> List[Any]:
+        """Send several ``(method, params)`` calls in one JSON-RPC batch.
+
+        Returns one entry per call, in order; failed calls come back as the
+        RuntimeError instance instead of raising.
+        """
+        if not calls:
+            return []
+        payload = [
+            {"jsonrpc": "2.0", "id": next(self._ids), "method": m, "params": p}
+            for m, p in calls
+        ]
+        r = self.session.post(self.rpc_url, json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        by_id = {item.get("id"): item for item in r.json()}
+        results = []
+        for call in payload:
+            try:
+                results.append(self._unwrap(by_id.get(call["id"], {})))
+            except RuntimeError as e:
+                results.append(e)
+        return results
+
+    @staticmethod
+    def _unwrap(res: Dict[str, Any]) -> Any:
+        if "error" in res and res["error"]:
+            err = res["error"]
+            if isinstance(err, dict):
+                raise RuntimeError(f"RPC error {err.get('code')}: {err.get('message')}")
+            raise RuntimeError(f"RPC error: {err}")
+        if "result" not in res:
+            raise RuntimeError("Malformed RPC response")
+        return res["result"]
+
+    # -- chain info --
+    @property
+    def chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = int(self.request("eth_chainId"), 16)
+        return self._chain_id
+
+    @property
+    def consensus_address(self) -> str:
+        if not self._consensus_address:
+            info = self.request("sim_getConsensusContract", ["ConsensusMain"])
+            self._consensus_address = info["address"] if isinstance(info, dict) else info
+        return self._consensus_address
+
+    # -- reads --
+    def read_contract(self, address: str, function_name: str, args: Optional[List[Any]] = None,
+                      kwargs: Optional[Dict[str, Any]] = None) -> Any:
+        data = serialize_tx_data(encode_calldata(make_calldata_object(function_name, args, kwargs)))
+        params = {
+            "type": "read",
+            "to": address,
+            "from": self.address or "0x" + "00" * 20,
+            "data": _to_hex(data),
+            "transaction_hash_variant": "latest-nonfinal",
+        }
+        result = self.request("gen_call", [params])
+        raw = result[2:] if isinstance(result, str) and result.startswith("0x") else result
+        return decode_calldata(bytes.fromhex(raw))
+
+    # -- writes --
+    def write_contract(self, address: str, function_name: str, args: Optional[List[Any]] = None,
+                       value: int = 0, leader_only: bool = False) -> str:
+        """Sign and submit a write; returns the transaction hash without waiting."""
+        if self.account is None:
+            raise RuntimeError("GENLAYER_PRIVATE_KEY not set")
+        tx_data = serialize_tx_data(encode_calldata(make_calldata_object(function_name, args)), leader_only)
+        call = _ADD_TRANSACTION_SELECTOR + abi_encode(
+            ["address", "address", "uint256", "uint256", "bytes"],
+            [self.account.address, to_checksum_address(address), self.num_validators, self.max_rotations, tx_data],
+        )
+        tx = {
+            "to": to_checksum_address(self.consensus_address),
+            "data": call,
+            "value": int(value),
+            "chainId": self.chain_id,
+            "gasPrice": self._gas_price(),
+        }
+        tx["gas"] = self._estimate_gas(tx)
+        with self._nonce_lock:
+            tx["nonce"] = self._take_nonce()
+            signed = self.account.sign_transaction(tx)
+            try:
+                return self.request("eth_sendRawTransaction", [_to_hex(signed.raw_transaction)])
+            except RuntimeError as e:
+                # Another sender used the account; resync on the next write.
+                if "nonce" in str(e).lower():
+                    self._nonce = None
+                else:
+                    self._nonce = tx["nonce"]
+                raise
+
+    def _take_nonce(self) -> int:
+        if self._nonce is None:
+            self._nonce = int(self.request("eth_getTransactionCount", [self.account.address, "pending"]), 16)
+        nonce = self._nonce
+        self._nonce += 1
+        return nonce
+
+    def _gas_price(self) -> int:
+        try:
+            return int(self.request("eth_gasPrice"), 16)
+        except Exception:
+            return 0
+
+    def _estimate_gas(self, tx: Dict[str, Any]) -> int:
+        try:
+            return int(self.request("eth_estimateGas", [{
+                "from": self.account.address,
+                "to": tx["to"],
+                "data": _to_hex(tx["data"]),
+                "value": hex(tx["value"]),
+            }]), 16)
+        except Exception:
+            return self.default_gas
+
+    # -- receipts --
+    def get_transaction(self, tx_hash: str) -> Dict[str, Any]:
+        tx = self.request("eth_getTransactionByHash", [tx_hash])
+        if not tx:
+            raise RuntimeError(f"Transaction {tx_hash} not found")
+        tx["statusName"] = status_name(tx.get("status"))
+        return tx
+
+    def get_transactions(self, hashes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up many transactions in one batch; same shape as the worker's `receipts`."""
+        results = self.batch_request([("eth_getTransactionByHash", [h]) for h in hashes])
+        out: Dict[str, Dict[str, Any]] = {}
+        for h, tx in zip(hashes, results):
+            if isinstance(tx, Exception):
+                out[h] = {"error": str(tx)}
+            elif not tx:
+                out[h] = {"error": "Transaction not found"}
+            else:
+                out[h] = {"status": status_name(tx.get("status")), "transaction": tx}
+        return out
+
+    def wait_for_receipt(self, tx_hash: str, status: str = "ACCEPTED", retries: int = 50,
+                         interval: float = 4.0) -> Dict[str, Any]:
+        wanted = {status, "FINALIZED"} if status == "ACCEPTED" else {status}
+        for attempt in range(retries):
+            try:
+                tx = self.get_transaction(tx_hash)
+                if tx["statusName"] in wanted:
+                    return tx
+            except RuntimeError:
+                pass
+            if attempt + 1 < retries:
+                time.sleep(interval)
+        raise RuntimeError(f"Transaction {tx_hash} did not reach {status}")
+
+
+# ---- relayer commands (same names and flags as genlayer_interact.mjs) ----
+
+_WRITE_COMMANDS = {
+    "create": ("create_wager", ("--prediction", "--stake", "--deadline", "--category", "--criteria")),
+    "accept": ("accept_wager", ("--wager", "--stance")),
+    "pool": ("create_pool", ("--prediction", "--stake", "--deadline", "--category", "--criteria", "--stance")),
+    "join": ("join_pool", ("--wager", "--stance", "--stake")),
+    "verify": ("submit_verification", ("--wager", "--evidence-url")),
+    "appeal": ("submit_appeal", ("--wager", "--reason", "--evidence-url")),
+    "resolve": ("resolve_wager", ("--wager",)),
+    "username": ("set_username", ("--username",)),
+}
+
+_READ_COMMANDS = {
+    "get": "get_wager",
+    "getstatus": "get_status",
+    "getjson": "get_wager_json",
+    "getstatusjson": "get_status_json",
+    "getlast": "get_last_wager_id",
+}
+
+# Batch reads: one contract call for many ids; flags take comma-separated lists.
+_BATCH_COMMANDS = {
+    "getmany": ("get_wagers_json", "--wagers"),
+    "statuses": ("get_statuses_json", "--wagers"),
+    "players": ("get_player_stats_batch_json", "--addresses"),
+}
+
+_DEFAULTS = {"--category": "", "--evidence-url": "", "--stance": "disagree", "--stake": "0"}
+_COMMAND_DEFAULTS = {"pool": {"--stance": "agree"}}
+_PAYABLE_COMMANDS = ("create", "accept", "pool", "join")
+_REQUIRED = {
+    "create": ("--prediction", "--deadline", "--criteria"),
+    "accept": ("--wager",),
+    "pool": ("--prediction", "--deadline", "--criteria"),
+    "join": ("--wager",),
+    "verify": ("--wager",),
+    "appeal": ("--wager", "--reason"),
+    "resolve": ("--wager",),
+    "username": ("--username",),
+}
+
+
+def _split_list(value: Optional[str]) -> List[str]:
+    return [v for v in (value or "").split(",") if v]
+
+
+def get_wagers(client: GenLayerClient, contract: str, ids: List[str]) -> Dict[str, Any]:
+    """Full wager records for ``ids`` in one call (None for unknown ids)."""
+    return json.loads(client.read_contract(contract, "get_wagers_json", [list(ids)]))
+
+
+def get_statuses(client: GenLayerClient, contract: str, ids: List[str]) -> Dict[str, Any]:
+    return json.loads(client.read_contract(contract, "get_statuses_json", [list(ids)]))
+
+
+def get_player_stats_batch(client: GenLayerClient, contract: str, addresses: List[str]) -> Dict[str, Any]:
+    addrs = [CalldataAddress(a) for a in addresses]
+    return json.loads(client.read_contract(contract, "get_player_stats_batch_json", [addrs]))
+
+
+def list_wagers_full(client: GenLayerClient, contract: str, offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+    return json.loads(client.read_contract(contract, "list_wagers_full_json", [offset, limit]))
+
+
+_BATCH_HELPERS = {
+    "getmany": get_wagers,
+    "statuses": get_statuses,
+    "players": get_player_stats_batch,
+}
+
+
+def run_command(client: GenLayerClient, contract: str, cmd: str, args: List[str]) -> Dict[str, Any]:
+    """Execute a relayer command in-process; returns what the Node CLI prints."""
+    def get_arg(flag: str, default: Optional[str] = None) -> Optional[str]:
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 < len(args):
+                return args[i + 1]
+        return default
+
+    if cmd == "receipts":
+        hashes = _split_list(get_arg("--hashes"))
+        return client.get_transactions(hashes)
+
+    if cmd in _BATCH_COMMANDS:
+        flag = _BATCH_COMMANDS[cmd][1]
+        keys = _split_list(get_arg(flag))
+        if not keys:
+            raise RuntimeError(f"Missing {flag}")
+        return {"result": _BATCH_HELPERS[cmd](client, contract, keys)}
+
+    if cmd == "batch":
+        return run_batch(client, contract, json.loads(get_arg("--actions", "[]") or "[]"))
+
+    if cmd == "listfull":
+        offset = int(get_arg("--offset", "0") or "0")
+        limit = int(get_arg("--limit", "20") or "20")
+        return {"result": list_wagers_full(client, contract, offset, limit)}
+
+    if cmd in _READ_COMMANDS:
+        fn_args = [] if cmd == "getlast" else [get_arg("--wager")]
+        if fn_args and not fn_args[0]:
+            raise RuntimeError("Missing --wager")
+        return {"result": client.read_contract(contract, _READ_COMMANDS[cmd], fn_args)}
+
+    if cmd == "resolvemany":
+        ids = _split_list(get_arg("--wagers"))
+        if not ids:
+            raise RuntimeError("Missing --wagers")
+        tx_hash = client.write_contract(contract, "resolve_wagers", [ids])
+        if "--no-wait" in args:
+            return {"hash": tx_hash}
+        return {"hash": tx_hash, "receipt": client.wait_for_receipt(tx_hash)}
+
+    if cmd not in _WRITE_COMMANDS:
+        raise RuntimeError(f"Unknown command: {cmd}")
+    fn, flags = _WRITE_COMMANDS[cmd]
+    for flag in _REQUIRED[cmd]:
+        if not get_arg(flag):
+            raise RuntimeError(f"Missing {flag}")
+    defaults = {**_DEFAULTS, **_COMMAND_DEFAULTS.get(cmd, {})}
+    fn_args: List[Any] = [get_arg(f, defaults.get(f)) for f in flags]
+    stake = int(get_arg("--stake", "0") or "0")
+    if "--stake" in flags:
+        fn_args[flags.index("--stake")] = stake
+    value = stake if cmd in _PAYABLE_COMMANDS else 0
+
+    tx_hash = client.write_contract(contract, fn, fn_args, value=value)
+    if "--no-wait" in args:
+        return {"hash": tx_hash}
+    return {"hash": tx_hash, "receipt": client.wait_for_receipt(tx_hash)}
+
+
+def run_batch(client: GenLayerClient, contract: str, items: List[Any]) -> List[Dict[str, Any]]:
+    """Submit ``[cmd, args]`` writes in order without waiting for receipts.
+
+    The client hands out account nonces locally, so each submission follows
+    the previous one immediately. Stops at the first failure; the result
+    list then ends with that action's ``{"error": ...}`` entry.
+    """
+    results: List[Dict[str, Any]] = []
+    for cmd, cmd_args in items:
+        if cmd not in _WRITE_COMMANDS and cmd != "resolvemany":
+            results.append({"error": f"Not a write command: {cmd}"})
+            break
+        try:
+            results.append(run_command(client, contract, cmd, [*map(str, cmd_args), "--no-wait"]))
+        except Exception as e:
+            results.append({"error": str(e)})
+            break
+    return results
+
+
+def to_json(value: Any) -> str:
+    return json.dumps(value, indent=2, default=lambda v: _to_hex(v) if isinstance(v, bytes) else str(v))
@@ -1,3 +1,4 @@
+import { pathToFileURL } from 'node:url';
 import { createClient, createAccount } from 'genlayer-js';
 import { studionet } from 'genlayer-js/chains';
 import { TransactionStatus } from 'genlayer-js/types';
@@ -13,240 +14,280 @@ const clientConfig = {
   chain: { ...studionet, rpcUrls: { default: { http: [RPC_URL] } } },
 };
 
-async function main() {
-  const [cmd, ...args] = process.argv.slice(2);
-  if (!cmd) throw new Error('Command required');
+const RECEIPT_WAIT = {
+  status: TransactionStatus.ACCEPTED,
+  retries: 50,
+  interval: 4000,
+};
 
-  const getArg = (flag, fallback = undefined) => {
-    const i = args.indexOf(flag);
-    if (i !== -1 && i + 1 < args.length) return args[i + 1];
-    return fallback;
-  };
+export const toJson = (value) =>
+  JSON.stringify(
+    value,
+    (_k, v) => (typeof v === 'bigint' ? v.toString() : v),
+    2,
+  );
 
-  const toJson = (value) =>
-    JSON.stringify(
-      value,
-      (_k, v) => (typeof v === 'bigint' ? v.toString() : v),
-      2,
-    );
+const parsePrivateKey = (pk) => {
+  if (!pk) return pk;
+  if (typeof pk !== 'string') return pk;
+  const hex = pk.startsWith('0x') ? pk.slice(2) : pk;
+  if (!/^[0-9a-fA-F]{64}$/.test(hex)) {
+    throw new Error('GENLAYER_PRIVATE_KEY must be 32-byte hex (64 chars)');
+  }
+  return `0x${hex}`;
+};
 
-  const parsePrivateKey = (pk) => {
-    if (!pk) return pk;
-    if (typeof pk !== 'string') return pk;
-    const hex = pk.startsWith('0x') ? pk.slice(2) : pk;
-    if (!/^[0-9a-fA-F]{64}$/.test(hex)) {
-      throw new Error('GENLAYER_PRIVATE_KEY must be 32-byte hex (64 chars)');
-    }
-    return `0x${hex}`;
-  };
+// Clients are created once per process so a long-lived worker
+// (tools/genlayer_worker.mjs) reuses the RPC transport and account.
+let readClient = null;
+let writeClient = null;
+
+const getReadClient = () => {
+  if (!readClient) readClient = createClient({ ...clientConfig });
+  return readClient;
+};
 
-  if (cmd === 'create') {
-    if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
+const getWriteClient = () => {
+  if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
+  if (!writeClient) {
     const account = createAccount(parsePrivateKey(PRIVATE_KEY));
-    const client = createClient({ ...clientConfig, account });
+    writeClient = createClient({ ...clientConfig, account });
+  }
+  return writeClient;
+};
+
+// Submissions from the relayer account are serialized so concurrent
+// requests in one worker never race for the same account nonce. Receipt
+// waits still overlap.
+let submitQueue = Promise.resolve();
+
+const submit = (request) => {
+  const client = getWriteClient();
+  const next = submitQueue.then(() =>
+    client.writeContract({ address: CONTRACT, ...request }),
+  );
+  submitQueue = next.catch(() => undefined);
+  return next;
+};
+
+// With wait=false the hash is returned as soon as the node accepts the
+// submission; the relayer tracks the receipt separately (see `receipts`).
+const write = async (request, { wait = true } = {}) => {
+  const hash = await submit(request);
+  if (!wait) return { hash };
+  const receipt = await getWriteClient().waitForTransactionReceipt({ hash, ...RECEIPT_WAIT });
+  return { hash, receipt };
+};
+
+const read = async (request) => {
+  const result = await getReadClient().readContract({ address: CONTRACT, ...request });
+  return { result };
+};
+
+const parseResult = ({ result }) => ({ result: JSON.parse(result) });
+
+const WRITE_COMMANDS = new Set(['create', 'accept', 'pool', 'join', 'verify', 'appeal', 'resolve', 'resolvemany', 'username']);
+
+const commands = {
+  create: ({ getArg, write }) => {
     const prediction = getArg('--prediction');
     const deadline = getArg('--deadline');
     const category = getArg('--category', '');
     const criteria = getArg('--criteria');
     const stake = BigInt(getArg('--stake', '0'));
     if (!prediction || !deadline || !criteria) throw new Error('Missing required args');
-
-    const hash = await client.writeContract({
-      address: CONTRACT,
+    return write({
       functionName: 'create_wager',
       args: [prediction, Number(stake), deadline, category, criteria],
       value: stake,
     });
-    const receipt = await client.waitForTransactionReceipt({
-      hash,
-      status: TransactionStatus.ACCEPTED,
-      retries: 50,
-      interval: 4000,
-    });
-    console.log(toJson({ hash, receipt }));
-    return;
-  }
+  },
 
-  if (cmd === 'accept') {
-    if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
-    const account = createAccount(parsePrivateKey(PRIVATE_KEY));
-    const client = createClient({ ...clientConfig, account });
+  accept: ({ getArg, write }) => {
     const wager = getArg('--wager');
     const stance = getArg('--stance', 'disagree');
     const stake = BigInt(getArg('--stake', '0'));
     if (!wager) throw new Error('Missing --wager');
-    const hash = await client.writeContract({
-      address: CONTRACT,
-      functionName: 'accept_wager',
-      args: [wager, stance],
+    return write({ functionName: 'accept_wager', args: [wager, stance], value: stake });
+  },
+
+  pool: ({ getArg, write }) => {
+    const prediction = getArg('--prediction');
+    const deadline = getArg('--deadline');
+    const category = getArg('--category', '');
+    const criteria = getArg('--criteria');
+    const stance = getArg('--stance', 'agree');
+    const stake = BigInt(getArg('--stake', '0'));
+    if (!prediction || !deadline || !criteria) throw new Error('Missing required args');
+    return write({
+      functionName: 'create_pool',
+      args: [prediction, Number(stake), deadline, category, criteria, stance],
       value: stake,
     });
-    const receipt = await client.waitForTransactionReceipt({
-      hash,
-      status: TransactionStatus.ACCEPTED,
-      retries: 50,
-      interval: 4000,
-    });
-    console.log(toJson({ hash, receipt }));
-    return;
-  }
+  },
 
-  if (cmd === 'verify') {
-    if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
-    const account = createAccount(parsePrivateKey(PRIVATE_KEY));
-    const client = createClient({ ...clientConfig, account });
+  join: ({ getArg, write }) => {
+    const wager = getArg('--wager');
+    const stance = getArg('--stance', 'disagree');
+    const stake = BigInt(getArg('--stake', '0'));
+    if (!wager) throw new Error('Missing --wager');
+    return write({ functionName: 'join_pool', args: [wager, stance, Number(stake)], value: stake });
+  },
+
+  verify: ({ getArg, write }) => {
     const wager = getArg('--wager');
     const evidence = getArg('--evidence-url', '');
     if (!wager) throw new Error('Missing --wager');
-    const hash = await client.writeContract({
-      address: CONTRACT,
-      functionName: 'submit_verification',
-      args: [wager, evidence],
-    });
-    const receipt = await client.waitForTransactionReceipt({
-      hash,
-      status: TransactionStatus.ACCEPTED,
-      retries: 50,
-      interval: 4000,
-    });
-    console.log(toJson({ hash, receipt }));
-    return;
-  }
+    return write({ functionName: 'submit_verification', args: [wager, evidence] });
+  },
 
-  if (cmd === 'appeal') {
-    if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
-    const account = createAccount(parsePrivateKey(PRIVATE_KEY));
-    const client = createClient({ ...clientConfig, account });
+  appeal: ({ getArg, write }) => {
     const wager = getArg('--wager');
     const reason = getArg('--reason');
     const evidence = getArg('--evidence-url', '');
     if (!wager || !reason) throw new Error('Missing --wager or --reason');
-    const hash = await client.writeContract({
-      address: CONTRACT,
-      functionName: 'submit_appeal',
-      args: [wager, reason, evidence],
-    });
-    const receipt = await client.waitForTransactionReceipt({
-      hash,
-      status: TransactionStatus.ACCEPTED,
-      retries: 50,
-      interval: 4000,
-    });
-    console.log(toJson({ hash, receipt }));
-    return;
-  }
+    return write({ functionName: 'submit_appeal', args: [wager, reason, evidence] });
+  },
 
-  if (cmd === 'resolve') {
-    if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
-    const account = createAccount(parsePrivateKey(PRIVATE_KEY));
-    const client = createClient({ ...clientConfig, account });
+  resolve: ({ getArg, write }) => {
     const wager = getArg('--wager');
     if (!wager) throw new Error('Missing --wager');
-    const hash = await client.writeContract({
-      address: CONTRACT,
-      functionName: 'resolve_wager',
-      args: [wager],
-    });
-    const receipt = await client.waitForTransactionReceipt({
-      hash,
-      status: TransactionStatus.ACCEPTED,
-      retries: 50,
-      interval: 4000,
-    });
-    console.log(toJson({ hash, receipt }));
-    return;
-  }
+    return write({ functionName: 'resolve_wager', args: [wager] });
+  },
 
-  if (cmd === 'username') {
-    if (!PRIVATE_KEY) throw new Error('GENLAYER_PRIVATE_KEY not set');
-    const account = createAccount(parsePrivateKey(PRIVATE_KEY));
-    const client = createClient({ ...clientConfig, account });
+  // Settle many final wagers in one transaction:
+  //   resolvemany --wagers a,b,c
+  resolvemany: ({ getArg, write }) => {
+    const ids = getArg('--wagers', '').split(',').filter(Boolean);
+    if (!ids.length) throw new Error('Missing --wagers');
+    return write({ functionName: 'resolve_wagers', args: [ids] });
+  },
+
+  username: ({ getArg, write }) => {
     const username = getArg('--username');
     if (!username) throw new Error('Missing --username');
-    const hash = await client.writeContract({
-      address: CONTRACT,
-      functionName: 'set_username',
-      args: [username],
-    });
-    const receipt = await client.waitForTransactionReceipt({
-      hash,
-      status: TransactionStatus.ACCEPTED,
-      retries: 50,
-      interval: 4000,
-    });
-    console.log(toJson({ hash, receipt }));
-    return;
-  }
+    return write({ functionName: 'set_username', args: [username] });
+  },
 
-  if (cmd === 'get') {
-    const client = createClient({ ...clientConfig });
+  get: ({ getArg }) => {
     const wager = getArg('--wager');
     if (!wager) throw new Error('Missing --wager');
-    const result = await client.readContract({
-      address: CONTRACT,
-      functionName: 'get_wager',
-      args: [wager],
-      jsonSafeReturn: true,
-    });
-    console.log(toJson({ result }));
-    return;
-  }
+    return read({ functionName: 'get_wager', args: [wager], jsonSafeReturn: true });
+  },
 
-  if (cmd === 'getstatus') {
-    const client = createClient({ ...clientConfig });
+  getstatus: ({ getArg }) => {
     const wager = getArg('--wager');
     if (!wager) throw new Error('Missing --wager');
-    const result = await client.readContract({
-      address: CONTRACT,
-      functionName: 'get_status',
-      args: [wager],
-      jsonSafeReturn: true,
-    });
-    console.log(toJson({ result }));
-    return;
-  }
+    return read({ functionName: 'get_status', args: [wager], jsonSafeReturn: true });
+  },
 
-  if (cmd === 'getjson') {
-    const client = createClient({ ...clientConfig });
+  getjson: ({ getArg }) => {
     const wager = getArg('--wager');
     if (!wager) throw new Error('Missing --wager');
-    const result = await client.readContract({
-      address: CONTRACT,
-      functionName: 'get_wager_json',
-      args: [wager],
-    });
-    console.log(toJson({ result }));
-    return;
-  }
+    return read({ functionName: 'get_wager_json', args: [wager] });
+  },
 
-  if (cmd === 'getstatusjson') {
-    const client = createClient({ ...clientConfig });
+  getstatusjson: ({ getArg }) => {
     const wager = getArg('--wager');
     if (!wager) throw new Error('Missing --wager');
-    const result = await client.readContract({
-      address: CONTRACT,
-      functionName: 'get_status_json',
-      args: [wager],
-    });
-    console.log(toJson({ result }));
-    return;
-  }
+    return read({ functionName: 'get_status_json', args: [wager] });
+  },
 
-  if (cmd === 'getlast') {
-    const client = createClient({ ...clientConfig });
-    const result = await client.readContract({
-      address: CONTRACT,
-      functionName: 'get_last_wager_id',
-      args: [],
-    });
-    console.log(toJson({ result }));
-    return;
-  }
+  getlast: () => read({ functionName: 'get_last_wager_id', args: [] }),
+
+  // Batch reads, one contract call each:
+  //   getmany --wagers a,b   statuses --wagers a,b   players --addresses 0x..,0x..
+  //   listfull --offset 0 --limit 20
+  getmany: ({ getArg }) => {
+    const ids = getArg('--wagers', '').split(',').filter(Boolean);
+    if (!ids.length) throw new Error('Missing --wagers');
+    return read({ functionName: 'get_wagers_json', args: [ids] }).then(parseResult);
+  },
+
+  statuses: ({ getArg }) => {
+    const ids = getArg('--wagers', '').split(',').filter(Boolean);
+    if (!ids.length) throw new Error('Missing --wagers');
+    return read({ functionName: 'get_statuses_json', args: [ids] }).then(parseResult);
+  },
+
+  players: ({ getArg }) => {
+    const addrs = getArg('--addresses', '').split(',').filter(Boolean);
+    if (!addrs.length) throw new Error('Missing --addresses');
+    return read({ functionName: 'get_player_stats_batch_json', args: [addrs] }).then(parseResult);
+  },
+
+  listfull: ({ getArg }) => {
+    const offset = Number(getArg('--offset', '0'));
+    const limit = Number(getArg('--limit', '20'));
+    return read({ functionName: 'list_wagers_full_json', args: [offset, limit] }).then(parseResult);
+  },
+
+  // Ordered writes from one relay batch, submitted back to back without
+  // waiting for receipts; stops at the first failure.
+  //   batch --actions '[["resolve", ["--wager", "w1"]], ...]'
+  batch: async ({ getArg }) => {
+    const items = JSON.parse(getArg('--actions', '[]'));
+    const results = [];
+    for (const [cmd, cmdArgs] of items) {
+      if (!WRITE_COMMANDS.has(cmd)) {
+        results.push({ error: `Not a write command: ${cmd}` });
+        break;
+      }
+      try {
+        results.push(await runCommand(cmd, [...cmdArgs.map(String), '--no-wait']));
+      } catch (err) {
+        results.push({ error: err?.message || String(err) });
+        break;
+      }
+    }
+    return results;
+  },
+
+  // Batched status lookup for submitted transactions:
+  //   receipts --hashes 0xabc,0xdef
+  receipts: async ({ getArg }) => {
+    const hashes = getArg('--hashes', '').split(',').filter(Boolean);
+    const client = getReadClient();
+    const entries = await Promise.all(
+      hashes.map(async (hash) => {
+        try {
+          const transaction = await client.getTransaction({ hash });
+          if (!transaction) return [hash, { error: 'Transaction not found' }];
+          const status = transaction?.statusName ?? String(transaction?.status ?? 'UNKNOWN');
+          return [hash, { status, transaction }];
+        } catch (err) {
+          return [hash, { error: err?.message || String(err) }];
+        }
+      }),
+    );
+    return Object.fromEntries(entries);
+  },
+};
+
+export async function runCommand(cmd, args = []) {
+  if (!cmd) throw new Error('Command required');
+  const handler = commands[cmd];
+  if (!handler) throw new Error(`Unknown command: ${cmd}`);
 
-  throw new Error(`Unknown command: ${cmd}`);
+  const getArg = (flag, fallback = undefined) => {
+    const i = args.indexOf(flag);
+    if (i !== -1 && i + 1 < args.length) return args[i + 1];
+    return fallback;
+  };
+
+  const wait = !args.includes('--no-wait');
+  return handler({ getArg, write: (request) => write(request, { wait }) });
 }
 
-main().catch((err) => {
-  console.error(err.message);
-  process.exit(1);
-});
+async function main() {
+  const [cmd, ...args] = process.argv.slice(2);
+  const value = await runCommand(cmd, args);
+  console.log(toJson(value));
+}
+
+if (process.argv[1] && import.meta.url === pathToFileURL(process.argv[1]).href) {
+  main().catch((err) => {
+    console.error(err.message);
+    process.exit(1);
+  });
+}
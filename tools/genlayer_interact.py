@@ -1,7 +1,7 @@
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -12,72 +12,135 @@ GENLAYER_API_KEY = os.getenv("GENLAYER_API_KEY")
 CONTRACT_ADDRESS = os.getenv("CONTRACT_ADDRESS")
 
 
-def rpc_call(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+_session = requests.Session()
+
+# Parameter shape the node accepted for GENLAYER_RPC_METHOD, per RPC URL:
+# ("named", contract_key, method_key, args_key) or ("positional",).
+# Set GENLAYER_RPC_SHAPE_CACHE to a file path to keep it across runs.
+_shape_cache: Dict[str, Tuple[str, ...]] = {}
+_shape_cache_loaded = False
+# Messages that mean the request shape was rejected. The error code is not
+# enough: -32602 ("invalid params") is also returned for bad contract arguments.
+_SCHEMA_ERROR_HINTS = ("unexpected parameter", "unknown field", "missing required")
+
+
+def _post(payload: Dict[str, Any]) -> Dict[str, Any]:
     if not GENLAYER_RPC_URL:
         raise RuntimeError("GENLAYER_RPC_URL not set")
-    payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
     headers = {"Content-Type": "application/json"}
     if GENLAYER_API_KEY:
         headers["Authorization"] = f"Bearer {GENLAYER_API_KEY}"
-    r = requests.post(GENLAYER_RPC_URL, json=payload, headers=headers, timeout=20)
+    r = _session.post(GENLAYER_RPC_URL, json=payload, headers=headers, timeout=20)
     r.raise_for_status()
     return r.json()
 
 
-def call_contract(contract: str, fn: str, args: List[Any], value: Optional[int] = None) -> Dict[str, Any]:
-    def build_params(
-        contract_key: str,
-        method_key: str,
-        args_key: str,
-    ) -> Dict[str, Any]:
-        p: Dict[str, Any] = {contract_key: contract, method_key: fn, args_key: args}
-        if value is not None:
-            p["value"] = value
-        return p
+def rpc_call(method: str, params: Any) -> Dict[str, Any]:
+    return _post({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+
+
+def _shape_key() -> str:
+    return f"{GENLAYER_RPC_URL}|{GENLAYER_RPC_METHOD}"
+
+
+def _shape_cache_path() -> Optional[str]:
+    return os.getenv("GENLAYER_RPC_SHAPE_CACHE") or None
+
 
+def _load_shape_cache() -> None:
+    global _shape_cache_loaded
+    if _shape_cache_loaded:
+        return
+    _shape_cache_loaded = True
+    path = _shape_cache_path()
+    if not path or not os.path.exists(path):
+        return
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            stored = json.load(f)
+        for key, shape in stored.items():
+            _shape_cache.setdefault(key, tuple(shape))
+    except (OSError, ValueError):
+        pass
+
+
+def _save_shape(shape: Optional[Tuple[str, ...]]) -> None:
+    key = _shape_key()
+    if shape is None:
+        _shape_cache.pop(key, None)
+    else:
+        _shape_cache[key] = shape
+    path = _shape_cache_path()
+    if not path:
+        return
+    try:
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({k: list(v) for k, v in _shape_cache.items()}, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _is_schema_error(res: Dict[str, Any]) -> bool:
+    err = res.get("error")
+    if not err:
+        return False
+    if not isinstance(err, dict):
+        return False
+    msg = (err.get("message") or "").lower()
+    return any(hint in msg for hint in _SCHEMA_ERROR_HINTS)
+
+
+def _build_params(shape: Tuple[str, ...], contract: str, fn: str, args: List[Any],
+                  value: Optional[int]) -> Any:
+    if shape[0] == "positional":
+        return [contract, fn, args, value] if value is not None else [contract, fn, args]
+    _, contract_key, method_key, args_key = shape
+    p: Dict[str, Any] = {contract_key: contract, method_key: fn, args_key: args}
+    if value is not None:
+        p["value"] = value
+    return p
+
+
+def _candidate_shapes() -> List[Tuple[str, ...]]:
     contract_keys = ["contract", "address", "contract_address"]
     method_keys = ["method", "function", "fn", "method_name", "entrypoint"]
     args_keys = ["args", "arguments", "params", "inputs"]
 
     # Try the most common first, then fall back across variants.
-    attempts = [
-        ("contract", "method", "args"),
-    ]
+    shapes: List[Tuple[str, ...]] = [("named", "contract", "method", "args")]
     for ck in contract_keys:
         for mk in method_keys:
             for ak in args_keys:
-                combo = (ck, mk, ak)
-                if combo not in attempts:
-                    attempts.append(combo)
+                shape = ("named", ck, mk, ak)
+                if shape not in shapes:
+                    shapes.append(shape)
+    # Some RPCs expect positional arrays.
+    shapes.append(("positional",))
+    return shapes
 
-    last_res: Dict[str, Any] = {}
-    for ck, mk, ak in attempts:
-        params = build_params(ck, mk, ak)
-        res = rpc_call(GENLAYER_RPC_METHOD, params)
-        last_res = res
-        if "error" not in res:
-            return res
-        err = res.get("error", {})
-        msg = (err.get("message") or "").lower()
-        # If error is not about unexpected parameters, stop early.
-        if "unexpected parameter" not in msg:
+
+def call_contract(contract: str, fn: str, args: List[Any], value: Optional[int] = None) -> Dict[str, Any]:
+    _load_shape_cache()
+    cached = _shape_cache.get(_shape_key())
+    if cached is not None:
+        res = rpc_call(GENLAYER_RPC_METHOD, _build_params(cached, contract, fn, args, value))
+        if not _is_schema_error(res):
             return res
+        # The node no longer accepts the stored shape; negotiate again.
+        _save_shape(None)
 
-    # Fallback: try positional params (some RPCs expect arrays)
-    positional_variants: List[List[Any]] = [
-        [contract, fn, args],
-        [contract, fn, args, value] if value is not None else [contract, fn, args],
-    ]
-    for params_list in positional_variants:
-        payload = {"jsonrpc": "2.0", "id": 1, "method": GENLAYER_RPC_METHOD, "params": params_list}
-        headers = {"Content-Type": "application/json"}
-        if GENLAYER_API_KEY:
-            headers["Authorization"] = f"Bearer {GENLAYER_API_KEY}"
-        r = requests.post(GENLAYER_RPC_URL, json=payload, headers=headers, timeout=20)
-        r.raise_for_status()
-        res = r.json()
+    last_res: Dict[str, Any] = {}
+    for shape in _candidate_shapes():
+        if shape == cached:
+            continue
+        res = rpc_call(GENLAYER_RPC_METHOD, _build_params(shape, contract, fn, args, value))
         last_res = res
-        if "error" not in res:
+        if not _is_schema_error(res):
+            # Either success or an error about the call itself: the node
+            # understood this parameter shape.
+            _save_shape(shape)
             return res
 
     return last_res
@@ -0,0 +1,45 @@
+// Long-lived relayer worker used by tools/relay_pool.py.
+//
+// Reads one JSON request per line on stdin:
+//   {"id": 1, "cmd": "create", "args": ["--prediction", "...", ...]}
+// and writes one JSON reply per line on stdout:
+//   {"id": 1, "ok": true, "output": "<same JSON the CLI prints>"}
+//   {"id": 1, "ok": false, "error": "message"}
+// Requests are handled concurrently and replies may arrive out of order.
+import readline from 'node:readline';
+import { runCommand, toJson } from './genlayer_interact.mjs';
+
+const reply = (msg) => {
+  process.stdout.write(`${JSON.stringify(msg)}\n`);
+};
+
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+let inflight = 0;
+let closing = false;
+
+rl.on('line', async (line) => {
+  if (!line.trim()) return;
+  let req;
+  try {
+    req = JSON.parse(line);
+  } catch (err) {
+    reply({ id: null, ok: false, error: 'Malformed request' });
+    return;
+  }
+  inflight += 1;
+  try {
+    const value = await runCommand(req.cmd, req.args || []);
+    reply({ id: req.id, ok: true, output: toJson(value) });
+  } catch (err) {
+    reply({ id: req.id, ok: false, error: err?.message || String(err) });
+  } finally {
+    inflight -= 1;
+    if (closing && inflight === 0) process.exit(0);
+  }
+});
+
+// stdin closing means the pool is shutting down; finish what is in flight.
+rl.on('close', () => {
+  closing = true;
+  if (inflight === 0) process.exit(0);
+});
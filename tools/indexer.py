@@ -0,0 +1,390 @@
+"""Off-chain indexer: mirror the deployed contract into a local SQLite read model.
+
+The contract is followed with cursors instead of full rescans:
+
+* new wagers are discovered with ``list_wagers`` from the
+  stored cursor, and only when ``get_last_wager_id`` has changed;
+* changed wagers are found through the contract's change log
+  (``get_changes_since_json`` from the stored cursor), so a quiet contract
+  costs one call per pass; contracts without the log fall back to
+  re-checking unresolved wagers with one batched ``get_statuses_json`` call
+  per page. Either way only changed wagers are fetched again;
+* player stats are refreshed for the participants of new or changed wagers,
+  every member of a pool included (plus players found through
+  ``list_players``).
+
+``server.py`` serves the read model on ``/api/wagers``, ``/api/players`` and
+``/api/leaderboard`` when ``INDEXER_DB`` points at the database. Run with::
+
+    python tools/indexer.py --db data/index.sqlite3 --interval 5
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# reader(view_name, args) -> decoded view result
+Reader = Callable[[str, List[Any]], Any]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wagers (
+    id TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    category TEXT NOT NULL,
+    player_a TEXT NOT NULL,
+    player_b TEXT NOT NULL,
+    status_json TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS wagers_seq ON wagers (seq);
+CREATE INDEX IF NOT EXISTS wagers_status ON wagers (status, seq);
+CREATE INDEX IF NOT EXISTS wagers_category ON wagers (category, seq);
+CREATE INDEX IF NOT EXISTS wagers_player_a ON wagers (player_a, seq);
+CREATE INDEX IF NOT EXISTS wagers_player_b ON wagers (player_b, seq);
+CREATE TABLE IF NOT EXISTS players (
+    address TEXT PRIMARY KEY,
+    seq INTEGER,
+    username TEXT NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    volume_won INTEGER NOT NULL,
+    volume_contributed INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_rank ON players (wins DESC, volume_won DESC, volume_contributed DESC, address);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+_LEADERBOARD_FIELDS = ("address", "username", "wins", "losses", "volume_won", "volume_contributed")
+
+
+def _status_key(status: Dict[str, Any]) -> str:
+    return json.dumps(status, sort_keys=True)
+
+
+class IndexStore:
+    """SQLite read model shared by the indexer (writer) and the API (readers)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def data_version(self) -> int:
+        """Changes whenever another connection commits (used for cache keys)."""
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    # -- meta --
+    def get_meta(self, key: str, default: str = "") -> str:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, str(value)))
+            self._conn.commit()
+
+    # -- writes --
+    def upsert_wagers(self, rows: Iterable[tuple]) -> None:
+        """Store ``(seq, record, status)`` rows; ``seq`` of an existing wager is kept."""
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO wagers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(id) DO UPDATE SET status = excluded.status, category = excluded.category,"
+                " player_a = excluded.player_a, player_b = excluded.player_b,"
+                " status_json = excluded.status_json, data = excluded.data, updated_at = excluded.updated_at",
+                [
+                    (w["id"], seq, w["status"], w.get("category") or "", w["player_a"].lower(),
+                     w["player_b"].lower(), _status_key(status), json.dumps(w), now)
+                    for seq, w, status in rows
+                ],
+            )
+            self._conn.commit()
+
+    def upsert_players(self, stats: Dict[str, Dict[str, Any]], seqs: Optional[Dict[str, int]] = None) -> None:
+        now = time.time()
+        seqs = seqs or {}
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(address) DO UPDATE SET seq = COALESCE(players.seq, excluded.seq),"
+                " username = excluded.username, wins = excluded.wins, losses = excluded.losses,"
+                " volume_won = excluded.volume_won, volume_contributed = excluded.volume_contributed,"
+                " data = excluded.data, updated_at = excluded.updated_at",
+                [
+                    (addr, seqs.get(addr), s.get("username", ""), s["wins"], s["losses"], s["volume_won"],
+                     s["volume_contributed"], json.dumps(s), now)
+                    for addr, s in stats.items()
+                ],
+            )
+            self._conn.commit()
+
+    # -- reads --
+    def known_wagers(self, ids: List[str]) -> set:
+        """The subset of ``ids`` already in the read model."""
+        known = set()
+        with self._lock:
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT id FROM wagers WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                known.update(r["id"] for r in rows)
+        return known
+
+    def open_wagers(self) -> Dict[str, str]:
+        """``{wager_id: status_json}`` for every wager that is not resolved."""
+        with self._lock:
+            rows = self._conn.execute("SELECT id, status_json FROM wagers WHERE status != 'resolved'").fetchall()
+        return {r["id"]: r["status_json"] for r in rows}
+
+    def list_wagers(self, status: Optional[str] = None, player: Optional[str] = None,
+                    category: Optional[str] = None, offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if player:
+            clauses.append("(player_a = ? OR player_b = ?)")
+            params.extend([player.lower(), player.lower()])
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM wagers{where} ORDER BY seq LIMIT ? OFFSET ?", (*params, limit, offset)
+            ).fetchall()
+        return [json.loads(r["data"]) for r in rows]
+
+    def list_players(self, offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT address, data FROM players ORDER BY seq, address LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+        return [{"address": r["address"], **json.loads(r["data"])} for r in rows]
+
+    def leaderboard(self, offset: int = 0, limit: int = 10) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(_LEADERBOARD_FIELDS)} FROM players"
+                " ORDER BY wins DESC, volume_won DESC, volume_contributed DESC, address LIMIT ? OFFSET ?",
+                (limit, offset),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+
+class Indexer:
+    """Incrementally copy contract state into an IndexStore."""
+
+    def __init__(self, read: Reader, store: IndexStore, batch_size: int = 50):
+        self.read = read
+        self.store = store
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._has_change_log: Optional[bool] = None
+
+    def _view(self, name: str, *args: Any) -> Any:
+        value = self.read(name, list(args))
+        return json.loads(value) if isinstance(value, str) and name.endswith("_json") else value
+
+    def _pages(self, keys: List[str]) -> Iterable[List[str]]:
+        for i in range(0, len(keys), self.batch_size):
+            yield keys[i:i + self.batch_size]
+
+    def _store_wagers(self, seqs: Dict[str, int], ids: List[str], touched: set) -> int:
+        count = 0
+        for page in self._pages(ids):
+            records = self._view("get_wagers_json", page)
+            statuses = self._view("get_statuses_json", page)
+            rows = []
+            for wager_id in page:
+                w = records.get(wager_id)
+                if w is None:
+                    continue
+                rows.append((seqs.get(wager_id, 0), w, statuses.get(wager_id) or {}))
+                touched.update(a for a in (w["player_a"], w["player_b"]) if int(a, 16) != 0)
+                if w.get("pool"):
+                    touched.update(self._pool_members(wager_id))
+            self.store.upsert_wagers(rows)
+            count += len(rows)
+        return count
+
+    def _pool_members(self, wager_id: str) -> List[str]:
+        members: List[str] = []
+        while True:
+            page = self._view("list_pool_members_json", wager_id, len(members), self.batch_size)
+            members.extend(m["address"] for m in page)
+            if len(page) < self.batch_size:
+                return members
+
+    def _discover_wagers(self, touched: set) -> int:
+        last = self._view("get_last_wager_id")
+        if not last or last == self.store.get_meta("last_wager_id"):
+            return 0
+        cursor = int(self.store.get_meta("wager_cursor", "0"))
+        found = 0
+        while True:
+            ids = self._view("list_wagers", cursor, self.batch_size)
+            if not ids:
+                break
+            seqs = {wager_id: cursor + i for i, wager_id in enumerate(ids)}
+            found += self._store_wagers(seqs, ids, touched)
+            cursor += len(ids)
+            self.store.set_meta("wager_cursor", cursor)
+            if len(ids) < self.batch_size:
+                break
+        self.store.set_meta("last_wager_id", last)
+        return found
+
+    def _refresh_open_wagers(self, touched: set) -> int:
+        known = self.store.open_wagers()
+        changed = []
+        for page in self._pages(sorted(known)):
+            statuses = self._view("get_statuses_json", page)
+            changed.extend(
+                wager_id for wager_id in page
+                if statuses.get(wager_id) is not None and _status_key(statuses[wager_id]) != known[wager_id]
+            )
+        return self._store_wagers({}, changed, touched) if changed else 0
+
+    def _follow_changes(self, touched: set) -> Optional[int]:
+        """Refetch wagers named in the change log since the stored cursor.
+
+        Returns None when the contract has no change log.
+        """
+        if self._has_change_log is False:
+            return None
+        cursor = self.store.get_meta("change_cursor")
+        try:
+            if not cursor:
+                # First pass: discovery fetches every wager, so start at the
+                # log's current end (read before discovery to miss nothing).
+                self.store.set_meta("change_cursor", self._view("get_changes_since_json", 0, 0)["latest"])
+                self._has_change_log = True
+                return 0
+            cursor = int(cursor)
+            ids: List[str] = []
+            while True:
+                page = self._view("get_changes_since_json", cursor, self.batch_size)
+                ids.extend(c["wager_id"] for c in page["changes"] if c["wager_id"] not in ids)
+                cursor = page["next"]
+                if not page["changes"] or cursor >= page["latest"]:
+                    break
+        except Exception:
+            if self._has_change_log:
+                raise
+            self._has_change_log = False
+            return None
+        self._has_change_log = True
+        # Wagers created since the last pass are left to discovery, which
+        # stores them with their list position as seq.
+        known = self.store.known_wagers(ids)
+        ids = [wager_id for wager_id in ids if wager_id in known]
+        updated = self._store_wagers({}, ids, touched) if ids else 0
+        self.store.set_meta("change_cursor", cursor)
+        return updated
+
+    def _discover_players(self, touched: set) -> Dict[str, int]:
+        cursor = int(self.store.get_meta("player_cursor", "0"))
+        seqs = {}
+        while True:
+            addrs = self._view("list_players", cursor, self.batch_size)
+            if not addrs:
+                break
+            for i, addr in enumerate(addrs):
+                seqs[addr] = cursor + i
+            touched.update(addrs)
+            cursor += len(addrs)
+            self.store.set_meta("player_cursor", cursor)
+            if len(addrs) < self.batch_size:
+                break
+        return seqs
+
+    def sync_once(self) -> Dict[str, int]:
+        """One incremental pass; returns counts of new/updated wagers and refreshed players."""
+        touched: set = set()
+        updated = self._follow_changes(touched)
+        new = self._discover_wagers(touched)
+        if updated is None:
+            updated = self._refresh_open_wagers(touched)
+        seqs = self._discover_players(touched)
+        addrs = sorted(touched)
+        for page in self._pages(addrs):
+            self.store.upsert_players(self._view("get_player_stats_batch_json", page), seqs)
+        return {"new": new, "updated": updated, "players": len(addrs)}
+
+    def run(self, interval: float = 5.0) -> None:
+        while not self._stop.is_set():
+            try:
+                summary = self.sync_once()
+                if any(summary.values()):
+                    print(json.dumps(summary), flush=True)
+            except Exception as e:
+                print(f"indexer: sync failed: {e}", file=sys.stderr, flush=True)
+            self._stop.wait(interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def client_reader(client, contract: str) -> Reader:
+    """Reader over tools.genlayer_client.GenLayerClient.read_contract."""
+    from tools.genlayer_client import CalldataAddress
+
+    def read(name: str, args: List[Any]) -> Any:
+        if name == "get_player_stats_batch_json":
+            args = [[CalldataAddress(a) for a in args[0]]]
+        return client.read_contract(contract, name, args)
+
+    return read
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Mirror the prediction wager contract into SQLite")
+    parser.add_argument("--db", default=os.getenv("INDEXER_DB"), required=not os.getenv("INDEXER_DB"))
+    parser.add_argument("--interval", type=float, default=float(os.getenv("INDEXER_INTERVAL", "5")))
+    parser.add_argument("--batch", type=int, default=50)
+    parser.add_argument("--once", action="store_true", help="run a single sync pass and exit")
+    args = parser.parse_args(argv)
+
+    contract = os.getenv("CONTRACT_ADDRESS")
+    if not contract:
+        raise SystemExit("CONTRACT_ADDRESS not set")
+
+    from tools.genlayer_client import GenLayerClient
+
+    client = GenLayerClient(
+        os.getenv("GENLAYER_RPC_URL", "https://studio.genlayer.com/api"),
+        api_key=os.getenv("GENLAYER_API_KEY"),
+    )
+    indexer = Indexer(client_reader(client, contract), IndexStore(args.db), batch_size=args.batch)
+    if args.once:
+        print(json.dumps(indexer.sync_once()))
+        return
+    try:
+        indexer.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    main()
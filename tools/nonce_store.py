@@ -0,0 +1,109 @@
+"""Nonce stores for relayer signature replay protection.
+
+A nonce is issued per address by ``/relay/nonce`` and must be consumed by
+the signed relay call that follows. ``consume`` is atomic: a nonce can be
+used once, only for the address it was issued to, and only before it
+expires.
+
+``MemoryNonceStore`` serves a single process. ``SQLiteNonceStore`` is
+shared by every worker process pointing at the same file, so a nonce issued
+by one worker can be consumed by another.
+"""
+import collections
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+def _new_nonce() -> str:
+    return os.urandom(8).hex()
+
+
+class MemoryNonceStore:
+    """Latest nonce per address with TTL expiry and an LRU size cap."""
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._items: "collections.OrderedDict[str, tuple]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def issue(self, address: str) -> str:
+        nonce = _new_nonce()
+        now = time.time()
+        key = address.lower()
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = (nonce, now + self.ttl)
+            # Entries are in issue order, so expired ones are at the front.
+            while self._items:
+                oldest = next(iter(self._items.values()))
+                if oldest[1] >= now and len(self._items) <= self.max_entries:
+                    break
+                self._items.popitem(last=False)
+        return nonce
+
+    def consume(self, address: str, nonce: str) -> bool:
+        key = address.lower()
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None or entry[0] != nonce:
+                return False
+            del self._items[key]
+            return entry[1] >= time.time()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SQLiteNonceStore:
+    """Nonces in a SQLite file shared between worker processes."""
+
+    def __init__(self, path: str, ttl: float = 300.0):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nonces ("
+            " address TEXT PRIMARY KEY, nonce TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS nonces_expiry ON nonces (expires_at)")
+        self._conn.commit()
+
+    def issue(self, address: str) -> str:
+        nonce = _new_nonce()
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM nonces WHERE expires_at < ?", (now,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO nonces VALUES (?, ?, ?)", (address.lower(), nonce, now + self.ttl)
+            )
+            self._conn.commit()
+        return nonce
+
+    def consume(self, address: str, nonce: str) -> bool:
+        # A single conditional DELETE is atomic across processes.
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM nonces WHERE address = ? AND nonce = ? AND expires_at >= ?",
+                (address.lower(), nonce, time.time()),
+            )
+            self._conn.commit()
+        return cur.rowcount == 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM nonces").fetchone()[0]
+
+
+def from_env(path: Optional[str] = None):
+    """NONCE_STORE_PATH selects the SQLite store; otherwise nonces stay in memory."""
+    path = path or os.getenv("NONCE_STORE_PATH")
+    ttl = float(os.getenv("NONCE_TTL", "300"))
+    if path:
+        return SQLiteNonceStore(path, ttl=ttl)
+    return MemoryNonceStore(ttl=ttl, max_entries=int(os.getenv("NONCE_MAX_ENTRIES", "10000")))
@@ -0,0 +1,65 @@
+"""Cheap authentication path for relay calls.
+
+Recovering a secp256k1 signer is the most expensive step of a relay call.
+Session tokens avoid repeating it: after one verified signature the relayer
+issues ``<address>.<expires>.<hmac>``, an HMAC-SHA256 over the address and
+expiry with the relayer secret. Later calls present the token instead of a
+new signature and are checked with a constant-time compare.
+
+Set ``RELAYER_SESSION_SECRET`` so tokens are valid on every worker process;
+without it each process uses its own random secret.
+"""
+import hashlib
+import hmac
+import os
+import time
+from typing import Optional, Tuple
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+
+_secret: Optional[bytes] = None
+
+
+def _session_secret() -> bytes:
+    global _secret
+    if _secret is None:
+        configured = os.getenv("RELAYER_SESSION_SECRET")
+        _secret = configured.encode("utf-8") if configured else os.urandom(32)
+    return _secret
+
+
+def _mac(address: str, expires: int) -> str:
+    return hmac.new(_session_secret(), f"{address}|{expires}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def issue_session(address: str, ttl: Optional[int] = None) -> Tuple[str, int]:
+    """Token and expiry (epoch seconds) for an address whose signature was verified."""
+    ttl = ttl if ttl is not None else int(os.getenv("RELAYER_SESSION_TTL", "900"))
+    address = address.lower()
+    expires = int(time.time()) + ttl
+    return f"{address}.{expires}.{_mac(address, expires)}", expires
+
+
+def check_session(token: str, address: str) -> bool:
+    try:
+        token_address, expires_text, mac = token.split(".")
+        expires = int(expires_text)
+    except ValueError:
+        return False
+    if token_address != address.lower() or expires < time.time():
+        return False
+    return hmac.compare_digest(mac, _mac(token_address, expires))
+
+
+def recover_address(message: str, signature: str) -> str:
+    """Signer of an EIP-191 personal message, lowercased."""
+    return Account.recover_message(encode_defunct(text=message), signature=signature).lower()
+
+
+def verify_signature(message: str, signature: str, address: str) -> bool:
+    try:
+        return recover_address(message, signature) == address.lower()
+    except Exception:
+        return False
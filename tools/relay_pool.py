@@ -0,0 +1,249 @@
+"""Warm pool of Node relayer workers.
+
+Each worker is a long-lived ``node tools/genlayer_worker.mjs`` process that
+keeps its genlayer-js client and relayer account between requests. Requests
+and replies are JSON lines over stdin/stdout matched by id, so a single
+worker can have several transactions waiting on receipts at once.
+
+Writes are only ordered within one worker, so workers that share a relayer
+account race for its nonce. Give each worker its own account through
+``envs`` (one environment per worker) or keep the pool at one worker.
+"""
+import asyncio
+import collections
+import itertools
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Dict, List, Optional
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+WORKER_COMMAND = ['node', os.path.join('tools', 'genlayer_worker.mjs')]
+
+
+class _Worker:
+    def __init__(self, command: List[str], env: Optional[Dict[str, str]], cwd: str):
+        self.proc = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+            cwd=cwd,
+        )
+        self.pending: Dict[int, Future] = {}
+        self.stderr_tail: collections.deque = collections.deque(maxlen=20)
+        self._lock = threading.Lock()
+        self._dead = False
+        self._stderr_reader = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_reader.start()
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        return not self._dead and self.proc.poll() is None
+
+    @property
+    def inflight(self) -> int:
+        return len(self.pending)
+
+    def submit(self, req_id: int, cmd: str, args: List[str]) -> Future:
+        fut: Future = Future()
+        line = json.dumps({"id": req_id, "cmd": cmd, "args": args}) + "\n"
+        with self._lock:
+            if not self.alive:
+                raise RuntimeError("Relayer worker is not running")
+            self.pending[req_id] = fut
+            try:
+                self.proc.stdin.write(line)
+                self.proc.stdin.flush()
+            except (BrokenPipeError, OSError, ValueError):
+                self.pending.pop(req_id, None)
+                self._dead = True
+                raise RuntimeError("Relayer worker is not running")
+        return fut
+
+    def close(self) -> None:
+        self._dead = True
+        try:
+            self.proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+
+    def _read_stdout(self) -> None:
+        for line in self.proc.stdout:
+            try:
+                msg = json.loads(line)
+            except ValueError:
+                # genlayer-js or a dependency logged to stdout; not a reply.
+                continue
+            if not isinstance(msg, dict):
+                continue
+            fut = self.pending.pop(msg.get("id"), None)
+            if fut is None:
+                continue
+            if msg.get("ok"):
+                fut.set_result(msg.get("output", ""))
+            else:
+                fut.set_exception(RuntimeError(msg.get("error") or "Relayer failed"))
+        self._dead = True
+        self._stderr_reader.join(timeout=1)
+        detail = "\n".join(self.stderr_tail).strip() or "Relayer worker exited"
+        for req_id in list(self.pending):
+            fut = self.pending.pop(req_id, None)
+            if fut is not None and not fut.done():
+                fut.set_exception(RuntimeError(detail))
+
+    def _read_stderr(self) -> None:
+        for line in self.proc.stderr:
+            self.stderr_tail.append(line.rstrip())
+
+
+class RelayPool:
+    """Dispatch relayer commands to a fixed number of warm Node workers.
+
+    ``max_inflight`` bounds the number of commands outstanding across the
+    whole pool; callers beyond that wait up to ``acquire_timeout`` seconds.
+    Workers that exit are replaced on the next request.
+    """
+
+    def __init__(self, size: int = 1, max_inflight: int = 16, timeout: float = 240.0,
+                 acquire_timeout: float = 30.0, command: Optional[List[str]] = None,
+                 env: Optional[Dict[str, str]] = None, cwd: str = ROOT,
+                 envs: Optional[List[Dict[str, str]]] = None):
+        if envs:
+            size = len(envs)
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.envs = list(envs) if envs else [env] * size
+        self.max_inflight = max_inflight
+        self.timeout = timeout
+        self.acquire_timeout = acquire_timeout
+        self.command = list(command or WORKER_COMMAND)
+        self.env = env
+        self.cwd = cwd
+        self._workers: List[Optional[_Worker]] = [None] * size
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._closed = False
+        self._stats = {
+            "submitted": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "rejected": 0,
+            "restarts": 0,
+            "total_latency": 0.0,
+        }
+
+    def run(self, cmd: str, args: List[str], timeout: Optional[float] = None) -> str:
+        """Run one relayer command and return the JSON text the CLI would print."""
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            self._bump("rejected")
+            raise RuntimeError("Relayer busy, try again")
+        started = time.monotonic()
+        try:
+            fut = self._dispatch(cmd, args)
+            try:
+                out = fut.result(timeout=timeout or self.timeout)
+            except FutureTimeout:
+                self._bump("timeouts")
+                raise RuntimeError("Relayer timed out waiting for the transaction")
+            self._bump("succeeded", time.monotonic() - started)
+            return out.strip()
+        except Exception:
+            self._bump("failed")
+            raise
+
+    async def run_async(self, cmd: str, args: List[str], timeout: Optional[float] = None) -> str:
+        """``run`` for event loops: the slot wait and the reply are awaited off the loop."""
+        loop = asyncio.get_running_loop()
+        acquiring = loop.run_in_executor(None, self._slots.acquire, True, self.acquire_timeout)
+        try:
+            acquired = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # Hand back a slot the executor thread takes after we gave up.
+            acquiring.add_done_callback(lambda f: f.cancelled() or not f.result() or self._slots.release())
+            raise
+        if not acquired:
+            self._bump("rejected")
+            raise RuntimeError("Relayer busy, try again")
+        started = time.monotonic()
+        try:
+            fut = self._dispatch(cmd, args)
+            try:
+                out = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(fut)), timeout or self.timeout)
+            except asyncio.TimeoutError:
+                self._bump("timeouts")
+                raise RuntimeError("Relayer timed out waiting for the transaction")
+            self._bump("succeeded", time.monotonic() - started)
+            return out.strip()
+        except Exception:
+            self._bump("failed")
+            raise
+
+    def _dispatch(self, cmd: str, args: List[str]) -> Future:
+        """Send a command under an acquired slot. The slot is released when
+        the worker replies or exits, not when the caller stops waiting, so
+        timed-out commands still count against ``max_inflight``."""
+        try:
+            worker = self._pick_worker()
+            self._bump("submitted")
+            fut = worker.submit(next(self._ids), cmd, [str(a) for a in args])
+        except BaseException:
+            self._slots.release()
+            raise
+        fut.add_done_callback(lambda _f: self._slots.release())
+        return fut
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            workers = [w for w in self._workers if w is not None]
+            stats = dict(self._stats)
+        total_latency = stats.pop("total_latency")
+        stats.update({
+            "size": self.size,
+            "alive": sum(1 for w in workers if w.alive),
+            "inflight": sum(w.inflight for w in workers),
+            "max_inflight": self.max_inflight,
+            "avg_latency_ms": round(1000 * total_latency / stats["succeeded"], 1) if stats["succeeded"] else 0.0,
+        })
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = [w for w in self._workers if w is not None]
+            self._workers = [None] * self.size
+        for w in workers:
+            w.close()
+
+    def _pick_worker(self) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Relayer pool is closed")
+            for i, w in enumerate(self._workers):
+                if w is not None and not w.alive:
+                    w.close()
+                    self._stats["restarts"] += 1
+                    w = None
+                if w is None:
+                    self._workers[i] = _Worker(self.command, self.envs[i], self.cwd)
+            return min(self._workers, key=lambda w: w.inflight)
+
+    def _bump(self, key: str, latency: float = 0.0) -> None:
+        with self._lock:
+            self._stats[key] += 1
+            self._stats["total_latency"] += latency
@@ -0,0 +1,335 @@
+"""Resolution sweeper: move expired wagers forward without manual calls.
+
+Each pass lists wagers in ``active`` or ``verified`` status, from the local
+read model (``tools/indexer.py``) when ``--db`` is given or straight from the
+contract's status index otherwise. Every wager past its deadline gets the
+next step of the settlement flow:
+
+* ``active`` -> ``submit_verification``
+* ``verified``, not final -> ``submit_appeal`` (the appeal round finalizes),
+  only with ``--appeal-after``
+* ``verified``, final -> ``resolve_wager``
+
+Automatic appeals are opt-in: the appeal round finalizes the wager, so players
+get ``--appeal-after`` seconds to file their own appeal first, counted from
+the first pass that saw the wager verified. Without the flag, verified wagers
+wait for a player's appeal.
+
+Steps are ordered by deadline (oldest first), then by pot (largest first),
+and submitted from a bounded thread pool behind a token-bucket rate limit.
+``--dry-run`` prints the plan without submitting anything.
+
+Submissions are recorded in a small SQLite log (``--state``). A step that
+was submitted within ``retry_after`` seconds is not submitted again, so a
+restarted sweeper does not duplicate transactions that are still pending;
+failed submissions are released and retried on the next pass. Run with::
+
+    python tools/sweeper.py --db data/index.sqlite3 --state data/sweeper.sqlite3
+"""
+import argparse
+import concurrent.futures
+import datetime
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# reader(view_name, args) -> decoded view result (see tools/indexer.py)
+Reader = Callable[[str, List[Any]], Any]
+# submit(action, wager_id) -> tx hash
+Submitter = Callable[[str, str], Optional[str]]
+
+SWEEP_STATUSES = ("active", "verified")
+APPEAL_REASON = "Automatic finalization after the deadline"
+
+
+def _deadline_ts(deadline: str) -> Optional[float]:
+    try:
+        dt = datetime.datetime.fromisoformat(deadline.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=datetime.timezone.utc)
+    return dt.timestamp()
+
+
+def next_action(wager: Dict[str, Any]) -> Optional[str]:
+    """The settlement step a wager is waiting for, if any."""
+    if wager.get("status") == "active":
+        return "verify"
+    if wager.get("status") == "verified":
+        result = wager.get("verification_result") or {}
+        return "resolve" if result.get("is_final") else "appeal"
+    return None
+
+
+class RateLimiter:
+    """Token bucket: at most ``rate`` acquisitions per second, bursts of ``burst``."""
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SweepLog:
+    """Submitted steps, keyed by (wager, action), shared across restarts."""
+
+    def __init__(self, path: str = ":memory:"):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sweeps ("
+            " wager_id TEXT NOT NULL, action TEXT NOT NULL, hash TEXT,"
+            " submitted_at REAL NOT NULL, PRIMARY KEY (wager_id, action))"
+        )
+        self._conn.commit()
+
+    def claim(self, wager_id: str, action: str, retry_after: float) -> bool:
+        """Reserve a step unless it was submitted within ``retry_after`` seconds."""
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO sweeps VALUES (?, ?, NULL, ?)"
+                " ON CONFLICT(wager_id, action) DO UPDATE SET hash = NULL, submitted_at = excluded.submitted_at"
+                " WHERE sweeps.submitted_at < ?",
+                (wager_id, action, now, now - retry_after),
+            )
+            self._conn.commit()
+        return cur.rowcount == 1
+
+    def record(self, wager_id: str, action: str, tx_hash: Optional[str]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sweeps SET hash = ? WHERE wager_id = ? AND action = ?", (tx_hash, wager_id, action)
+            )
+            self._conn.commit()
+
+    def release(self, wager_id: str, action: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sweeps WHERE wager_id = ? AND action = ?", (wager_id, action))
+            self._conn.commit()
+
+    def seen(self, wager_id: str, state: str, now: float, record: bool = True) -> float:
+        """When ``wager_id`` was first seen in ``state``; the first call records ``now``."""
+        key = f"seen:{state}"
+        with self._lock:
+            if record:
+                self._conn.execute("INSERT OR IGNORE INTO sweeps VALUES (?, ?, NULL, ?)", (wager_id, key, now))
+                self._conn.commit()
+            row = self._conn.execute(
+                "SELECT submitted_at FROM sweeps WHERE wager_id = ? AND action = ?", (wager_id, key)
+            ).fetchone()
+        return row[0] if row else now
+
+    def get(self, wager_id: str, action: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT hash, submitted_at FROM sweeps WHERE wager_id = ? AND action = ?", (wager_id, action)
+            ).fetchone()
+        return {"hash": row[0], "submitted_at": row[1]} if row else None
+
+
+class Sweeper:
+    """Find expired wagers and submit their next settlement step."""
+
+    def __init__(self, submit: Submitter, read: Optional[Reader] = None, store=None,
+                 log: Optional[SweepLog] = None, workers: int = 4, rate: float = 2.0,
+                 max_per_pass: int = 100, retry_after: float = 600.0, batch_size: int = 50,
+                 appeal_after: Optional[float] = None, dry_run: bool = False,
+                 clock: Callable[[], float] = time.time):
+        if read is None and store is None:
+            raise RuntimeError("Sweeper needs a contract reader or an index store")
+        self.submit = submit
+        self.read = read
+        self.store = store
+        self.log = log or SweepLog()
+        self.workers = workers
+        self.limiter = RateLimiter(rate, burst=workers)
+        self.max_per_pass = max_per_pass
+        self.retry_after = retry_after
+        self.batch_size = batch_size
+        self.appeal_after = appeal_after
+        self.dry_run = dry_run
+        self.clock = clock
+        self._stop = threading.Event()
+
+    def _pages(self, status: str) -> Iterable[List[Dict[str, Any]]]:
+        offset = 0
+        while True:
+            if self.store is not None:
+                page = self.store.list_wagers(status=status, offset=offset, limit=self.batch_size)
+            else:
+                page = self.read("list_wagers_by_status_json", [status, offset, self.batch_size])
+                page = json.loads(page) if isinstance(page, str) else page
+            if not page:
+                return
+            yield page
+            if len(page) < self.batch_size:
+                return
+            offset += len(page)
+
+    def plan(self) -> List[Dict[str, Any]]:
+        """Due steps in priority order: oldest deadline first, then largest pot."""
+        now = self.clock()
+        steps = {}
+        for status in SWEEP_STATUSES:
+            for page in self._pages(status):
+                for w in page:
+                    deadline = _deadline_ts(w.get("deadline", ""))
+                    action = next_action(w)
+                    if deadline is None or deadline > now or action is None:
+                        continue
+                    if action == "appeal" and not self._appeal_due(w["id"], now):
+                        continue
+                    steps[w["id"]] = {
+                        "wager_id": w["id"],
+                        "action": action,
+                        "deadline": w["deadline"],
+                        "pot": int(w.get("pot", 0)),
+                        "_due": deadline,
+                    }
+        ordered = sorted(steps.values(), key=lambda s: (s["_due"], -s["pot"], s["wager_id"]))
+        for step in ordered:
+            del step["_due"]
+        return ordered
+
+    def _appeal_due(self, wager_id: str, now: float) -> bool:
+        if self.appeal_after is None:
+            return False
+        since = self.log.seen(wager_id, "verified", now, record=not self.dry_run)
+        return now - since >= self.appeal_after
+
+    def _run_step(self, step: Dict[str, Any]) -> Dict[str, Any]:
+        self.limiter.acquire()
+        try:
+            tx_hash = self.submit(step["action"], step["wager_id"])
+        except Exception as e:
+            self.log.release(step["wager_id"], step["action"])
+            return {**step, "error": str(e)}
+        self.log.record(step["wager_id"], step["action"], tx_hash)
+        return {**step, "hash": tx_hash}
+
+    def sweep_once(self) -> List[Dict[str, Any]]:
+        """One pass; returns the submitted (or, in dry-run, planned) steps."""
+        due = []
+        for step in self.plan():
+            if len(due) >= self.max_per_pass:
+                break
+            if self.dry_run:
+                pending = self.log.get(step["wager_id"], step["action"])
+                if pending is None or pending["submitted_at"] < time.time() - self.retry_after:
+                    due.append(step)
+            elif self.log.claim(step["wager_id"], step["action"], self.retry_after):
+                due.append(step)
+        if self.dry_run or not due:
+            return due
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(self._run_step, due))
+
+    def run(self, interval: float = 30.0) -> None:
+        while not self._stop.is_set():
+            try:
+                for result in self.sweep_once():
+                    print(json.dumps(result), flush=True)
+            except Exception as e:
+                print(f"sweeper: pass failed: {e}", file=sys.stderr, flush=True)
+            self._stop.wait(interval)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def client_submitter(client, contract: str, wait: bool = False) -> Submitter:
+    """Submitter over tools.genlayer_client.run_command (relayer account)."""
+    from tools.genlayer_client import run_command
+
+    def submit(action: str, wager_id: str) -> Optional[str]:
+        args = ["--wager", wager_id]
+        if action == "appeal":
+            args += ["--reason", APPEAL_REASON]
+        if not wait:
+            args.append("--no-wait")
+        return run_command(client, contract, action, args)["hash"]
+
+    return submit
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Settle prediction wagers whose deadline has passed")
+    parser.add_argument("--db", default=os.getenv("INDEXER_DB"), help="indexer read model (optional)")
+    parser.add_argument("--state", default=os.getenv("SWEEPER_STATE", "sweeper.sqlite3"))
+    parser.add_argument("--interval", type=float, default=float(os.getenv("SWEEPER_INTERVAL", "30")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("SWEEPER_WORKERS", "4")))
+    parser.add_argument("--rate", type=float, default=float(os.getenv("SWEEPER_RATE", "2")),
+                        help="max submissions per second (0 = unlimited)")
+    parser.add_argument("--max-per-pass", type=int, default=100)
+    parser.add_argument("--retry-after", type=float, default=600.0,
+                        help="seconds before a submitted step may be submitted again")
+    parser.add_argument("--appeal-after", type=float, default=None,
+                        help="file an automatic appeal this many seconds after a wager is seen verified"
+                             " (default: never; leave appeals to the players)")
+    parser.add_argument("--wait", action="store_true", help="wait for each receipt before the worker moves on")
+    parser.add_argument("--dry-run", action="store_true", help="print due steps without submitting")
+    parser.add_argument("--once", action="store_true", help="run a single pass and exit")
+    args = parser.parse_args(argv)
+
+    contract = os.getenv("CONTRACT_ADDRESS")
+    if not contract:
+        raise SystemExit("CONTRACT_ADDRESS not set")
+
+    from tools.genlayer_client import GenLayerClient
+    from tools.indexer import IndexStore, client_reader
+
+    client = GenLayerClient(
+        os.getenv("GENLAYER_RPC_URL", "https://studio.genlayer.com/api"),
+        private_key=os.getenv("RELAYER_PRIVATE_KEY"),
+        api_key=os.getenv("GENLAYER_API_KEY"),
+    )
+    if not args.dry_run and not os.getenv("RELAYER_PRIVATE_KEY"):
+        raise SystemExit("RELAYER_PRIVATE_KEY not set")
+    sweeper = Sweeper(
+        client_submitter(client, contract, wait=args.wait),
+        read=client_reader(client, contract),
+        store=IndexStore(args.db) if args.db else None,
+        log=SweepLog(args.state),
+        workers=args.workers,
+        rate=args.rate,
+        max_per_pass=args.max_per_pass,
+        retry_after=args.retry_after,
+        appeal_after=args.appeal_after,
+        dry_run=args.dry_run,
+    )
+    if args.once:
+        for result in sweeper.sweep_once():
+            print(json.dumps(result))
+        return
+    try:
+        sweeper.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+    main()
@@ -0,0 +1,161 @@
+"""Background tracker for relayed transactions.
+
+Relay handlers in submit-then-track mode return as soon as the relayer has a
+transaction hash. The hash is registered here and one background thread polls
+statuses for every pending hash in batches, instead of each HTTP request
+waiting on its own receipt.
+
+Records live in one process. A server process asked about a hash that
+another process submitted fetches its status once and ``adopt``s it, so
+status reads work with any number of web workers.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Statuses after which a transaction will not change from the relayer's point
+# of view (ACCEPTED is what the blocking relay path waited for).
+TERMINAL_STATUSES = {
+    "ACCEPTED",
+    "FINALIZED",
+    "UNDETERMINED",
+    "CANCELED",
+    "LEADER_TIMEOUT",
+    "VALIDATORS_TIMEOUT",
+}
+
+
+class TxTracker:
+    """Track submitted transaction hashes until they reach a terminal status.
+
+    ``fetch_statuses`` receives a list of hashes and returns a dict mapping
+    each hash to ``{"status": ..., "transaction": ...}`` or ``{"error": ...}``.
+    Hashes still pending after ``max_wait`` seconds are marked ``TIMEOUT``;
+    finished records are dropped ``retention`` seconds after they finish.
+    """
+
+    def __init__(self, fetch_statuses: Callable[[List[str]], Dict[str, Any]],
+                 interval: float = 4.0, batch_size: int = 50,
+                 max_wait: float = 200.0, retention: float = 3600.0):
+        self.fetch_statuses = fetch_statuses
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.retention = retention
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def track(self, tx_hash: str, action: str, **meta) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            record = self._records.get(tx_hash)
+            if record is None:
+                record = {
+                    "hash": tx_hash,
+                    "action": action,
+                    "status": "PENDING",
+                    "done": False,
+                    "submitted_at": now,
+                    "updated_at": now,
+                    "version": 0,
+                    "transaction": None,
+                    "error": None,
+                    **meta,
+                }
+                self._records[tx_hash] = record
+            snapshot = dict(record)
+        self._ensure_started()
+        return snapshot
+
+    def adopt(self, tx_hash: str, update: Dict[str, Any], action: str = "", **meta) -> Dict[str, Any]:
+        """Track a hash submitted elsewhere, starting from a fetched ``update``."""
+        self.track(tx_hash, action, **meta)
+        with self._lock:
+            record = self._records[tx_hash]
+            if record["version"] == 0 and not record["done"]:
+                self._apply(record, update, None, time.time())
+            return dict(record)
+
+    def get(self, tx_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(tx_hash)
+            return dict(record) if record is not None else None
+
+    def pending(self) -> List[str]:
+        with self._lock:
+            items = [r for r in self._records.values() if not r["done"]]
+        items.sort(key=lambda r: r["updated_at"])
+        return [r["hash"] for r in items]
+
+    def poll_once(self) -> int:
+        """Poll one batch of pending hashes; returns how many were queried."""
+        batch = self.pending()[: self.batch_size]
+        now = time.time()
+        if batch:
+            try:
+                statuses = self.fetch_statuses(batch) or {}
+                failure = None
+            except Exception as e:
+                statuses = {}
+                failure = str(e)
+            with self._lock:
+                for tx_hash in batch:
+                    record = self._records.get(tx_hash)
+                    if record is None or record["done"]:
+                        continue
+                    self._apply(record, statuses.get(tx_hash), failure, now)
+        self._evict(now)
+        return len(batch)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _apply(self, record: Dict[str, Any], update: Optional[Dict[str, Any]],
+               failure: Optional[str], now: float) -> None:
+        changed = False
+        if update and update.get("status"):
+            status = str(update["status"]).upper()
+            if status != record["status"]:
+                record["status"] = status
+                record["transaction"] = update.get("transaction")
+                changed = True
+            record["error"] = None
+            if status in TERMINAL_STATUSES:
+                record["done"] = True
+                changed = True
+        else:
+            error = failure or (update or {}).get("error")
+            if error and error != record["error"]:
+                record["error"] = error
+                changed = True
+        if not record["done"] and now - record["submitted_at"] > self.max_wait:
+            record["status"] = "TIMEOUT"
+            record["done"] = True
+            changed = True
+        record["updated_at"] = now
+        if changed:
+            record["version"] += 1
+
+    def _evict(self, now: float) -> None:
+        with self._lock:
+            stale = [
+                h for h, r in self._records.items()
+                if r["done"] and now - r["updated_at"] > self.retention
+            ]
+            for h in stale:
+                del self._records[h]
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll_once()